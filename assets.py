@@ -0,0 +1,143 @@
+import os
+import json
+import mmap
+import hashlib
+import threading
+import numpy as np
+import pygame
+from typing import Any, Dict, Optional
+
+CACHE_DIR = os.environ.get('GAMESTUDIO_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'amazonq_gamestudio'))
+MANIFEST = 'manifest.json'
+LAYOUT = 1  # Bump when the blob layout below changes
+
+class AssetCache:
+    """Precomputed surfaces and sample arrays kept on disk between launches
+
+    Each entry is keyed by a hash of the parameters that generated it, the
+    window size and the pygame version, so any change simply misses. Pixels
+    are stored as raw RGBA rows and mapped straight into a surface with
+    pygame.image.frombuffer; arrays are .npy files opened with mmap_mode.
+    One manifest lists every entry with its size and any metadata the
+    generator needs back (glyph advances, say). A miss is rendered by the
+    caller as before and written out on a background thread.
+    """
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.lock = threading.Lock()
+        self.entries: Dict[str, dict] = self._read_manifest()
+        self.writers = []
+    
+    def _read_manifest(self) -> Dict[str, dict]:
+        try:
+            with open(os.path.join(self.cache_dir, MANIFEST)) as manifest:
+                entries = json.load(manifest)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def key(self, *params) -> str:
+        """Hash of the generator parameters, the window size and the pygame version"""
+        screen = pygame.display.get_surface()
+        resolution = screen.get_size() if screen is not None else None
+        return hashlib.sha1(repr((LAYOUT, pygame.version.ver, resolution) + params).encode()).hexdigest()[:24]
+    
+    def meta(self, key: str) -> Optional[Any]:
+        entry = self.entries.get(key)
+        return entry.get('meta') if entry else None
+    
+    def load_surface(self, key: str) -> Optional[pygame.Surface]:
+        """The cached RGBA surface, mapped rather than read, or None on a miss"""
+        entry = self.entries.get(key)
+        if not entry or entry.get('kind') != 'rgba':
+            return None
+        width, height = entry['size']
+        try:
+            with open(os.path.join(self.cache_dir, entry['file']), 'rb') as blob:
+                # Private mapping: pages are shared until the surface is drawn on
+                pixels = mmap.mmap(blob.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None
+        if len(pixels) != width * height * 4:
+            return None
+        return pygame.image.frombuffer(pixels, (width, height), 'RGBA')
+    
+    def load_array(self, key: str) -> Optional[np.ndarray]:
+        entry = self.entries.get(key)
+        if not entry or entry.get('kind') != 'npy':
+            return None
+        try:
+            return np.load(os.path.join(self.cache_dir, entry['file']), mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+    
+    def store_surface(self, key: str, surface: pygame.Surface, meta: Any = None):
+        # Snapshot now; the caller is free to convert or draw on the surface afterwards
+        pixels = pygame.image.tobytes(surface, 'RGBA')
+        entry = {'kind': 'rgba', 'file': f"{key}.rgba", 'size': list(surface.get_size()), 'meta': meta}
+        self._write(key, entry, lambda out: out.write(pixels))
+    
+    def store_array(self, key: str, array: np.ndarray, meta: Any = None):
+        array = np.array(array)
+        entry = {'kind': 'npy', 'file': f"{key}.npy", 'meta': meta}
+        self._write(key, entry, lambda out: np.save(out, array))
+    
+    def _write(self, key: str, entry: dict, write):
+        self.entries[key] = entry
+        writer = threading.Thread(target=self._persist, args=(key, entry, write), name='asset-cache')
+        writer.start()
+        # Only pending writes need joining; finished threads would just pile up over a long session
+        self.writers = [pending for pending in self.writers if pending.is_alive()]
+        self.writers.append(writer)
+    
+    def _persist(self, key: str, entry: dict, write):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = os.path.join(self.cache_dir, entry['file'])
+            partial = f"{path}.{os.getpid()}.{threading.get_ident()}"
+            with open(partial, 'wb') as out:
+                write(out)
+            os.replace(partial, path)
+            
+            # Merge with what other launches wrote since we read the manifest
+            with self.lock:
+                entries = self._read_manifest()
+                entries[key] = entry
+                manifest = os.path.join(self.cache_dir, MANIFEST)
+                partial = f"{manifest}.{os.getpid()}"
+                with open(partial, 'w') as out:
+                    json.dump(entries, out)
+                os.replace(partial, manifest)
+        except OSError:
+            pass  # A read-only cache only costs the rebuild on the next launch
+    
+    def wait(self):
+        """Block until every pending write has landed"""
+        for writer in self.writers:
+            writer.join()
+        self.writers.clear()
+
+def surface_bytes(*held) -> int:
+    """Pixel memory of surfaces, sprite sheets and dicts or lists of them"""
+    total = 0
+    for item in held:
+        if isinstance(item, pygame.Surface):
+            total += item.get_pitch() * item.get_height()
+        elif isinstance(item, dict):
+            total += surface_bytes(*item.values())
+        elif isinstance(item, (list, tuple)):
+            total += surface_bytes(*item)
+        elif hasattr(item, 'surface'):
+            total += surface_bytes(item.surface)
+    return total
+
+_caches: Dict[str, AssetCache] = {}
+
+def asset_cache(cache_dir: Optional[str] = CACHE_DIR) -> Optional[AssetCache]:
+    """The shared cache for a directory, or None when caching is off"""
+    if not cache_dir:
+        return None
+    cache = _caches.get(cache_dir)
+    if cache is None:
+        cache = _caches[cache_dir] = AssetCache(cache_dir)
+    return cache
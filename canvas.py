@@ -0,0 +1,81 @@
+import math
+import pygame
+from typing import Optional, Sequence
+
+class Canvas:
+    """Draw target for backdrop layers, optionally rendered below window resolution
+
+    Callers draw in window coordinates. At a render scale below 1 the calls
+    land on a smaller internal surface, and present() stretches it over the
+    window; sprites, HUD and text are drawn on the screen afterwards, so they
+    stay sharp. At scale 1 every call goes straight to the screen.
+    """
+    def __init__(self, screen: pygame.Surface, scale: float = 1.0):
+        self.screen = screen
+        self.scale = None
+        self.set_scale(scale)
+    
+    def set_scale(self, scale: float):
+        """Cheap to call every frame; the internal surface is only rebuilt on a change"""
+        if scale == self.scale:
+            return
+        self.scale = scale
+        if scale == 1:
+            self.surface = self.screen
+        else:
+            width, height = self.screen.get_size()
+            self.surface = pygame.Surface((max(1, round(width * scale)), max(1, round(height * scale))), 0, self.screen)
+        # Window pixels per internal pixel, for callers choosing how finely to step gradients
+        self.pixel = math.ceil(1 / scale)
+    
+    def _rect(self, rect):
+        # Grow outward so thin bands never collapse to nothing
+        x, y, width, height = rect
+        scale = self.scale
+        left, top = math.floor(x * scale), math.floor(y * scale)
+        return (left, top, math.ceil((x + width) * scale) - left, math.ceil((y + height) * scale) - top)
+    
+    def _point(self, point):
+        return (point[0] * self.scale, point[1] * self.scale)
+    
+    def _size(self, size):
+        return max(1, round(size * self.scale)) if size else 0
+    
+    def fill(self, color, rect=None):
+        if rect is not None and self.scale != 1:
+            rect = self._rect(rect)
+        self.surface.fill(color, rect)
+    
+    def rect(self, color, rect, width: int = 0, border_radius: int = 0):
+        if self.scale != 1:
+            rect, width, border_radius = self._rect(rect), self._size(width), self._size(border_radius)
+        pygame.draw.rect(self.surface, color, rect, width, border_radius=border_radius)
+    
+    def circle(self, color, center, radius, width: int = 0):
+        if self.scale != 1:
+            center, radius, width = self._point(center), self._size(radius), self._size(width)
+        pygame.draw.circle(self.surface, color, center, radius, width)
+    
+    def line(self, color, start, end, width: int = 1):
+        if self.scale != 1:
+            start, end, width = self._point(start), self._point(end), self._size(width)
+        pygame.draw.line(self.surface, color, start, end, width)
+    
+    def polygon(self, color, points: Sequence, width: int = 0):
+        if self.scale != 1:
+            points, width = [self._point(point) for point in points], self._size(width)
+        pygame.draw.polygon(self.surface, color, points, width)
+    
+    def blit(self, source: pygame.Surface, position, area: Optional[pygame.Rect] = None):
+        if self.scale != 1:
+            if area is not None:
+                source = source.subsurface(area)
+            width, height = source.get_size()
+            source = pygame.transform.scale(source, (self._size(width), self._size(height)))
+            position, area = self._point(position), None
+        self.surface.blit(source, position, area)
+    
+    def present(self):
+        """Stretch the internal surface over the window; nothing to do at scale 1"""
+        if self.surface is not self.screen:
+            pygame.transform.scale(self.surface, self.screen.get_size(), self.screen)
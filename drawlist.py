@@ -0,0 +1,135 @@
+import pygame
+from operator import itemgetter
+from typing import Optional, Sequence
+
+# Command kinds; shapes store their pygame.draw function instead
+BLIT = 'blit'
+BLITS = 'blits'
+FILL = 'fill'
+
+class DrawStats:
+    """Counts for the last flushed frame"""
+    def __init__(self):
+        self.recorded = 0
+        self.culled = 0
+        self.calls = 0
+    
+    def __repr__(self):
+        return f"DrawStats(recorded={self.recorded}, culled={self.culled}, calls={self.calls})"
+
+class DrawList:
+    """Draw commands recorded during a frame and replayed onto the screen in one pass
+
+    Entity draw methods record into the list as if it were the screen:
+    blit() and blits() match Surface, the shapes match Canvas. Each command
+    keeps the layer that was current when it was recorded. flush() replays
+    layer by layer, in recording order within a layer so overdraw never
+    changes, skips commands that land entirely off-screen and hands every run
+    of consecutive blits to a single Surface.blits() call.
+    """
+    def __init__(self, screen: pygame.Surface):
+        self.screen = screen
+        self.width, self.height = screen.get_size()
+        self.layer = 0
+        self.commands = []
+        self.culled = 0
+        self.stats = DrawStats()
+    
+    def get_size(self):
+        return self.width, self.height
+    
+    def _visible(self, left, top, right, bottom) -> bool:
+        if right <= 0 or bottom <= 0 or left >= self.width or top >= self.height:
+            self.culled += 1
+            return False
+        return True
+    
+    # Surface-compatible recording
+    
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags: int = 0):
+        x, y = dest[0], dest[1]
+        if area is None:
+            width, height = source.get_size()
+        else:
+            width, height = area[2], area[3]
+        if self._visible(x, y, x + width, y + height):
+            self.commands.append((self.layer, BLIT, (source, (x, y), area, special_flags)))
+    
+    def blits(self, sequence, doreturn=False):
+        """Record a prepared batch as is; callers like ParticleEngine cull it themselves"""
+        if not isinstance(sequence, list):
+            sequence = list(sequence)
+        if sequence:
+            self.commands.append((self.layer, BLITS, sequence))
+    
+    def fill(self, color, rect=None):
+        if rect is None or self._visible(rect[0], rect[1], rect[0] + rect[2], rect[1] + rect[3]):
+            self.commands.append((self.layer, FILL, (color, rect)))
+    
+    # Canvas-compatible shapes
+    
+    def rect(self, color, rect, width: int = 0, border_radius: int = 0):
+        x, y, w, h = rect
+        if self._visible(x, y, x + w, y + h):
+            self.commands.append((self.layer, pygame.draw.rect, (color, rect, width, border_radius)))
+    
+    def ellipse(self, color, rect, width: int = 0):
+        x, y, w, h = rect
+        if self._visible(x, y, x + w, y + h):
+            self.commands.append((self.layer, pygame.draw.ellipse, (color, rect, width)))
+    
+    def circle(self, color, center, radius, width: int = 0):
+        x, y = center
+        if self._visible(x - radius, y - radius, x + radius + 1, y + radius + 1):
+            self.commands.append((self.layer, pygame.draw.circle, (color, center, radius, width)))
+    
+    def line(self, color, start, end, width: int = 1):
+        pad = width // 2 + 1
+        if self._visible(min(start[0], end[0]) - pad, min(start[1], end[1]) - pad,
+                         max(start[0], end[0]) + pad, max(start[1], end[1]) + pad):
+            self.commands.append((self.layer, pygame.draw.line, (color, start, end, width)))
+    
+    def polygon(self, color, points: Sequence, width: int = 0):
+        xs = [point[0] for point in points]
+        ys = [point[1] for point in points]
+        if self._visible(min(xs), min(ys), max(xs) + 1, max(ys) + 1):
+            self.commands.append((self.layer, pygame.draw.polygon, (color, points, width)))
+    
+    # Replay
+    
+    def flush(self, screen: Optional[pygame.Surface] = None):
+        """Replay the frame onto the screen and start recording the next one"""
+        screen = screen or self.screen
+        commands = self.commands
+        # Stable, so each layer keeps its recording order
+        commands.sort(key=itemgetter(0))
+        
+        calls = 0
+        batch = []
+        for layer, kind, args in commands:
+            if kind is BLIT:
+                batch.append(args)
+                continue
+            if kind is BLITS:
+                batch.extend(args)
+                continue
+            if batch:
+                screen.blits(batch, doreturn=False)
+                calls += 1
+                batch = []
+            if kind is FILL:
+                screen.fill(*args)
+            else:
+                kind(screen, *args)
+            calls += 1
+        if batch:
+            screen.blits(batch, doreturn=False)
+            calls += 1
+        
+        stats = self.stats
+        stats.recorded = len(commands) + self.culled
+        stats.culled = self.culled
+        stats.calls = calls
+        self.commands = []
+        self.culled = 0
+        self.layer = 0
@@ -0,0 +1,429 @@
+"""Gym-style environments over the three games, and a vectorized runner for bots.
+
+Each environment wraps one headless Game in reset() and step(action) with
+Gym's four-tuple results, without depending on gym itself. Observations are
+either a compact float32 feature vector or an RGB frame scaled down to
+FRAME_SIZE and read back with pygame.surfarray; actions index a small table
+of held keys. Run it to step random bots and measure throughput:
+
+    python envs.py --game serpent --envs 8 --workers 4 --steps 2000
+
+VectorEnv spreads N environments over worker processes. Workers write
+observations, rewards and done flags straight into shared memory, so a
+step only sends the actions down each pipe and waits for an empty reply.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+from startup import use_headless_drivers
+
+use_headless_drivers()
+
+import numpy as np
+import pygame
+import game
+import game2
+import game3
+from keystate import HeldKeys
+
+DT = 1 / 60  # Fixed timestep of every game frame
+FRAME_SIZE = (96, 64)  # Width and height of pixel observations
+SIGHT = 400  # Escape Rush features only see this far, in pixels
+NEAREST = 3  # Enemies and enemy bullets described in Stellar Defender features
+LOOKAHEAD = 10  # Cells Quantum Serpent features scan for walls and body
+
+# Fired through the event handler, as a key press would be
+FIRE = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=' ', scancode=0)
+
+def nearest(things, x: float, y: float, count: int, scale: float) -> List[float]:
+    """Offset and a presence flag for each of the `count` things closest to (x, y), zero-padded"""
+    closest = sorted(things, key=lambda thing: (thing.x - x) ** 2 + (thing.y - y) ** 2)[:count]
+    values = []
+    for thing in closest:
+        values += [(thing.x - x) / scale, (thing.y - y) / scale, 1.0]
+    return values + [0.0] * (3 * (count - len(closest)))
+
+class GameEnv:
+    """reset() and step(action) over one headless game
+    
+    A step holds the action's keys for `frame_skip` frames of DT and
+    rewards the score gained meanwhile; the episode ends when the round does
+    or after `max_steps`. Subclasses build the game, start a round, advance
+    one frame and describe the game as features. Pixel observations are
+    shared: the top scene is drawn and scaled down to FRAME_SIZE.
+    """
+    actions: Tuple[Tuple[int, ...], ...] = ((),)  # Keys held by each action
+    feature_size = 0
+    
+    def __init__(self, observation: str = 'features', frame_skip: int = 4, max_steps: int = 5000):
+        self.observation_shape, self.observation_dtype = self.spec(observation)
+        self.observation = observation
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.action_count = len(self.actions)
+        self.keys = [HeldKeys(keys) for keys in self.actions]
+        self.game = self.make_game()
+        self.frame = pygame.Surface(FRAME_SIZE, 0, self.game.screen) if observation == 'pixels' else None
+        self.steps = 0
+        self.last_score = 0
+    
+    @classmethod
+    def spec(cls, observation: str) -> Tuple[Tuple[int, ...], np.dtype]:
+        """Shape and dtype of the observations, without building a game"""
+        if observation == 'features':
+            return (cls.feature_size,), np.dtype(np.float32)
+        if observation == 'pixels':
+            return (FRAME_SIZE[1], FRAME_SIZE[0], 3), np.dtype(np.uint8)
+        raise ValueError(f"unknown observation type {observation!r}")
+    
+    # Per game
+    
+    def make_game(self):
+        raise NotImplementedError
+    
+    def start(self):
+        """Begin a fresh round"""
+        raise NotImplementedError
+    
+    def advance(self, keys: HeldKeys):
+        """Run one frame of play with `keys` held"""
+        raise NotImplementedError
+    
+    def features(self) -> np.ndarray:
+        raise NotImplementedError
+    
+    # Gym interface
+    
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        if seed is not None:
+            random.seed(seed)
+        self.start()
+        self.steps = 0
+        self.last_score = self.game.score
+        return self.observe()
+    
+    def step(self, action: int):
+        keys = self.keys[action]
+        for _ in range(self.frame_skip):
+            self.advance(keys)
+            if self.game.state != 'playing':
+                break
+        self.steps += 1
+        
+        score = self.game.score
+        reward = float(score - self.last_score)
+        self.last_score = score
+        finished = self.game.state != 'playing'
+        truncated = not finished and self.steps >= self.max_steps
+        info = {'score': score, 'state': self.game.state, 'TimeLimit.truncated': truncated}
+        return self.observe(), reward, finished or truncated, info
+    
+    def observe(self) -> np.ndarray:
+        if self.frame is None:
+            return self.features()
+        self.game.scenes.draw()
+        pygame.transform.smoothscale(self.game.screen, FRAME_SIZE, self.frame)
+        # surfarray is indexed x first; observations are rows of pixels like any image
+        return pygame.surfarray.array3d(self.frame).transpose(1, 0, 2)
+    
+    def close(self):
+        close = getattr(self.game, 'close', None)
+        if close:
+            close()
+
+class EscapeRushEnv(GameEnv):
+    """Escape Rush: run, jump and sprint right to the flag"""
+    actions = (
+        (), (pygame.K_LEFT,), (pygame.K_RIGHT,), (pygame.K_SPACE,),
+        (pygame.K_LEFT, pygame.K_SPACE), (pygame.K_RIGHT, pygame.K_SPACE),
+        (pygame.K_RIGHT, pygame.K_LSHIFT), (pygame.K_RIGHT, pygame.K_LSHIFT, pygame.K_SPACE),
+    )
+    PROBES = (0, 40, 80, 120, 160)  # Columns ahead of the player checked for ground and hazards
+    feature_size = 7 + 3 + 3 + 2 * len(PROBES)
+    
+    def make_game(self):
+        rush = game.Game()
+        rush.sound.enabled = False  # No bot listens, and every jump would cost a mixer call
+        return rush
+    
+    def start(self):
+        self.game.start_game()
+    
+    def advance(self, keys: HeldKeys):
+        self.game.update_playing(DT, keys)
+    
+    def features(self) -> np.ndarray:
+        rush = self.game
+        player, level = rush.player, rush.level
+        x, y = player.x, player.y
+        values = [x / level.goal_x, y / game.SCREEN_HEIGHT, player.vx / 280, player.vy / 1000,
+                  float(player.on_ground), rush.lives / 3, rush.level_time / 300]
+        values += nearest([enemy for enemy in level.enemy_index.query(x - SIGHT, x + SIGHT) if enemy.alive],
+                          x, y, 1, SIGHT)
+        values += nearest([item for item in level.collectible_index.query(x - SIGHT, x + SIGHT) if not item.collected],
+                          x, y, 1, SIGHT)
+        
+        # Height of the ground under each probe column relative to the feet; 1 is a pit
+        feet = y + player.height
+        front = x + player.width
+        solids = level.solids_near(front, front + self.PROBES[-1])
+        hazards = level.hazards_near(front, front + self.PROBES[-1])
+        for offset in self.PROBES:
+            column = front + offset
+            ground = min((rect.top for rect in solids
+                          if rect.left <= column < rect.right and rect.top >= feet - game.TILE_SIZE), default=None)
+            values.append(1.0 if ground is None else min(1.0, (ground - feet) / SIGHT))
+            values.append(float(any(rect.left <= column < rect.right for rect in hazards)))
+        return np.array(values, dtype=np.float32)
+
+class StellarDefenderEnv(GameEnv):
+    """Stellar Defender: fly in eight directions, firing or not"""
+    MOVES = (
+        (), (pygame.K_UP,), (pygame.K_UP, pygame.K_RIGHT), (pygame.K_RIGHT,), (pygame.K_DOWN, pygame.K_RIGHT),
+        (pygame.K_DOWN,), (pygame.K_DOWN, pygame.K_LEFT), (pygame.K_LEFT,), (pygame.K_UP, pygame.K_LEFT),
+    )
+    actions = MOVES + tuple(move + (pygame.K_SPACE,) for move in MOVES)
+    feature_size = 7 + 3 * NEAREST * 2 + 3
+    
+    def make_game(self):
+        defender = game2.Game()
+        self.held = HeldKeys()
+        defender.controls = lambda: self.held
+        return defender
+    
+    def start(self):
+        self.game.state = "playing"
+        self.game._reset_game()
+    
+    def advance(self, keys: HeldKeys):
+        self.held = keys
+        # Held fire shoots whenever the cooldown allows
+        if keys[pygame.K_SPACE]:
+            self.game.handle_events(FIRE)
+        self.game.update(DT)
+    
+    def features(self) -> np.ndarray:
+        defender = self.game
+        player = defender.player
+        x, y = player.x, player.y
+        values = [x / game2.SCREEN_WIDTH, y / game2.SCREEN_HEIGHT, player.vx / 800, player.vy / 800,
+                  player.health / player.max_health, float(player.shoot_cooldown <= 0),
+                  defender.level / defender.victory_level]
+        values += nearest(defender.enemies, x, y, NEAREST, game2.SCREEN_WIDTH)
+        values += nearest([bullet for bullet in defender.bullets if not bullet.friendly],
+                          x, y, NEAREST, game2.SCREEN_WIDTH)
+        values += nearest(defender.powerups, x, y, 1, game2.SCREEN_WIDTH)
+        return np.array(values, dtype=np.float32)
+
+class EnvAgent(game3.SerpentAgent):
+    """Hands the snake whatever keys the environment's last action holds"""
+    def __init__(self):
+        self.keys = HeldKeys()
+    
+    def reset(self, game: 'game3.Game', snake: game3.QuantumSerpent):
+        # Turns snap to cell centres, as for the built-in autopilots
+        snake.snap_to_lanes = True
+    
+    def get_keys(self, game: 'game3.Game', snake: game3.QuantumSerpent) -> HeldKeys:
+        return self.keys
+
+class QuantumSerpentEnv(GameEnv):
+    """Quantum Serpent on lanes: keep going or turn"""
+    DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+    actions = ((),) + tuple((game3.DirectionKeys.DIRECTION_KEYS[direction],) for direction in DIRECTIONS)
+    feature_size = 7 + 3 + len(DIRECTIONS)
+    
+    def make_game(self):
+        self.agent = EnvAgent()
+        serpent = game3.Game()
+        serpent.agent = self.agent
+        return serpent
+    
+    def start(self):
+        self.game.state = "playing"
+        self.game.reset_game()
+    
+    def advance(self, keys: HeldKeys):
+        self.agent.keys = keys
+        self.game.update(DT)
+    
+    def features(self) -> np.ndarray:
+        serpent = self.game
+        snake = serpent.snake
+        head = snake.segments[0]
+        x, y = head.x, head.y
+        values = [x / game3.SCREEN_WIDTH, y / game3.SCREEN_HEIGHT, snake.direction.x, snake.direction.y,
+                  len(snake.segments) / 100, float(snake.shield_time > 0), float(snake.speed_boost_time > 0)]
+        values += nearest(serpent.orbs, x, y, 1, game3.SCREEN_WIDTH)
+        
+        # Free cells before a wall or the body along each direction, as a fraction of LOOKAHEAD
+        size = game3.GRID_SIZE
+        body = {(int(segment.x // size), int(segment.y // size)) for segment in snake.segments[1:]}
+        col, row = int(x // size), int(y // size)
+        for dx, dy in self.DIRECTIONS:
+            free = 0
+            while free < LOOKAHEAD:
+                cell = (col + dx * (free + 1), row + dy * (free + 1))
+                if not (0 <= cell[0] < game3.GRID_COLS and 0 <= cell[1] < game3.GRID_ROWS) or cell in body:
+                    break
+                free += 1
+            values.append(free / LOOKAHEAD)
+        return np.array(values, dtype=np.float32)
+
+ENVS: Dict[str, Type[GameEnv]] = {
+    'rush': EscapeRushEnv,
+    'defender': StellarDefenderEnv,
+    'serpent': QuantumSerpentEnv,
+}
+
+# Vectorized runner
+
+class SharedArray:
+    """A NumPy array in shared memory; unpickling attaches to the same block by name"""
+    def __init__(self, shape: Tuple[int, ...], dtype, name: Optional[str] = None):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        if name is None:
+            size = max(1, int(np.prod(self.shape)) * self.dtype.itemsize)
+            self.block = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.block = shared_memory.SharedMemory(name=name)
+        self.array = np.ndarray(self.shape, self.dtype, buffer=self.block.buf)
+    
+    def __reduce__(self):
+        return SharedArray, (self.shape, self.dtype.str, self.block.name)
+
+def _worker(pipe, name: str, worker: int, indices: List[int], arrays: Tuple[SharedArray, ...],
+            seed: int, options: dict):
+    """Own the environments at `indices`, stepping them whenever actions arrive"""
+    observations, rewards, dones, scores, busy = (shared.array for shared in arrays)
+    random.seed(seed + worker)
+    envs = [ENVS[name](**options) for _ in indices]
+    while True:
+        command, actions = pipe.recv()
+        if command == 'close':
+            break
+        started = time.perf_counter()
+        if command == 'reset':
+            for index, env in zip(indices, envs):
+                observations[index] = env.reset()
+                rewards[index], dones[index], scores[index] = 0.0, False, env.game.score
+        else:
+            for index, env, action in zip(indices, envs, actions):
+                observation, reward, done, info = env.step(action)
+                if done:
+                    observation = env.reset()
+                observations[index] = observation
+                rewards[index], dones[index], scores[index] = reward, done, info['score']
+        busy[worker] += time.perf_counter() - started
+        pipe.send(None)
+    for env in envs:
+        env.close()
+    pipe.close()
+
+class VectorEnv:
+    """N independent environments stepped together across worker processes
+    
+    Environment i lives in worker i % workers; each worker is one process,
+    so on one core each. step() returns live views of the shared buffers,
+    overwritten by the next call. A finished environment is reset at once:
+    its done flag and score describe the episode that just ended, while its
+    observation is already the first of the next one.
+    """
+    def __init__(self, name: str, count: int, workers: Optional[int] = None, seed: int = 0, **options):
+        env_type = ENVS[name]
+        shape, dtype = env_type.spec(options.get('observation', 'features'))
+        self.count = count
+        self.action_count = len(env_type.actions)
+        self.workers = max(1, min(count, workers or os.cpu_count() or 1))
+        self.observations = SharedArray((count, *shape), dtype)
+        self.rewards = SharedArray((count,), np.float32)
+        self.dones = SharedArray((count,), np.bool_)
+        self.scores = SharedArray((count,), np.float64)
+        self.busy = SharedArray((self.workers,), np.float64)  # Seconds each worker spent stepping
+        arrays = (self.observations, self.rewards, self.dones, self.scores, self.busy)
+        
+        # Spawned, not forked: each worker brings up its own SDL
+        context = multiprocessing.get_context('spawn')
+        self.slices = [list(range(worker, count, self.workers)) for worker in range(self.workers)]
+        self.pipes = []
+        self.processes = []
+        for worker, indices in enumerate(self.slices):
+            pipe, child = context.Pipe()
+            process = context.Process(target=_worker, args=(child, name, worker, indices, arrays, seed, options),
+                                      name=f'env-worker-{worker}', daemon=True)
+            process.start()
+            child.close()
+            self.pipes.append(pipe)
+            self.processes.append(process)
+    
+    def _call(self, command: str, actions: Optional[np.ndarray] = None):
+        for pipe, indices in zip(self.pipes, self.slices):
+            pipe.send((command, None if actions is None else actions[indices].tolist()))
+        for pipe in self.pipes:
+            pipe.recv()
+    
+    def reset(self) -> np.ndarray:
+        self._call('reset')
+        return self.observations.array
+    
+    def step(self, actions: Sequence[int]):
+        """Observations, rewards, done flags and {'score': ...} for every environment"""
+        self._call('step', np.asarray(actions))
+        return self.observations.array, self.rewards.array, self.dones.array, {'score': self.scores.array}
+    
+    def close(self):
+        for pipe in self.pipes:
+            pipe.send(('close', None))
+        for process in self.processes:
+            process.join()
+        for shared in (self.observations, self.rewards, self.dones, self.scores, self.busy):
+            shared.block.close()
+            shared.block.unlink()
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Step game environments in parallel with random actions")
+    parser.add_argument('--game', choices=sorted(ENVS), default='serpent', help="which game to run")
+    parser.add_argument('--envs', type=int, default=8, help="environments stepped together")
+    parser.add_argument('--workers', type=int, help="worker processes (default: one per core, at most one per env)")
+    parser.add_argument('--steps', type=int, default=1000, help="vector steps to run")
+    parser.add_argument('--observation', choices=('features', 'pixels'), default='features')
+    parser.add_argument('--frame-skip', type=int, default=4, help="game frames per step, with the action held")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the games and the actions")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    envs = VectorEnv(args.game, args.envs, args.workers, args.seed,
+                     observation=args.observation, frame_skip=args.frame_skip)
+    rng = np.random.default_rng(args.seed)
+    try:
+        envs.reset()
+        busy_before = envs.busy.array.copy()
+        episodes = 0
+        started = time.perf_counter()
+        for _ in range(args.steps):
+            _, _, dones, _ = envs.step(rng.integers(0, envs.action_count, envs.count))
+            episodes += int(dones.sum())
+        elapsed = time.perf_counter() - started
+        busy = envs.busy.array - busy_before
+    finally:
+        envs.close()
+    
+    # Each worker is a single-threaded process, so its rate over busy time is per core
+    print(f"{'worker':>6} {'envs':>5} {'steps':>8} {'busy s':>8} {'steps/s':>9}")
+    for worker, indices in enumerate(envs.slices):
+        steps = len(indices) * args.steps
+        print(f"{worker:>6} {len(indices):>5} {steps:>8} {busy[worker]:>8.2f} {steps / max(busy[worker], 1e-9):>9.0f}")
+    total = args.envs * args.steps
+    cores = min(envs.workers, os.cpu_count() or 1)
+    print(f"{total} env-steps in {elapsed:.2f} s: {total / elapsed:.0f} steps/s, "
+          f"{total / elapsed / cores:.0f} per core on {cores} cores, {episodes} episodes ended")
+
+if __name__ == "__main__":
+    main()
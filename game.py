@@ -1,16 +1,49 @@
 import pygame
+import sys
 import math
 import random
 import time
-
-# Initialize Pygame
-pygame.init()
+import numpy as np
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+import sprites
+from assets import asset_cache, surface_bytes
+from levels import ITEM_TYPES, TILE_TYPES, LevelPack
+from canvas import Canvas
+from drawlist import DrawList
+from glyphs import DIGITS, GlyphAtlas, cached_font, init_fonts
+from hud import HudLayer
+from particles import ParticleEngine
+from presenter import Presenter
+from scenes import Scene, SceneStack
+from quality import QualityGovernor
+from instrumentation import session_profiler
+from startup import open_game_window, timeline
 
 # Constants
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 TILE_SIZE = 40
 FPS = 60
+PARTICLE_GRAVITY = 300  # Particles fall a little slower than the player
+SCORE_VALUES = {'coin': 100, 'gem': 500, 'stomp': 200}
+TIME_BONUS_PER_SECOND = 10  # Awarded for the time left on the clock at the finish
+SKY_BANDS = (16, 4, 1)  # Sky gradient band height per quality detail level
+
+# Draw layers, bottom to top
+LAYER_TILES = 0
+LAYER_SHADOWS = 1
+LAYER_PLATFORMS = 2
+LAYER_ACTORS = 3
+LAYER_PARTICLES = 4
+WALK_PHASES = 16  # Baked walk-cycle steps per stride
+COLLISION_CLASSES = {'grass': 'solid', 'stone': 'solid', 'wood': 'solid', 'water': 'hazard', 'lava': 'hazard'}
+CHUNK_COLUMNS = 16  # Tile columns streamed in together
+CHUNK_WIDTH = CHUNK_COLUMNS * TILE_SIZE
+PREFETCH_CHUNKS = 1  # Chunks built ahead of the window, and kept behind it
+WAKE_MARGIN = 400   # Entities wake this far beyond the screen edges...
+SLEEP_MARGIN = 600  # ...and sleep again only once they are this far out
+MOVE_REBUILD_FRACTION = 64  # Span indexes re-sort outright once more than 1/64 of their items moved
 
 # Colors
 BLACK = (0, 0, 0)
@@ -30,14 +63,30 @@ LIGHT_BLUE = (173, 216, 230)
 GOLD = (255, 215, 0)
 PINK = (255, 192, 203)
 
+# Hazard waves: speed, spread along x, amplitude, body colour, crest colour, crest height
+HAZARD_ANIMATION = {
+    'water': (3, 0.1, 2, BLUE, LIGHT_BLUE, 4),
+    'lava': (4, 0.15, 3, RED, ORANGE, 6),
+}
+HAZARD_FRAMES = 32  # Baked steps of one wave cycle
+SAMPLE_RATE = 22050
+TONES = ((440, 0.1), (880, 0.15), (220, 0.2), (523, 0.2), (659, 0.2), (784, 0.2))  # Jump, coin, hit, win chord
+
 class SoundManager:
-    """Procedural sound generation"""
+    """Procedural sound generation, with every tone synthesised up front"""
     def __init__(self):
         try:
-            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=2, buffer=512)
             self.enabled = True
         except:
             self.enabled = False
+        self.sounds = {}
+        if self.enabled:
+            try:
+                for frequency, duration in TONES:
+                    self._sound(frequency, duration)
+            except:
+                self.enabled = False
     
     def play_jump(self):
         if self.enabled:
@@ -56,79 +105,42 @@ class SoundManager:
             for freq in [523, 659, 784]:
                 self._play_tone(freq, 0.2)
     
+    def _sound(self, frequency, duration):
+        sound = self.sounds.get((frequency, duration))
+        if sound is None:
+            cache = asset_cache()
+            key = cache.key('tone', frequency, duration, pygame.mixer.get_init()) if cache else None
+            samples = cache.load_array(key) if cache else None
+            if samples is None:
+                wave = 2000 * np.sin(2 * math.pi * frequency * np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE)
+                samples = np.repeat(wave.astype(np.int16)[:, None], 2, axis=1)
+                if cache:
+                    cache.store_array(key, samples)
+            sound = self.sounds[frequency, duration] = pygame.sndarray.make_sound(samples)
+        return sound
+    
     def _play_tone(self, frequency, duration):
         try:
-            import numpy as np
-            sample_rate = 22050
-            frames = int(duration * sample_rate)
-            arr = np.zeros((frames, 2), dtype=np.int16)
-            for i in range(frames):
-                wave = int(2000 * math.sin(2 * math.pi * frequency * i / sample_rate))
-                arr[i] = [wave, wave]
-            sound = pygame.sndarray.make_sound(arr)
-            sound.play()
+            self._sound(frequency, duration).play()
         except:
             pass
 
-class Particle:
-    """Individual particle for effects"""
-    def __init__(self, x, y, vx, vy, color, life, size=3):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.life = life
-        self.max_life = life
-        self.size = size
-    
-    def update(self, dt):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.vy += 300 * dt  # Gravity
-        self.life -= dt
-    
-    def draw(self, screen, camera):
-        if self.life > 0:
-            alpha = self.life / self.max_life
-            size = max(1, int(self.size * alpha))
-            x = int(self.x - camera.x)
-            y = int(self.y - camera.y)
-            if 0 <= x <= SCREEN_WIDTH and 0 <= y <= SCREEN_HEIGHT:
-                pygame.draw.circle(screen, self.color, (x, y), size)
-
-class ParticleSystem:
+class ParticleSystem(ParticleEngine):
     """Manages all particle effects"""
     def __init__(self):
-        self.particles = []
+        super().__init__(fade_color=False)
     
     def add_jump_dust(self, x, y):
-        for _ in range(5):
-            vx = random.uniform(-50, 50)
-            vy = random.uniform(-100, -20)
-            self.particles.append(Particle(x, y, vx, vy, GRAY, 0.5, 2))
+        self.emit_box(x, y, 5, (-50, 50), (-100, -20), GRAY, 0.5, 2, PARTICLE_GRAVITY)
     
     def add_coin_sparkle(self, x, y):
-        for _ in range(8):
-            vx = random.uniform(-80, 80)
-            vy = random.uniform(-120, -40)
-            color = random.choice([GOLD, YELLOW, WHITE])
-            self.particles.append(Particle(x, y, vx, vy, color, 0.8, 3))
+        self.emit_box(x, y, 8, (-80, 80), (-120, -40), [GOLD, YELLOW, WHITE], 0.8, 3, PARTICLE_GRAVITY)
     
     def add_enemy_burst(self, x, y):
-        for _ in range(12):
-            vx = random.uniform(-120, 120)
-            vy = random.uniform(-150, -50)
-            self.particles.append(Particle(x, y, vx, vy, RED, 1.0, 4))
-    
-    def update(self, dt):
-        self.particles = [p for p in self.particles if p.life > 0]
-        for particle in self.particles:
-            particle.update(dt)
+        self.emit_box(x, y, 12, (-120, 120), (-150, -50), RED, 1.0, 4, PARTICLE_GRAVITY)
     
     def draw(self, screen, camera):
-        for particle in self.particles:
-            particle.draw(screen, camera)
+        super().draw(screen, camera.x, camera.y)
 
 class Camera:
     """Smooth following camera with bounds"""
@@ -152,6 +164,8 @@ class Camera:
 
 class Player:
     """Animated player character with realistic appearance"""
+    sheet = None  # SpriteSheet from bake_sprites()
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -168,7 +182,7 @@ class Player:
         self.invuln_time = 0
         self.walk_cycle = 0
     
-    def update(self, dt, keys, level, particles, sound):
+    def update(self, dt, keys, level, particles, sound, scoreboard):
         # Input handling
         move_speed = 180
         if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]:
@@ -224,7 +238,7 @@ class Player:
         self._move_and_collide(dt, level)
         
         # Check hazards and enemies
-        result = self._check_interactions(level, particles, sound)
+        result = self._check_interactions(level, particles, sound, scoreboard)
         
         # Update invulnerability
         if self.invulnerable:
@@ -240,12 +254,12 @@ class Player:
         self.x += self.vx * dt
         self.rect.x = self.x
         
-        for tile in level.tiles:
-            if tile.solid and self.rect.colliderect(tile.rect):
+        for solid in level.solids_near(self.rect.left, self.rect.right):
+            if self.rect.colliderect(solid):
                 if self.vx > 0:
-                    self.rect.right = tile.rect.left
+                    self.rect.right = solid.left
                 else:
-                    self.rect.left = tile.rect.right
+                    self.rect.left = solid.right
                 self.x = self.rect.x
                 self.vx = 0
         
@@ -254,15 +268,15 @@ class Player:
         self.rect.y = self.y
         self.on_ground = False
         
-        for tile in level.tiles:
-            if tile.solid and self.rect.colliderect(tile.rect):
+        for solid in level.solids_near(self.rect.left, self.rect.right):
+            if self.rect.colliderect(solid):
                 if self.vy > 0:
-                    self.rect.bottom = tile.rect.top
+                    self.rect.bottom = solid.top
                     self.y = self.rect.y
                     self.vy = 0
                     self.on_ground = True
                 else:
-                    self.rect.top = tile.rect.bottom
+                    self.rect.top = solid.bottom
                     self.y = self.rect.y
                     self.vy = 0
         
@@ -275,10 +289,10 @@ class Player:
                     self.vy = 0
                     self.on_ground = True
     
-    def _check_interactions(self, level, particles, sound):
+    def _check_interactions(self, level, particles, sound, scoreboard):
         # Check hazards and falling off world
-        for tile in level.tiles:
-            if tile.type in ['water', 'lava'] and self.rect.colliderect(tile.rect):
+        for hazard in level.hazards_near(self.rect.left, self.rect.right):
+            if self.rect.colliderect(hazard):
                 return 'death'
         
         # Check if player fell off the world
@@ -287,12 +301,13 @@ class Player:
         
         # Check enemies
         if not self.invulnerable:
-            for enemy in level.enemies:
+            for enemy in level.enemy_index.query(self.rect.left, self.rect.right):
                 if enemy.alive and self.rect.colliderect(enemy.rect):
                     if self.vy > 0 and self.rect.bottom <= enemy.rect.centery:
                         # Stomp enemy
                         enemy.alive = False
                         self.vy = -200
+                        scoreboard.add('stomp')
                         particles.add_enemy_burst(enemy.x + enemy.width//2, enemy.y + enemy.height//2)
                         sound.play_hit()
                     else:
@@ -305,9 +320,10 @@ class Player:
                         return 'hit'
         
         # Check collectibles
-        for collectible in level.collectibles:
+        for collectible in level.collectible_index.query(self.rect.left, self.rect.right):
             if not collectible.collected and self.rect.colliderect(collectible.rect):
                 collectible.collected = True
+                scoreboard.add(collectible.type)
                 particles.add_coin_sparkle(collectible.x + collectible.width//2, 
                                          collectible.y + collectible.height//2)
                 sound.play_coin()
@@ -317,19 +333,26 @@ class Player:
         
         return 'normal'
     
-    def draw(self, screen, camera):
-        if self.invulnerable and int(self.invuln_time * 15) % 2:
-            return
-        
-        x = int(self.x - camera.x)
-        y = int(self.y - camera.y)
+    def frame_index(self):
+        """Baked frame for the current walk phase, facing and airborne state"""
+        phase = 0
+        if abs(self.vx) > 10:
+            phase = round(self.walk_cycle / (2 * math.pi) * WALK_PHASES) % WALK_PHASES
+        return (phase * 2 + self.facing_right) * 2 + self.on_ground
+    
+    @staticmethod
+    def render_frame(screen, index, x, y):
+        """Draw frame `index` with the player's top-left at (x, y); used when baking"""
+        phase, on_ground = divmod(index, 2)
+        phase, facing_right = divmod(phase, 2)
+        cycle = phase * 2 * math.pi / WALK_PHASES
         
         # Shadow
-        pygame.draw.ellipse(screen, (0, 0, 0, 50), (x + 2, y + self.height + 2, 20, 8))
+        pygame.draw.ellipse(screen, (0, 0, 0, 50), (x + 2, y + 34, 20, 8))
         
         # Body animation offsets
-        walk_offset = math.sin(self.walk_cycle) * 2 if abs(self.vx) > 10 else 0
-        jump_stretch = -4 if not self.on_ground else 0
+        walk_offset = math.sin(cycle) * 2
+        jump_stretch = -4 if not on_ground else 0
         
         # Enhanced body with overalls
         body_color = BLUE
@@ -362,7 +385,7 @@ class Player:
         pygame.draw.rect(screen, RED, (x + 11, y + 2, 2, 4))
         
         # Eyes (larger and more expressive)
-        eye_offset = 1 if self.facing_right else -1
+        eye_offset = 1 if facing_right else -1
         pygame.draw.circle(screen, WHITE, (x + 8 + eye_offset, y + 7), 4)
         pygame.draw.circle(screen, WHITE, (x + 16 + eye_offset, y + 7), 4)
         pygame.draw.circle(screen, BLACK, (x + 9 + eye_offset, y + 7), 3)
@@ -375,8 +398,8 @@ class Player:
         pygame.draw.circle(screen, (255, 200, 160), (x + 12, y + 9), 2)
         
         # Arms with gloves
-        arm_swing = math.sin(self.walk_cycle + math.pi) * 4 if abs(self.vx) > 10 else 0
-        if self.facing_right:
+        arm_swing = math.sin(cycle + math.pi) * 4
+        if facing_right:
             # Right arm
             pygame.draw.circle(screen, head_color, (x + 22, y + 16 - arm_swing), 4)
             pygame.draw.circle(screen, WHITE, (x + 22, y + 16 - arm_swing), 4, 2)  # Glove
@@ -392,16 +415,25 @@ class Player:
             pygame.draw.circle(screen, WHITE, (x + 22, y + 16 + arm_swing), 4, 2)  # Glove
         
         # Legs with better animation
-        leg_offset = math.sin(self.walk_cycle) * 5 if abs(self.vx) > 10 else 0
+        leg_offset = math.sin(cycle) * 5
         # Left leg
         pygame.draw.rect(screen, BROWN, (x + 7 + leg_offset, y + 26, 4, 6))
         pygame.draw.rect(screen, BLACK, (x + 6 + leg_offset, y + 30, 6, 3))  # Shoe
         # Right leg
         pygame.draw.rect(screen, BROWN, (x + 13 - leg_offset, y + 26, 4, 6))
         pygame.draw.rect(screen, BLACK, (x + 12 - leg_offset, y + 30, 6, 3))  # Shoe
+    
+    def draw(self, screen, camera):
+        if self.invulnerable and int(self.invuln_time * 15) % 2:
+            return
+        self.sheet.blit(screen, self.frame_index(), int(self.x - camera.x), int(self.y - camera.y))
 
 class Enemy:
     """Goomba-like enemy with simple AI"""
+    sheet = None  # SpriteSheet from bake_sprites()
+    STATE = ('x', 'y', 'vx', 'vy', 'animation_time')  # Saved by LevelSnapshot
+    FLAGS = ('alive', 'on_ground')
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -420,6 +452,9 @@ class Enemy:
         
         self.animation_time += dt
         
+        # Only solids around the enemy can touch it (edge probes reach 25px ahead)
+        nearby = level.solids_near(self.x - TILE_SIZE, self.x + self.width + TILE_SIZE)
+        
         # Physics
         self.vy += 800 * dt
         
@@ -428,13 +463,13 @@ class Enemy:
         self.rect.x = self.x
         
         # Check horizontal collisions
-        for tile in level.tiles:
-            if tile.solid and self.rect.colliderect(tile.rect):
+        for solid in nearby:
+            if self.rect.colliderect(solid):
                 self.vx = -self.vx
                 if self.vx > 0:
-                    self.rect.left = tile.rect.right
+                    self.rect.left = solid.right
                 else:
-                    self.rect.right = tile.rect.left
+                    self.rect.right = solid.left
                 self.x = self.rect.x
         
         # Move vertically
@@ -443,10 +478,10 @@ class Enemy:
         self.on_ground = False
         
         # Check vertical collisions
-        for tile in level.tiles:
-            if tile.solid and self.rect.colliderect(tile.rect):
+        for solid in nearby:
+            if self.rect.colliderect(solid):
                 if self.vy > 0:
-                    self.rect.bottom = tile.rect.top
+                    self.rect.bottom = solid.top
                     self.y = self.rect.y
                     self.vy = 0
                     self.on_ground = True
@@ -457,24 +492,29 @@ class Enemy:
             check_y = self.y + 25
             ground_ahead = False
             
-            for tile in level.tiles:
-                if tile.solid and tile.rect.collidepoint(check_x, check_y):
+            for solid in nearby:
+                if solid.collidepoint(check_x, check_y):
                     ground_ahead = True
                     break
             
             if not ground_ahead:
                 self.vx = -self.vx
     
-    def draw(self, screen, camera):
-        if not self.alive:
-            return
-        
-        x = int(self.x - camera.x)
-        y = int(self.y - camera.y)
+    def wake(self, elapsed):
+        """Position stays frozen while asleep; only the bob animation catches up"""
+        self.animation_time += elapsed
+    
+    def sync_rect(self):
+        self.rect.x = self.x
+        self.rect.y = self.y
+    
+    @staticmethod
+    def render_frame(screen, index, x, y):
+        """Draw frame `index` (body bob -1, 0 or 1) with the top-left at (x, y); used when baking"""
+        body_bob = index - 1
         
         # Body (brown mushroom-like)
-        body_bob = math.sin(self.animation_time * 4) * 1
-        pygame.draw.ellipse(screen, BROWN, (x, y + body_bob, self.width, self.height))
+        pygame.draw.ellipse(screen, BROWN, (x, y + body_bob, 20, 20))
         
         # Spots
         pygame.draw.circle(screen, (101, 67, 33), (x + 5, y + 6 + body_bob), 2)
@@ -489,9 +529,19 @@ class Enemy:
         # Feet
         pygame.draw.ellipse(screen, (101, 67, 33), (x - 2, y + 16, 6, 4))
         pygame.draw.ellipse(screen, (101, 67, 33), (x + 16, y + 16, 6, 4))
+    
+    def draw(self, screen, camera):
+        if not self.alive:
+            return
+        body_bob = int(math.sin(self.animation_time * 4))  # Truncated, as the float coordinates were
+        self.sheet.blit(screen, body_bob + 1, int(self.x - camera.x), int(self.y - camera.y))
 
 class Collectible:
     """Animated coins and power-ups"""
+    sheets = {}  # Item type -> SpriteSheet from bake_sprites()
+    STATE = ('animation_time', 'bob_offset')  # Saved by LevelSnapshot
+    FLAGS = ('collected',)
+    
     def __init__(self, x, y, item_type):
         self.x = x
         self.y = y
@@ -507,6 +557,38 @@ class Collectible:
         self.animation_time += dt
         self.bob_offset = math.sin(self.animation_time * 3) * 3
     
+    def wake(self, elapsed):
+        # Bobbing is a pure function of time, so one big step is exact
+        self.update(elapsed)
+    
+    def sync_rect(self):
+        pass  # The pickup box doesn't bob
+    
+    @staticmethod
+    def render_coin(screen, index, x, y):
+        """Draw the coin `index + 2` pixels wide mid-spin; used when baking"""
+        width = index + 2
+        # Outer glow
+        pygame.draw.ellipse(screen, YELLOW, (x - 2, y - 2, 20, 20))
+        # Main coin
+        pygame.draw.ellipse(screen, GOLD, (x + 8 - width//2, y + 4, width, 12))
+        # Highlight
+        pygame.draw.ellipse(screen, WHITE, (x + 8 - width//4, y + 6, width//2, 3))
+    
+    @staticmethod
+    def render_gem(screen, index, x, y):
+        """Draw the heart pickup; used when baking"""
+        # Left circle of heart
+        pygame.draw.circle(screen, RED, (x + 6, y + 6), 4)
+        # Right circle of heart
+        pygame.draw.circle(screen, RED, (x + 10, y + 6), 4)
+        # Bottom triangle of heart
+        heart_points = [(x + 2, y + 8), (x + 14, y + 8), (x + 8, y + 14)]
+        pygame.draw.polygon(screen, RED, heart_points)
+        # Highlight
+        pygame.draw.circle(screen, PINK, (x + 5, y + 5), 2)
+        pygame.draw.circle(screen, PINK, (x + 9, y + 5), 2)
+    
     def draw(self, screen, camera):
         if self.collected:
             return
@@ -518,35 +600,44 @@ class Collectible:
             # Spinning coin effect
             spin = math.sin(self.animation_time * 6)
             width = max(2, int(12 * abs(spin)))
-            
-            # Outer glow
-            pygame.draw.ellipse(screen, YELLOW, (x - 2, y - 2, 20, 20))
-            # Main coin
-            pygame.draw.ellipse(screen, GOLD, (x + 8 - width//2, y + 4, width, 12))
-            # Highlight
-            pygame.draw.ellipse(screen, WHITE, (x + 8 - width//4, y + 6, width//2, 3))
-        
+            self.sheets['coin'].blit(screen, width - 2, x, y)
         elif self.type == 'gem':
-            # Heart shape
-            # Left circle of heart
-            pygame.draw.circle(screen, RED, (x + 6, y + 6), 4)
-            # Right circle of heart
-            pygame.draw.circle(screen, RED, (x + 10, y + 6), 4)
-            # Bottom triangle of heart
-            heart_points = [(x + 2, y + 8), (x + 14, y + 8), (x + 8, y + 14)]
-            pygame.draw.polygon(screen, RED, heart_points)
-            # Highlight
-            pygame.draw.circle(screen, PINK, (x + 5, y + 5), 2)
-            pygame.draw.circle(screen, PINK, (x + 9, y + 5), 2)
+            self.sheets['gem'].blit(screen, 0, x, y)
+
+def bake_sprites():
+    """Bake every character's animation frames once; later launches reload them from disk"""
+    Player.sheet = sprites.bake('escape_rush_player', WALK_PHASES * 4, (36, 52), (4, 8), Player.render_frame)
+    Enemy.sheet = sprites.bake('escape_rush_enemy', 3, (28, 28), (4, 4), Enemy.render_frame)
+    Collectible.sheets = {
+        'coin': sprites.bake('escape_rush_coin', 11, (24, 24), (4, 4), Collectible.render_coin),
+        'gem': sprites.bake('escape_rush_gem', 1, (24, 24), (4, 4), Collectible.render_gem),
+    }
+    Tile.hazard_sheets = {
+        tile_type: sprites.bake(f'escape_rush_{tile_type}', HAZARD_FRAMES, (CHUNK_WIDTH, TILE_SIZE + 3), (0, 3),
+                                lambda screen, index, x, y, tile_type=tile_type:
+                                Tile.render_hazard_strip(screen, index, x, y, tile_type))
+        for tile_type in HAZARD_ANIMATION
+    }
+
+def release_caches():
+    """Drop the baked sheets and shared shadows; returns the bytes they held"""
+    held = surface_bytes(Player.sheet, Enemy.sheet, Collectible.sheets, Tile.hazard_sheets, MovingPlatform.shadows)
+    Player.sheet = Enemy.sheet = None
+    Collectible.sheets = {}
+    Tile.hazard_sheets = {}
+    MovingPlatform.shadows = {}
+    return held
 
 class Tile:
     """Environment tiles with visual styling"""
+    hazard_sheets = {}  # Tile type -> SpriteSheet of looping strips from bake_sprites()
+    
     def __init__(self, x, y, tile_type):
         self.x = x
         self.y = y
         self.type = tile_type
         self.rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
-        self.solid = tile_type in ['grass', 'stone', 'wood']
+        self.solid = COLLISION_CLASSES[tile_type] == 'solid'
     
     def draw(self, screen, camera):
         x = int(self.x - camera.x)
@@ -576,20 +667,37 @@ class Tile:
                 pygame.draw.line(screen, (101, 67, 33), (x, y + i), (x + TILE_SIZE, y + i))
             pygame.draw.rect(screen, (101, 67, 33), (x, y, TILE_SIZE, TILE_SIZE), 2)
         
-        elif self.type == 'water':
-            # Animated water
-            wave = math.sin(time.time() * 3 + x * 0.1) * 2
-            pygame.draw.rect(screen, BLUE, (x, y + wave, TILE_SIZE, TILE_SIZE - wave))
-            pygame.draw.rect(screen, LIGHT_BLUE, (x, y + wave, TILE_SIZE, 4))
-        
-        elif self.type == 'lava':
-            # Animated lava
-            bubble = math.sin(time.time() * 4 + x * 0.15) * 3
-            pygame.draw.rect(screen, RED, (x, y + bubble, TILE_SIZE, TILE_SIZE - bubble))
-            pygame.draw.rect(screen, ORANGE, (x, y + bubble, TILE_SIZE, 6))
+    
+    @staticmethod
+    def render_hazard_strip(screen, index, x, y, tile_type):
+        """Draw a chunk-wide run of water or lava at animation frame `index`; used when baking
+
+        Tile i of the strip is `spread * i * TILE_SIZE` further along the wave,
+        just as when each tile's phase came from its own x.
+        """
+        speed, spread, amplitude, body, crest, crest_height = HAZARD_ANIMATION[tile_type]
+        phase = index * 2 * math.pi / HAZARD_FRAMES
+        for i in range(CHUNK_COLUMNS):
+            offset = math.sin(phase + spread * i * TILE_SIZE) * amplitude
+            left = x + i * TILE_SIZE
+            pygame.draw.rect(screen, body, (left, y + offset, TILE_SIZE, TILE_SIZE - offset))
+            pygame.draw.rect(screen, crest, (left, y + offset, TILE_SIZE, crest_height))
+    
+    @staticmethod
+    def draw_hazard_run(screen, camera, clock, tile_type, x, y, count):
+        """Blit `count` contiguous hazard tiles starting at world (x, y) as one strip"""
+        speed, spread = HAZARD_ANIMATION[tile_type][:2]
+        screen_x = int(x - camera.x)
+        phase = speed * clock + spread * screen_x
+        frame = round(phase * HAZARD_FRAMES / (2 * math.pi)) % HAZARD_FRAMES
+        Tile.hazard_sheets[tile_type].blit(screen, frame, screen_x, int(y - camera.y), count * TILE_SIZE)
 
 class MovingPlatform:
     """Animated moving platforms"""
+    STATE = ('x', 'y', 'progress')  # Saved by LevelSnapshot
+    FLAGS = ()
+    shadows = {}  # Width -> translucent shadow surface, shared by same-sized platforms
+    
     def __init__(self, x, y, width, direction, distance, speed):
         self.start_x = x
         self.start_y = y
@@ -614,74 +722,398 @@ class MovingPlatform:
         self.rect.x = self.x
         self.rect.y = self.y
     
+    def wake(self, elapsed):
+        # Position is a pure function of progress, so one big step is exact
+        self.update(elapsed)
+    
+    def sync_rect(self):
+        self.rect.x = self.x
+        self.rect.y = self.y
+    
+    def span(self):
+        """Horizontal extent of the whole swing, shadow included"""
+        swing = self.distance if self.direction == 'horizontal' else 0
+        return self.start_x - swing, self.start_x + swing + self.width + 4
+    
+    def draw_shadow(self, screen, camera):
+        shadow = MovingPlatform.shadows.get(self.width)
+        if shadow is None:
+            shadow = MovingPlatform.shadows[self.width] = pygame.Surface((self.width, self.height))
+            shadow.set_alpha(80)
+            shadow.fill((0, 0, 0))
+        screen.blit(shadow, (int(self.x - camera.x + 4), int(self.y - camera.y + 4)))
+    
     def draw(self, screen, camera):
         x = int(self.x - camera.x)
         y = int(self.y - camera.y)
         
         # Platform with metallic look
-        pygame.draw.rect(screen, GRAY, (x, y, self.width, self.height))
-        pygame.draw.rect(screen, WHITE, (x + 2, y + 2, self.width - 4, 4))
-        pygame.draw.rect(screen, (64, 64, 64), (x, y, self.width, self.height), 2)
+        screen.rect(GRAY, (x, y, self.width, self.height))
+        screen.rect(WHITE, (x + 2, y + 2, self.width - 4, 4))
+        screen.rect((64, 64, 64), (x, y, self.width, self.height), 2)
         
         # Rivets
         for i in range(8, self.width - 8, 16):
-            pygame.draw.circle(screen, (32, 32, 32), (x + i, y + 8), 2)
+            screen.circle((32, 32, 32), (x + i, y + 8), 2)
+
+def merge_cells(mask, first_column=0):
+    """Cover the True cells of a (rows, cols) mask with rectangles
+
+    Each row is split into maximal runs, and a run is stacked onto the
+    rectangle above it when that row had exactly the same run. Returns
+    world-space Rects; the mask starts at grid column `first_column`.
+    """
+    rects = []
+    open_runs = {}  # (first, stop) column run -> Rect still growing downwards
+    padded = np.zeros(mask.shape[1] + 2, dtype=np.int8)
+    for row in range(mask.shape[0]):
+        padded[1:-1] = mask[row]
+        edges = np.flatnonzero(np.diff(padded))
+        runs = {}
+        for first, stop in zip(edges[::2].tolist(), edges[1::2].tolist()):
+            rect = open_runs.get((first, stop))
+            if rect is None:
+                rect = pygame.Rect((first_column + first) * TILE_SIZE, row * TILE_SIZE,
+                                   (stop - first) * TILE_SIZE, TILE_SIZE)
+                rects.append(rect)
+            else:
+                rect.height += TILE_SIZE
+            runs[(first, stop)] = rect
+        open_runs = runs
+    return rects
+
+class SpanIndex:
+    """Objects kept sorted by left edge, so a horizontal span query is two bisects
+
+    `bounds(item)` gives the item's (left, right) in world space. Static items
+    are indexed once; call move() with the items that moved this frame, so
+    sleepers cost nothing, and rebuild() after moving everything at once.
+    """
+    def __init__(self, items, bounds):
+        self.items = list(items)
+        self.bounds = bounds
+        self.rebuild()
+    
+    def rebuild(self):
+        spans = sorted((self.bounds(item), index) for index, item in enumerate(self.items))
+        self.items = [self.items[index] for _, index in spans]
+        self.lefts = [left for (left, _), _ in spans]
+        self.rights = [right for (_, right), _ in spans]
+        self.spans = {item: span for item, (span, _) in zip(self.items, spans)}  # Item -> indexed (left, right)
+        self.reach = max((right - left for (left, right), _ in spans), default=0)
+    
+    def move(self, items):
+        """Re-position just these items: a bisect removal and insertion each"""
+        if len(items) * MOVE_REBUILD_FRACTION > len(self.items):
+            # Shifting the lists once per item loses to one sort when most items moved
+            self.rebuild()
+            return
+        lefts, rights, entries, spans = self.lefts, self.rights, self.items, self.spans
+        for item in items:
+            span = self.bounds(item)
+            old = spans[item]
+            if span == old:
+                continue
+            position = bisect_left(lefts, old[0])
+            while entries[position] is not item:
+                position += 1
+            del lefts[position], rights[position], entries[position]
+            
+            left, right = spans[item] = span
+            position = bisect_right(lefts, left)
+            lefts.insert(position, left)
+            rights.insert(position, right)
+            entries.insert(position, item)
+            # Never shrinks; query() still checks each right edge
+            self.reach = max(self.reach, right - left)
+    
+    def query(self, left, right):
+        """Items whose span overlaps [left, right], in left-edge order"""
+        start = bisect_left(self.lefts, left - self.reach)
+        stop = bisect_right(self.lefts, right)
+        rights = self.rights
+        return [self.items[index] for index in range(start, stop) if rights[index] >= left]
+
+class ActivationRegion:
+    """Keeps the entities of one SpanIndex near the camera awake and the rest asleep
+
+    Entities wake within WAKE_MARGIN of the screen and sleep again only beyond
+    SLEEP_MARGIN, so nothing flickers at the boundary. Sleepers keep their
+    state untouched; entity.wake(elapsed) lets them catch up on waking.
+    """
+    def __init__(self, index):
+        self.index = index
+        self.awake = {}     # Insertion-ordered set of awake entities
+        self.slept_at = {}  # Entity -> level time it fell asleep (never woken: 0)
+    
+    def update(self, now, wake_span, sleep_span):
+        """Wake and sleep entities for this frame; returns the awake ones"""
+        for entity in self.index.query(*wake_span):
+            if entity not in self.awake:
+                self.awake[entity] = True
+                entity.wake(now - self.slept_at.pop(entity, 0.0))
+        
+        sleep_left, sleep_right = sleep_span
+        bounds = self.index.bounds
+        for entity in list(self.awake):
+            left, right = bounds(entity)
+            if right < sleep_left or left > sleep_right:
+                del self.awake[entity]
+                self.slept_at[entity] = now
+        return list(self.awake)
+
+class LevelChunk:
+    """One CHUNK_COLUMNS-wide slice of level geometry, ready to collide with and draw"""
+    def __init__(self, index, solids, hazards, hazard_runs, surface, top):
+        self.index = index
+        self.x = index * CHUNK_WIDTH
+        self.top = top                    # World y of the baked surface
+        self.solids = solids              # Merged Rects, split at the chunk edges
+        self.hazards = hazards
+        self.hazard_runs = hazard_runs    # (type, x, y, count) strips, animated so drawn every frame
+        self.surface = surface            # Static tiles plus every shadow; None when empty
+
+class ChunkStreamer:
+    """Keeps the level chunks around the camera resident and builds the next ones early
+
+    The chunk ahead of the camera is built on a worker thread (grid slice,
+    merged colliders, baked surface); anything needed right away that isn't
+    ready is built on the spot. Chunks well outside the window are evicted,
+    so memory stays flat however long the stage is. Only static geometry
+    lives here, so level restarts keep the resident chunks.
+    """
+    def __init__(self, pack):
+        self.grid = pack.grid
+        self.chunk_count = -(-self.grid.shape[1] // CHUNK_COLUMNS)
+        used_columns = np.flatnonzero(self.grid.any(axis=0))
+        self.width = int(used_columns[-1] + 1) * TILE_SIZE if len(used_columns) else 0
+        self.class_ids = {
+            name: [tile_id for tile_id, tile_type in enumerate(TILE_TYPES)
+                   if tile_type and COLLISION_CLASSES[tile_type] == name]
+            for name in ('solid', 'hazard')
+        }
+        self.resident = {}  # Chunk index -> LevelChunk
+        self.pending = {}   # Chunk index -> Future from the worker
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chunk-stream')
+        self.shadow = pygame.Surface((TILE_SIZE, TILE_SIZE))
+        self.shadow.set_alpha(60)
+        self.shadow.fill((0, 0, 0))
+    
+    def _range(self, left, right):
+        return max(0, int(left) // CHUNK_WIDTH), min(self.chunk_count - 1, int(right) // CHUNK_WIDTH)
+    
+    def chunks_in(self, left, right):
+        """Chunks overlapping the world-space x range [left, right]"""
+        first, last = self._range(left, right)
+        return [self.chunk(index) for index in range(first, last + 1)]
+    
+    def chunk(self, index):
+        chunk = self.resident.get(index)
+        if chunk is None:
+            future = self.pending.pop(index, None)
+            chunk = self._adopt(future.result() if future else self._build(index))
+        return chunk
+    
+    def update(self, left, right):
+        """Collect finished chunks, prefetch around [left, right] and evict the rest"""
+        for index, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[index]
+                self._adopt(future.result())
+        
+        first, last = self._range(left, right)
+        for index in (first - 1, last + 1):
+            if 0 <= index < self.chunk_count and index not in self.resident and index not in self.pending:
+                self.pending[index] = self.executor.submit(self._build, index)
+        
+        for index in list(self.resident):
+            if index < first - PREFETCH_CHUNKS or index > last + PREFETCH_CHUNKS:
+                del self.resident[index]
+    
+    def prefetch(self, left, right):
+        """Start building every chunk in [left, right] on the worker, without waiting"""
+        first, last = self._range(left, right)
+        for index in range(first, last + 1):
+            if index not in self.resident and index not in self.pending:
+                self.pending[index] = self.executor.submit(self._build, index)
+    
+    def close(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _adopt(self, chunk):
+        # convert_alpha needs the display, so it happens here on the main thread
+        if chunk.surface is not None and pygame.display.get_surface() is not None:
+            chunk.surface = chunk.surface.convert_alpha()
+        self.resident[chunk.index] = chunk
+        return chunk
+    
+    def _build(self, index):
+        first_column = index * CHUNK_COLUMNS
+        block = np.array(self.grid[:, first_column:first_column + CHUNK_COLUMNS])
+        solids, hazards = (merge_cells(np.isin(block, self.class_ids[name]), first_column)
+                           for name in ('solid', 'hazard'))
+        
+        # Column-major, so tiles and shadows overlap exactly as they did when drawn one by one
+        columns, rows = np.nonzero(block.T)
+        tiles = [Tile((first_column + column) * TILE_SIZE, row * TILE_SIZE, TILE_TYPES[block[row, column]])
+                 for column, row in zip(columns.tolist(), rows.tolist())]
+        if not tiles:
+            return LevelChunk(index, solids, hazards, [], None, 0)
+        
+        # Bake shadows and static tiles; hazards animate, so they leave a gap
+        top = int(rows.min()) * TILE_SIZE
+        height = (int(rows.max()) + 1) * TILE_SIZE - top
+        surface = pygame.Surface((CHUNK_WIDTH + 3, height + 3), pygame.SRCALPHA)
+        origin = Camera(0)
+        origin.x, origin.y = first_column * TILE_SIZE, top
+        for tile in tiles:
+            surface.blit(self.shadow, (tile.x - origin.x + 3, tile.y - top + 3))
+            if tile.solid:
+                tile.draw(surface, origin)
+        return LevelChunk(index, solids, hazards, self._hazard_runs(tiles), surface, top)
+    
+    def _hazard_runs(self, tiles):
+        """Group the chunk's water and lava into horizontal runs of one type"""
+        runs = []
+        for tile in sorted((tile for tile in tiles if not tile.solid), key=lambda tile: (tile.y, tile.x)):
+            if runs:
+                tile_type, x, y, count = runs[-1]
+                if tile_type == tile.type and y == tile.y and x + count * TILE_SIZE == tile.x:
+                    runs[-1] = (tile_type, x, y, count + 1)
+                    continue
+            runs.append((tile.type, tile.x, tile.y, 1))
+        return runs
+
+class LevelSnapshot:
+    """Every entity's mutable state packed into arrays; geometry is never copied
+
+    Rows follow the level's entity lists, columns each class's STATE and
+    FLAGS. Restoring writes the values back into the existing objects.
+    """
+    def __init__(self, level):
+        self.time = level.time
+        self.groups = []
+        for entities, region in level.entity_groups():
+            kind = type(entities[0]) if entities else None
+            state_names = kind.STATE if kind else ()
+            flag_names = kind.FLAGS if kind else ()
+            values = np.array([[getattr(entity, name) for name in state_names] for entity in entities],
+                              dtype=np.float64).reshape(len(entities), len(state_names))
+            flags = np.array([[getattr(entity, name) for name in flag_names] for entity in entities],
+                             dtype=bool).reshape(len(entities), len(flag_names))
+            awake = np.array([entity in region.awake for entity in entities], dtype=bool)
+            slept_at = np.array([region.slept_at.get(entity, 0.0) for entity in entities], dtype=np.float64)
+            self.groups.append((values, flags, awake, slept_at))
+    
+    def apply(self, level):
+        level.time = self.time
+        for (entities, region), (values, flags, awake, slept_at) in zip(level.entity_groups(), self.groups):
+            if not entities:
+                continue
+            state_names, flag_names = entities[0].STATE, entities[0].FLAGS
+            for entity, row, flag_row in zip(entities, values.tolist(), flags.tolist()):
+                entity.__dict__.update(zip(state_names, row))
+                entity.__dict__.update(zip(flag_names, flag_row))
+                entity.sync_rect()
+            region.awake = {entities[index]: True for index in np.flatnonzero(awake).tolist()}
+            asleep = np.flatnonzero(~awake & (slept_at > 0)).tolist()
+            region.slept_at = {entities[index]: float(slept_at[index]) for index in asleep}
+        level.enemy_index.rebuild()
 
 class Level:
     """Game level with all objects"""
     def __init__(self, level_data):
-        self.tiles = []
-        self.moving_platforms = []
-        self.enemies = []
-        self.collectibles = []
-        self.goal_x = level_data.get('goal_x', 3000)
-        self.goal_y = level_data.get('goal_y', 400)
-        self.width = 0
-        
-        # Create tiles from map
-        tile_map = level_data['map']
-        for y, row in enumerate(tile_map):
-            for x, tile_char in enumerate(row):
-                if tile_char != ' ':
-                    tile_x = x * TILE_SIZE
-                    tile_y = y * TILE_SIZE
-                    self.width = max(self.width, tile_x + TILE_SIZE)
-                    
-                    tile_types = {
-                        '#': 'grass', 'S': 'stone', 'W': 'wood',
-                        '~': 'water', 'L': 'lava'
-                    }
-                    if tile_char in tile_types:
-                        self.tiles.append(Tile(tile_x, tile_y, tile_types[tile_char]))
-        
-        # Add moving platforms
-        for platform_data in level_data.get('platforms', []):
-            self.moving_platforms.append(MovingPlatform(**platform_data))
-        
-        # Add enemies
-        for enemy_data in level_data.get('enemies', []):
-            self.enemies.append(Enemy(enemy_data['x'], enemy_data['y']))
-        
-        # Add collectibles
-        for collectible_data in level_data.get('collectibles', []):
-            self.collectibles.append(Collectible(**collectible_data))
+        # Accept the dict form too; it compiles in one vectorized pass
+        pack = level_data if isinstance(level_data, LevelPack) else LevelPack.from_source(level_data)
+        self.goal_x = pack.goal_x
+        self.goal_y = pack.goal_y
+        
+        # Geometry streams in by chunk and is never reset
+        self.streamer = ChunkStreamer(pack)
+        self.width = self.streamer.width
+        
+        # Entities are few, so they are built up front
+        self.moving_platforms = [MovingPlatform(x, y, width, 'vertical' if vertical else 'horizontal', distance, speed)
+                                 for x, y, width, vertical, distance, speed in pack.platforms.tolist()]
+        self.enemies = [Enemy(x, y) for x, y in pack.enemies.tolist()]
+        self.collectibles = [Collectible(x, y, ITEM_TYPES[item_type])
+                             for x, y, item_type in pack.collectibles.tolist()]
+        
+        # Culling indexes; spans include shadows and sprite overhang
+        self.platform_index = SpanIndex(self.moving_platforms, MovingPlatform.span)
+        self.enemy_index = SpanIndex(self.enemies, lambda enemy: (enemy.x - 4, enemy.x + enemy.width + 4))
+        self.collectible_index = SpanIndex(self.collectibles, lambda item: (item.x - 4, item.x + item.width + 4))
+        
+        # Simulation regions: everything starts asleep and wakes near the camera
+        self.time = 0.0
+        self.platform_region = ActivationRegion(self.platform_index)
+        self.enemy_region = ActivationRegion(self.enemy_index)
+        self.collectible_region = ActivationRegion(self.collectible_index)
+        
+        # Restarts restore this instead of rebuilding the level
+        self.initial_state = self.snapshot()
     
-    def update(self, dt):
-        for platform in self.moving_platforms:
+    def entity_groups(self):
+        """Each mutable entity list with the region that puts it to sleep"""
+        return ((self.moving_platforms, self.platform_region), (self.enemies, self.enemy_region),
+                (self.collectibles, self.collectible_region))
+    
+    def snapshot(self):
+        """Save all mutable entity state, e.g. for a checkpoint"""
+        return LevelSnapshot(self)
+    
+    def restore(self, snapshot):
+        """Put every entity back as it was in `snapshot`, in O(entities)"""
+        snapshot.apply(self)
+    
+    def span(self, camera, margin=0):
+        """World-space x range covered by the camera, widened by `margin`"""
+        return camera.x - margin, camera.x + SCREEN_WIDTH + margin
+    
+    def solids_near(self, left, right):
+        """Merged solid rectangles overlapping the world-space x range [left, right]"""
+        return [rect for chunk in self.streamer.chunks_in(left, right) for rect in chunk.solids
+                if rect.right >= left and rect.left <= right]
+    
+    def hazards_near(self, left, right):
+        """Merged water and lava rectangles overlapping [left, right]"""
+        return [rect for chunk in self.streamer.chunks_in(left, right) for rect in chunk.hazards
+                if rect.right >= left and rect.left <= right]
+    
+    def update(self, dt, camera=None):
+        """Step what is near the camera; without a camera, step everything"""
+        self.time += dt
+        if camera is None:
+            platforms, enemies, collectibles = self.moving_platforms, self.enemies, self.collectibles
+        else:
+            wake_span = self.span(camera, WAKE_MARGIN)
+            sleep_span = self.span(camera, SLEEP_MARGIN)
+            self.streamer.update(*sleep_span)
+            platforms = self.platform_region.update(self.time, wake_span, sleep_span)
+            enemies = self.enemy_region.update(self.time, wake_span, sleep_span)
+            collectibles = self.collectible_region.update(self.time, wake_span, sleep_span)
+        
+        for platform in platforms:
             platform.update(dt)
-        for enemy in self.enemies:
+        for enemy in enemies:
             enemy.update(dt, self)
-        for collectible in self.collectibles:
+        if camera is None:
+            self.enemy_index.rebuild()
+        else:
+            # Only the awake enemies moved; sleepers keep their entries
+            self.enemy_index.move(enemies)
+        for collectible in collectibles:
             collectible.update(dt)
     
-    def draw_background(self, screen, camera):
+    def draw_background(self, canvas, camera, detail=2, glow=True):
         # Sky gradient
-        for y in range(SCREEN_HEIGHT):
+        band = max(SKY_BANDS[detail], canvas.pixel)
+        for y in range(0, SCREEN_HEIGHT, band):
             color_ratio = y / SCREEN_HEIGHT
             r = int(135 + (255 - 135) * color_ratio)
             g = int(206 + (165 - 206) * color_ratio)
             b = int(235 + (0 - 235) * color_ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+            canvas.fill((r, g, b), (0, y, SCREEN_WIDTH, band))
         
         # Sun with rays
         sun_x = 200 - camera.x * 0.05
@@ -693,18 +1125,19 @@ class Level:
             angle = (i * 45 + ray_time * 10) * math.pi / 180
             ray_end_x = sun_x + math.cos(angle) * 80
             ray_end_y = sun_y + math.sin(angle) * 80
-            pygame.draw.line(screen, YELLOW, (int(sun_x), int(sun_y)), 
-                           (int(ray_end_x), int(ray_end_y)), 3)
+            canvas.line(YELLOW, (int(sun_x), int(sun_y)),
+                        (int(ray_end_x), int(ray_end_y)), 3)
         
         # Sun glow (multiple layers)
-        for radius in range(50, 20, -5):
+        glow_layers = range(50, 20, -5) if glow else ()
+        for radius in glow_layers:
             alpha = 255 - (50 - radius) * 6
             color = (255, 255, min(255, 150 + alpha//2))
-            pygame.draw.circle(screen, color, (int(sun_x), int(sun_y)), radius)
+            canvas.circle(color, (int(sun_x), int(sun_y)), radius)
         
         # Sun core
-        pygame.draw.circle(screen, YELLOW, (int(sun_x), int(sun_y)), 25)
-        pygame.draw.circle(screen, WHITE, (int(sun_x - 8), int(sun_y - 8)), 8)
+        canvas.circle(YELLOW, (int(sun_x), int(sun_y)), 25)
+        canvas.circle(WHITE, (int(sun_x - 8), int(sun_y - 8)), 8)
         
         # Clouds
         cloud_positions = [(300, 120), (800, 80), (1200, 140), (1600, 100)]
@@ -712,10 +1145,10 @@ class Level:
             x = cloud_x - camera.x * 0.3
             if -100 < x < SCREEN_WIDTH + 100:
                 # Cloud made of circles
-                pygame.draw.circle(screen, WHITE, (int(x), int(cloud_y)), 25)
-                pygame.draw.circle(screen, WHITE, (int(x + 20), int(cloud_y)), 30)
-                pygame.draw.circle(screen, WHITE, (int(x + 40), int(cloud_y)), 25)
-                pygame.draw.circle(screen, WHITE, (int(x + 15), int(cloud_y - 15)), 20)
+                canvas.circle(WHITE, (int(x), int(cloud_y)), 25)
+                canvas.circle(WHITE, (int(x + 20), int(cloud_y)), 30)
+                canvas.circle(WHITE, (int(x + 40), int(cloud_y)), 25)
+                canvas.circle(WHITE, (int(x + 15), int(cloud_y - 15)), 20)
         
         # Mountains (far background) - more realistic with multiple layers
         # Back mountains
@@ -728,7 +1161,7 @@ class Level:
         for px, py in back_mountain_points:
             x = px - camera.x * 0.1
             adjusted_back_points.append((x, py))
-        pygame.draw.polygon(screen, (80, 80, 100), adjusted_back_points)
+        canvas.polygon((80, 80, 100), adjusted_back_points)
         
         # Front mountains
         front_mountain_points = [
@@ -739,7 +1172,7 @@ class Level:
         for px, py in front_mountain_points:
             x = px - camera.x * 0.15
             adjusted_front_points.append((x, py))
-        pygame.draw.polygon(screen, (120, 120, 140), adjusted_front_points)
+        canvas.polygon((120, 120, 140), adjusted_front_points)
         
         # Enhanced trees with outlines and shadows
         tree_positions = [200, 450, 750, 1100, 1450, 1800, 2200, 2600, 3000, 3400]
@@ -751,72 +1184,67 @@ class Level:
                 
                 # Tree shadow
                 shadow_offset = 8
-                pygame.draw.rect(screen, (0, 0, 0, 50), 
-                               (int(x - trunk_width//2 + shadow_offset), 
-                                int(SCREEN_HEIGHT - 150 - tree_height + shadow_offset), 
-                                trunk_width, tree_height))
+                canvas.rect((0, 0, 0, 50),
+                            (int(x - trunk_width//2 + shadow_offset),
+                             int(SCREEN_HEIGHT - 150 - tree_height + shadow_offset),
+                             trunk_width, tree_height))
                 
                 # Tree trunk with outline
                 trunk_rect = (int(x - trunk_width//2), int(SCREEN_HEIGHT - 150 - tree_height), trunk_width, tree_height)
-                pygame.draw.rect(screen, BROWN, trunk_rect)
-                pygame.draw.rect(screen, (80, 40, 20), trunk_rect, 2)
+                canvas.rect(BROWN, trunk_rect)
+                canvas.rect((80, 40, 20), trunk_rect, 2)
                 
                 # Bark texture
                 for bark_y in range(0, tree_height, 8):
-                    pygame.draw.line(screen, (101, 67, 33), 
-                                   (int(x - trunk_width//2), int(SCREEN_HEIGHT - 150 - bark_y)), 
-                                   (int(x + trunk_width//2), int(SCREEN_HEIGHT - 150 - bark_y)))
+                    canvas.line((101, 67, 33),
+                                (int(x - trunk_width//2), int(SCREEN_HEIGHT - 150 - bark_y)),
+                                (int(x + trunk_width//2), int(SCREEN_HEIGHT - 150 - bark_y)))
                 
                 # Tree leaves with shadows and outlines
                 leaf_y = SCREEN_HEIGHT - 160 - tree_height
                 # Leaf shadows
-                pygame.draw.circle(screen, (0, 50, 0, 80), (int(x + 5), int(leaf_y + 5)), 35)
-                pygame.draw.circle(screen, (0, 50, 0, 80), (int(x - 10), int(leaf_y - 5)), 25)
-                pygame.draw.circle(screen, (0, 50, 0, 80), (int(x + 20), int(leaf_y)), 28)
+                canvas.circle((0, 50, 0, 80), (int(x + 5), int(leaf_y + 5)), 35)
+                canvas.circle((0, 50, 0, 80), (int(x - 10), int(leaf_y - 5)), 25)
+                canvas.circle((0, 50, 0, 80), (int(x + 20), int(leaf_y)), 28)
                 
                 # Main leaves
-                pygame.draw.circle(screen, DARK_GREEN, (int(x), int(leaf_y)), 35)
-                pygame.draw.circle(screen, GREEN, (int(x - 15), int(leaf_y - 10)), 25)
-                pygame.draw.circle(screen, GREEN, (int(x + 15), int(leaf_y - 5)), 28)
-                pygame.draw.circle(screen, (0, 200, 0), (int(x), int(leaf_y - 15)), 20)
+                canvas.circle(DARK_GREEN, (int(x), int(leaf_y)), 35)
+                canvas.circle(GREEN, (int(x - 15), int(leaf_y - 10)), 25)
+                canvas.circle(GREEN, (int(x + 15), int(leaf_y - 5)), 28)
+                canvas.circle((0, 200, 0), (int(x), int(leaf_y - 15)), 20)
                 
                 # Leaf outlines
-                pygame.draw.circle(screen, (0, 100, 0), (int(x), int(leaf_y)), 35, 2)
-                pygame.draw.circle(screen, (0, 120, 0), (int(x - 15), int(leaf_y - 10)), 25, 2)
-                pygame.draw.circle(screen, (0, 120, 0), (int(x + 15), int(leaf_y - 5)), 28, 2)
+                canvas.circle((0, 100, 0), (int(x), int(leaf_y)), 35, 2)
+                canvas.circle((0, 120, 0), (int(x - 15), int(leaf_y - 10)), 25, 2)
+                canvas.circle((0, 120, 0), (int(x + 15), int(leaf_y - 5)), 28, 2)
     
     def draw(self, screen, camera):
-        # Draw tiles with shadows
-        for tile in self.tiles:
-            if tile.x - camera.x > -TILE_SIZE and tile.x - camera.x < SCREEN_WIDTH + TILE_SIZE:
-                # Platform shadow
-                shadow_x = int(tile.x - camera.x + 3)
-                shadow_y = int(tile.y - camera.y + 3)
-                shadow_surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-                shadow_surface.set_alpha(60)
-                shadow_surface.fill((0, 0, 0))
-                screen.blit(shadow_surface, (shadow_x, shadow_y))
-                
-                tile.draw(screen, camera)
-        
-        # Draw moving platforms with shadows
-        for platform in self.moving_platforms:
-            # Platform shadow
-            shadow_x = int(platform.x - camera.x + 4)
-            shadow_y = int(platform.y - camera.y + 4)
-            shadow_surface = pygame.Surface((platform.width, platform.height))
-            shadow_surface.set_alpha(80)
-            shadow_surface.fill((0, 0, 0))
-            screen.blit(shadow_surface, (shadow_x, shadow_y))
-            
+        """Record the visible level into a DrawList"""
+        left, right = self.span(camera)
+        
+        # Draw baked tiles with shadows, then the animated hazards on top
+        screen.layer = LAYER_TILES
+        for chunk in self.streamer.chunks_in(left - TILE_SIZE - 3, right):
+            if chunk.surface is not None:
+                screen.blit(chunk.surface, (int(chunk.x - camera.x), int(chunk.top - camera.y)))
+            for tile_type, x, y, count in chunk.hazard_runs:
+                if x + count * TILE_SIZE >= left and x <= right:
+                    Tile.draw_hazard_run(screen, camera, self.time, tile_type, x, y, count)
+        
+        # Draw moving platforms over their shadows; every shadow goes out in one batch
+        for platform in self.platform_index.query(left, right):
+            screen.layer = LAYER_SHADOWS
+            platform.draw_shadow(screen, camera)
+            screen.layer = LAYER_PLATFORMS
             platform.draw(screen, camera)
         
         # Draw enemies
-        for enemy in self.enemies:
+        screen.layer = LAYER_ACTORS
+        for enemy in self.enemy_index.query(left, right):
             enemy.draw(screen, camera)
         
         # Draw collectibles
-        for collectible in self.collectibles:
+        for collectible in self.collectible_index.query(left, right):
             collectible.draw(screen, camera)
         
         # Draw winning flag on ground when player reaches 95% progress
@@ -827,12 +1255,12 @@ class Level:
             if -50 < flag_x < SCREEN_WIDTH + 50:
                 # Victory flag pole on ground (shorter)
                 pole_height = 80
-                pygame.draw.rect(screen, BROWN, (flag_x, flag_y - pole_height, 8, pole_height))
+                screen.rect(BROWN, (flag_x, flag_y - pole_height, 8, pole_height))
                 # Pole segments
                 for segment in range(0, pole_height, 15):
-                    pygame.draw.line(screen, (101, 67, 33), 
-                                   (flag_x, flag_y - pole_height + segment), 
-                                   (flag_x + 8, flag_y - pole_height + segment), 2)
+                    screen.line((101, 67, 33),
+                                (flag_x, flag_y - pole_height + segment),
+                                (flag_x + 8, flag_y - pole_height + segment), 2)
                 
                 # Victory flag with animation
                 flag_wave = math.sin(time.time() * 4) * 4
@@ -842,12 +1270,12 @@ class Level:
                     (flag_x + 45 + flag_wave, flag_y - pole_height + 35),
                     (flag_x + 8, flag_y - pole_height + 30)
                 ]
-                pygame.draw.polygon(screen, GREEN, flag_points)
-                pygame.draw.polygon(screen, DARK_GREEN, flag_points, 2)
+                screen.polygon(GREEN, flag_points)
+                screen.polygon(DARK_GREEN, flag_points, 2)
                 
                 # Victory symbol on flag
-                pygame.draw.circle(screen, GOLD, (flag_x + 25, flag_y - pole_height + 22), 6)
-                pygame.draw.rect(screen, WHITE, (flag_x + 22, flag_y - pole_height + 19, 6, 6))
+                screen.circle(GOLD, (flag_x + 25, flag_y - pole_height + 22), 6)
+                screen.rect(WHITE, (flag_x + 22, flag_y - pole_height + 19, 6, 6))
                 
                 # Enhanced sparkle effect for victory
                 sparkle_time = time.time() * 8
@@ -855,100 +1283,114 @@ class Level:
                     angle = (i * 60 + sparkle_time * 40) * math.pi / 180
                     sparkle_x = flag_x + 30 + math.cos(angle) * 20
                     sparkle_y = flag_y - pole_height + 22 + math.sin(angle) * 15
-                    pygame.draw.circle(screen, GOLD, (int(sparkle_x), int(sparkle_y)), 3)
+                    screen.circle(GOLD, (int(sparkle_x), int(sparkle_y)), 3)
                 
                 # "FINISH" text above flag
-                finish_font = pygame.font.Font(None, 36)
+                finish_font = cached_font(36)
                 finish_text = finish_font.render("FINISH!", True, GOLD)
                 screen.blit(finish_text, (flag_x - 20, flag_y - pole_height - 30))
 
+class ScoreBoard:
+    """Event-driven score: every pickup, stomp or bonus updates the counters once
+
+    Listeners are called as listener(event, points, scoreboard) and can
+    drive achievements or telemetry without polling the level.
+    """
+    def __init__(self):
+        self.listeners = []
+        self.reset()
+    
+    def reset(self):
+        self.score = 0
+        self.counts = dict.fromkeys(SCORE_VALUES, 0)
+    
+    def add(self, event, points=None):
+        """Record one scoring event; `points` overrides the table (time bonuses)"""
+        if points is None:
+            points = SCORE_VALUES[event]
+        self.score += points
+        self.counts[event] = self.counts.get(event, 0) + 1
+        for listener in self.listeners:
+            listener(event, points, self)
+
 class HUD:
-    """Heads-up display with polished UI"""
+    """Heads-up display with polished UI, composed on a cached layer"""
     def __init__(self):
-        self.font_large = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 24)
+        # Counters are composed from baked digits, each over a black drop shadow
+        self.glyphs_large = GlyphAtlas(36, WHITE, DIGITS, ("Score: ", "x ", "Time: "),
+                                       glow_color=BLACK, glow_offsets=((2, 2),))
+        self.glyphs_small = GlyphAtlas(24, WHITE, DIGITS + "%", ("Progress: ",),
+                                       glow_color=BLACK, glow_offsets=((1, 1),))
+        self.bar_x = SCREEN_WIDTH - 220
+        self.bar_y = 52
+        self.layer = HudLayer((SCREEN_WIDTH, 90), self.render_panel)
+        self.score = self.layer.add((20, 15, 182, 27), self.render_score)
+        self.coin_icon = self.layer.add((202, 12, 37, 37), self.render_coin_icon)
+        self.coins = self.layer.add((240, 15, 100, 27), self.render_coins)
+        self.lives = self.layer.add((340, 15, 630, 28), self.render_lives)
+        self.timer = self.layer.add((SCREEN_WIDTH - 200, 15, 140, 27), self.render_timer)
+        self.progress = self.layer.add((self.bar_x, self.bar_y - 20, 202, 38), self.render_progress)
     
-    def draw(self, screen, score, coins, lives, time_left, progress):
+    def render_panel(self, surface):
         # Modern gradient top bar
         for y in range(90):
-            alpha = 200 - (y * 2)
-            color = (20, 20, 40, alpha)
-            bar_surface = pygame.Surface((SCREEN_WIDTH, 1))
-            bar_surface.set_alpha(alpha)
-            bar_surface.fill((20, 20, 40))
-            screen.blit(bar_surface, (0, y))
-        
-        # Rounded rectangle background
+            surface.fill((20, 20, 40, 200 - (y * 2)), (0, y, SCREEN_WIDTH, 1))
+        
+        # Rounded rectangle background; the screen has no alpha channel, so it always drew opaque
         hud_rect = pygame.Rect(10, 10, SCREEN_WIDTH - 20, 70)
-        pygame.draw.rect(screen, (0, 0, 0, 100), hud_rect, border_radius=15)
-        pygame.draw.rect(screen, (255, 255, 255, 50), hud_rect, 2, border_radius=15)
-        
-        # Score with shadow
-        shadow_text = self.font_large.render(f"Score: {score:06d}", True, (0, 0, 0))
-        screen.blit(shadow_text, (22, 17))
-        score_text = self.font_large.render(f"Score: {score:06d}", True, WHITE)
-        screen.blit(score_text, (20, 15))
-        
-        # Animated glowing coin
-        glow_time = time.time() * 4
-        glow_size = 15 + math.sin(glow_time) * 3
-        pygame.draw.circle(screen, (255, 215, 0, 100), (220, 30), int(glow_size))
-        pygame.draw.circle(screen, GOLD, (220, 30), 12)
-        pygame.draw.circle(screen, YELLOW, (220, 30), 8)
-        pygame.draw.circle(screen, WHITE, (218, 28), 3)
-        
-        coins_shadow = self.font_large.render(f"x {coins}", True, (0, 0, 0))
-        screen.blit(coins_shadow, (242, 17))
-        coins_text = self.font_large.render(f"x {coins}", True, WHITE)
-        screen.blit(coins_text, (240, 15))
+        pygame.draw.rect(surface, (0, 0, 0), hud_rect, border_radius=15)
+        pygame.draw.rect(surface, (255, 255, 255), hud_rect, 2, border_radius=15)
         
+        # Progress bar shadow and background
+        pygame.draw.rect(surface, (0, 0, 0), (self.bar_x + 2, self.bar_y + 2, 200, 16), border_radius=8)
+        pygame.draw.rect(surface, (40, 40, 40), (self.bar_x, self.bar_y, 200, 16), border_radius=8)
+    
+    def render_score(self, surface, score):
+        self.glyphs_large.draw(surface, f"Score: {score:06d}", (20, 15))
+    
+    def render_coin_icon(self, surface, glow_size):
+        pygame.draw.circle(surface, GOLD, (220, 30), glow_size)
+        pygame.draw.circle(surface, GOLD, (220, 30), 12)
+        pygame.draw.circle(surface, YELLOW, (220, 30), 8)
+        pygame.draw.circle(surface, WHITE, (218, 28), 3)
+    
+    def render_coins(self, surface, coins):
+        self.glyphs_large.draw(surface, f"x {coins}", (240, 15))
+    
+    def render_lives(self, surface, lives):
         # Modern heart icons
         for i in range(lives):
             heart_x = 350 + i * 35
             heart_y = 25
             # Heart shadow
-            pygame.draw.circle(screen, (100, 0, 0), (heart_x + 1, heart_y + 1), 8)
-            pygame.draw.circle(screen, (100, 0, 0), (heart_x + 11, heart_y + 1), 8)
-            pygame.draw.polygon(screen, (100, 0, 0), [
+            pygame.draw.circle(surface, (100, 0, 0), (heart_x + 1, heart_y + 1), 8)
+            pygame.draw.circle(surface, (100, 0, 0), (heart_x + 11, heart_y + 1), 8)
+            pygame.draw.polygon(surface, (100, 0, 0), [
                 (heart_x - 7, heart_y + 4), (heart_x + 19, heart_y + 4), (heart_x + 6, heart_y + 16)
             ])
             # Heart main
-            pygame.draw.circle(screen, RED, (heart_x, heart_y), 8)
-            pygame.draw.circle(screen, RED, (heart_x + 10, heart_y), 8)
-            pygame.draw.polygon(screen, RED, [
+            pygame.draw.circle(surface, RED, (heart_x, heart_y), 8)
+            pygame.draw.circle(surface, RED, (heart_x + 10, heart_y), 8)
+            pygame.draw.polygon(surface, RED, [
                 (heart_x - 8, heart_y + 3), (heart_x + 18, heart_y + 3), (heart_x + 5, heart_y + 15)
             ])
             # Heart highlight
-            pygame.draw.circle(screen, PINK, (heart_x - 2, heart_y - 2), 3)
-        
-        # Timer with shadow
-        timer_shadow = self.font_large.render(f"Time: {int(time_left)}", True, (0, 0, 0))
-        screen.blit(timer_shadow, (SCREEN_WIDTH - 198, 17))
-        timer_text = self.font_large.render(f"Time: {int(time_left)}", True, WHITE)
-        screen.blit(timer_text, (SCREEN_WIDTH - 200, 15))
-        
-        # Modern progress bar
-        bar_width = 200
-        bar_height = 16
-        bar_x = SCREEN_WIDTH - bar_width - 20
-        bar_y = 52
-        
-        # Progress bar shadow
-        shadow_rect = pygame.Rect(bar_x + 2, bar_y + 2, bar_width, bar_height)
-        pygame.draw.rect(screen, (0, 0, 0, 80), shadow_rect, border_radius=8)
-        
-        # Progress bar background
-        bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(screen, (40, 40, 40), bg_rect, border_radius=8)
+            pygame.draw.circle(surface, PINK, (heart_x - 2, heart_y - 2), 3)
+    
+    def render_timer(self, surface, seconds):
+        self.glyphs_large.draw(surface, f"Time: {seconds}", (SCREEN_WIDTH - 200, 15))
+    
+    def render_progress(self, surface, value):
+        progress_width, percent = value
+        bar_x, bar_y, bar_width, bar_height = self.bar_x, self.bar_y, 200, 16
         
         # Progress fill with gradient
-        progress_width = int(bar_width * min(1.0, progress))
         if progress_width > 0:
-            if progress < 0.3:
+            if percent < 30:
                 color1, color2 = (255, 100, 100), (200, 50, 50)
-            elif progress < 0.6:
+            elif percent < 60:
                 color1, color2 = (255, 200, 100), (255, 150, 50)
-            elif progress < 0.9:
+            elif percent < 90:
                 color1, color2 = (255, 255, 100), (255, 200, 50)
             else:
                 color1, color2 = (100, 255, 100), (50, 200, 50)
@@ -958,48 +1400,180 @@ class HUD:
                 r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
                 g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
                 b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                pygame.draw.rect(screen, (r, g, b), (bar_x, bar_y + i, progress_width, 1))
+                surface.fill((r, g, b), (bar_x, bar_y + i, progress_width, 1))
         
         # Progress bar border
-        pygame.draw.rect(screen, WHITE, bg_rect, 2, border_radius=8)
-        
-        # Progress text with shadow
-        progress_shadow = self.font_small.render(f"Progress: {int(progress*100)}%", True, (0, 0, 0))
-        screen.blit(progress_shadow, (bar_x + 1, bar_y - 19))
-        progress_text = self.font_small.render(f"Progress: {int(progress*100)}%", True, WHITE)
-        screen.blit(progress_text, (bar_x, bar_y - 20))
+        pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 2, border_radius=8)
+        self.glyphs_small.draw(surface, f"Progress: {percent}%", (bar_x, bar_y - 20))
+    
+    def draw(self, screen, score, coins, lives, time_left, progress):
+        # Left of the start the raw ratio goes negative
+        progress = max(0.0, min(1.0, progress))
+        layer = self.layer
+        layer.set(self.score, score)
+        layer.set(self.coin_icon, int(15 + math.sin(time.time() * 4) * 3))
+        layer.set(self.coins, coins)
+        layer.set(self.lives, lives)
+        layer.set(self.timer, int(time_left))
+        layer.set(self.progress, (int(200 * progress), int(progress * 100)))
+        layer.draw(screen)
+
+# Scenes
+class MenuScene(Scene):
+    """Title screen over the scrolling level background"""
+    name = 'menu'
+    
+    def enter(self):
+        # Escape Rush is the one game with setup slow enough to preload: the streamer's worker
+        # builds the starting chunks while the menu is up, and the level waits on them when drawn
+        self.game.scenes.preload('playing')
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                self.game.start_game()
+            elif event.key == pygame.K_ESCAPE:
+                return False
+        return True
+    
+    def update(self, dt):
+        # Animate menu background
+        camera = self.game.camera
+        camera.x += 20 * dt
+        if camera.x > 1000:
+            camera.x = 0
+    
+    def draw(self, screen):
+        self.game.draw_menu()
+
+class PlayScene(Scene):
+    """The level itself"""
+    name = 'playing'
+    
+    def preload(self):
+        # Build the chunks around the start position while the menu is still up
+        self.game.level.streamer.prefetch(0, SCREEN_WIDTH)
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+            self.game.state = 'paused'
+        return True
+    
+    def update(self, dt):
+        self.game.update_playing(dt, pygame.key.get_pressed())
+    
+    def draw(self, screen):
+        self.game.draw_playing()
+
+class PauseScene(Scene):
+    """Overlay over the frozen level"""
+    name = 'paused'
+    overlay = True
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_p:
+                self.game.state = 'playing'
+            elif event.key == pygame.K_m:
+                self.game.state = 'menu'
+        return True
+    
+    def draw(self, screen):
+        self.game.draw_paused()
+
+class GameOverScene(Scene):
+    """Final score; restart or back to the menu"""
+    name = 'game_over'
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_r:
+                self.game.start_game()
+            elif event.key == pygame.K_m:
+                self.game.state = 'menu'
+        return True
+    
+    def draw(self, screen):
+        self.game.draw_game_over()
+
+class WinScene(Scene):
+    """Celebration after reaching the goal"""
+    name = 'win'
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_m:
+            self.game.state = 'menu'
+        return True
+    
+    def draw(self, screen):
+        self.game.draw_win()
 
 class Game:
     """Main game class"""
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Escape Rush - Platformer Adventure")
+    def __init__(self, level_path=None):
+        self.screen = open_game_window((SCREEN_WIDTH, SCREEN_HEIGHT), "Escape Rush - Platformer Adventure")
         self.clock = pygame.time.Clock()
+        self.presenter = Presenter()
+        self.canvas = Canvas(self.screen)
+        self.draw_list = DrawList(self.screen)
+        bake_sprites()
+        timeline.mark('sprites')
         
         # Game systems
         self.sound = SoundManager()
+        timeline.mark('audio')
+        self.quality = QualityGovernor(FPS)
         self.particles = ParticleSystem()
+        self.particles.governor = self.quality
+        init_fonts()
         self.hud = HUD()
+        timeline.mark('font')
         
         # Game state
-        self.state = 'menu'  # menu, playing, paused, game_over, win
-        self.score = 0
-        self.coins = 0
+        self.scoreboard = ScoreBoard()
+        self.scoreboard.listeners.append(self._log_score)
         self.lives = 3
         self.level_time = 300
         self.start_time = 0
         
         # Create level
-        self.level_data = self._create_level_data()
-        self.level = Level(self.level_data)
+        self.level_pack = LevelPack.load(level_path) if level_path else LevelPack.from_source(self._create_level_data())
+        self.level = Level(self.level_pack)
         self.camera = Camera(self.level.width)
         self.player = None
         
         # Menu animation
         self.menu_time = 0
         self.title_bounce = 0
+        
+        self.scenes = SceneStack(self, self.screen, (MenuScene, PlayScene, PauseScene, GameOverScene, WinScene))
+        self.state = 'menu'
+    
+    @property
+    def state(self):
+        """Name of the scene on top: menu, playing, paused, game_over or win"""
+        return self.scenes.name
+    
+    @state.setter
+    def state(self, name):
+        self.scenes.show(name)
+    
+    @property
+    def score(self):
+        return self.scoreboard.score
+    
+    @property
+    def coins(self):
+        return self.scoreboard.counts['coin']
     
-    def _create_level_data(self):
+    def _log_score(self, event, points, scoreboard):
+        # Scores come every few seconds, so they are tallied rather than logged one by one
+        profiler = session_profiler()
+        profiler.count(f'score.{event}')
+        profiler.count('score.points', points)
+    
+    @staticmethod
+    def _create_level_data():
         """Create the game level"""
         # Level map with varied terrain - up and down movement
         level_map = [
@@ -1056,23 +1630,22 @@ class Game:
     def start_game(self):
         """Initialize a new game"""
         self.player = Player(100, 600)
-        self.score = 0
-        self.coins = 0
+        self.scoreboard.reset()
         self.lives = 3
         self.level_time = 300
         self.start_time = time.time()
         self.camera.x = 0
         self.camera.y = 0
         
-        # Reset level
-        self.level = Level(self.level_data)
+        # Reset level state in place; geometry and its resident chunks carry over
+        self.level.restore(self.level.initial_state)
         self.state = 'playing'
     
     def update_playing(self, dt, keys):
         """Update game during play"""
         # Update game objects
-        self.level.update(dt)
-        result = self.player.update(dt, keys, self.level, self.particles, self.sound)
+        self.level.update(dt, self.camera)
+        result = self.player.update(dt, keys, self.level, self.particles, self.sound, self.scoreboard)
         
         # Handle player state
         if result == 'death' or result == 'hit':
@@ -1102,26 +1675,28 @@ class Game:
         # Update particles
         self.particles.update(dt)
         
-        # Count collected items
-        collected_coins = sum(1 for c in self.level.collectibles if c.collected and c.type == 'coin')
-        collected_gems = sum(1 for c in self.level.collectibles if c.collected and c.type == 'gem')
-        self.coins = collected_coins
-        self.score = collected_coins * 100 + collected_gems * 500
-        
         # Check win condition - game ends at 100% progress
         progress = min(1.0, self.player.x / self.level.goal_x)
         if progress >= 1.0:
             self.sound.play_win()
+            self.scoreboard.add('time_bonus', int(self.level_time) * TIME_BONUS_PER_SECOND)
             # Add celebration particles
             for _ in range(30):
                 self.particles.add_coin_sparkle(self.player.x + random.randint(-20, 20), 
                                               self.player.y + random.randint(-20, 20))
             self.state = 'win'
     
+    def draw_background(self):
+        """Parallax background at the tier's render scale, stretched over the window"""
+        tier = self.quality.tier
+        self.canvas.set_scale(tier.render_scale)
+        self.level.draw_background(self.canvas, self.camera, tier.background_detail, tier.glow)
+        self.canvas.present()
+    
     def draw_menu(self):
         """Draw modern main menu"""
         # Animated background
-        self.level.draw_background(self.screen, self.camera)
+        self.draw_background()
         
         # Floating title animation
         self.title_bounce += 0.03
@@ -1129,21 +1704,22 @@ class Game:
         title_scale = 1.0 + math.sin(self.title_bounce * 2) * 0.05
         
         # Title glow effect
-        for glow_size in range(8, 0, -2):
+        glow_layers = range(8, 0, -2) if self.quality.tier.glow else ()
+        for glow_size in glow_layers:
             glow_alpha = 50 - (glow_size * 6)
-            glow_font = pygame.font.Font(None, int(84 * title_scale) + glow_size)
+            glow_font = cached_font(int(84 * title_scale) + glow_size)
             glow_text = glow_font.render("ESCAPE RUSH", True, (255, 215, 0, glow_alpha))
             glow_rect = glow_text.get_rect(center=(SCREEN_WIDTH//2, title_y))
             self.screen.blit(glow_text, glow_rect)
         
         # Title shadow
-        shadow_font = pygame.font.Font(None, int(84 * title_scale))
+        shadow_font = cached_font(int(84 * title_scale))
         title_shadow = shadow_font.render("ESCAPE RUSH", True, (0, 0, 0, 150))
         title_shadow_rect = title_shadow.get_rect(center=(SCREEN_WIDTH//2 + 4, title_y + 4))
         self.screen.blit(title_shadow, title_shadow_rect)
         
         # Main title
-        title_font = pygame.font.Font(None, int(84 * title_scale))
+        title_font = cached_font(int(84 * title_scale))
         title = title_font.render("ESCAPE RUSH", True, GOLD)
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, title_y))
         self.screen.blit(title, title_rect)
@@ -1152,7 +1728,7 @@ class Game:
         fade_alpha = min(255, int(self.menu_time * 200))
         
         # Modern button backgrounds
-        button_font = pygame.font.Font(None, 48)
+        button_font = cached_font(48)
         mouse_pos = pygame.mouse.get_pos()
         
         # Play button with rounded background
@@ -1171,7 +1747,7 @@ class Game:
         # Instructions with fade
         inst_alpha = min(255, int((self.menu_time - 0.5) * 200))
         if inst_alpha > 0:
-            inst_text = pygame.font.Font(None, 32).render("Arrow Keys/WASD: Move  |  Space: Jump  |  Shift: Run", True, (*WHITE, inst_alpha))
+            inst_text = cached_font(32).render("Arrow Keys/WASD: Move  |  Space: Jump  |  Shift: Run", True, (*WHITE, inst_alpha))
             inst_rect = inst_text.get_rect(center=(SCREEN_WIDTH//2, 500))
             self.screen.blit(inst_text, inst_rect)
         
@@ -1191,24 +1767,26 @@ class Game:
     def draw_playing(self):
         """Draw game during play"""
         # Draw background
-        self.level.draw_background(self.screen, self.camera)
-        
-        # Draw level
-        self.level.draw(self.screen, self.camera)
+        self.draw_background()
         
-        # Draw player
-        self.player.draw(self.screen, self.camera)
-        
-        # Draw particles
-        self.particles.draw(self.screen, self.camera)
+        # Record the world, then replay it onto the screen
+        draw_list = self.draw_list
+        self.level.draw(draw_list, self.camera)
+        draw_list.layer = LAYER_ACTORS
+        self.player.draw(draw_list, self.camera)
+        draw_list.layer = LAYER_PARTICLES
+        self.particles.draw(draw_list, self.camera)
+        draw_list.flush()
         
         # Draw HUD
         progress = min(1.0, self.player.x / self.level.goal_x)
         self.hud.draw(self.screen, self.score, self.coins, self.lives, self.level_time, progress)
     
     def draw_paused(self):
-        """Draw pause screen"""
-        self.draw_playing()
+        """Draw pause screen over the frozen last gameplay frame"""
+        if not self.presenter.still('paused'):
+            return
+        self.scenes.top.draw_backdrop(self.screen)
         
         # Overlay
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -1217,12 +1795,12 @@ class Game:
         self.screen.blit(overlay, (0, 0))
         
         # Pause menu
-        font = pygame.font.Font(None, 72)
+        font = cached_font(72)
         pause_text = font.render("PAUSED", True, WHITE)
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50))
         self.screen.blit(pause_text, pause_rect)
         
-        button_font = pygame.font.Font(None, 36)
+        button_font = cached_font(36)
         resume_text = button_font.render("P - Resume", True, WHITE)
         resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 20))
         self.screen.blit(resume_text, resume_rect)
@@ -1233,19 +1811,21 @@ class Game:
     
     def draw_game_over(self):
         """Draw game over screen"""
+        if not self.presenter.still('game_over'):
+            return
         self.screen.fill(BLACK)
         
-        font = pygame.font.Font(None, 84)
+        font = cached_font(84)
         game_over_text = font.render("GAME OVER", True, RED)
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 100))
         self.screen.blit(game_over_text, game_over_rect)
         
-        score_font = pygame.font.Font(None, 48)
+        score_font = cached_font(48)
         score_text = score_font.render(f"Final Score: {self.score}", True, WHITE)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 20))
         self.screen.blit(score_text, score_rect)
         
-        button_font = pygame.font.Font(None, 36)
+        button_font = cached_font(36)
         restart_text = button_font.render("R - Restart", True, WHITE)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 40))
         self.screen.blit(restart_text, restart_rect)
@@ -1282,7 +1862,7 @@ class Game:
         bounce = math.sin(time.time() * 3) * 8
         
         # Main title shadow
-        font = pygame.font.Font(None, 84)
+        font = cached_font(84)
         shadow_text = font.render("YOU WON!", True, BLACK)
         shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH//2 + 3, SCREEN_HEIGHT//2 - 150 + bounce))
         self.screen.blit(shadow_text, shadow_rect)
@@ -1293,19 +1873,19 @@ class Game:
         self.screen.blit(win_text, win_rect)
         
         # 100% Complete message
-        complete_font = pygame.font.Font(None, 42)
+        complete_font = cached_font(42)
         complete_text = complete_font.render("100% COMPLETE!", True, GREEN)
         complete_rect = complete_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 80))
         self.screen.blit(complete_text, complete_rect)
         
         # Game completion message
-        game_font = pygame.font.Font(None, 36)
+        game_font = cached_font(36)
         game_text = game_font.render("Escape Rush Complete!", True, WHITE)
         game_rect = game_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40))
         self.screen.blit(game_text, game_rect)
         
         # Final score
-        score_font = pygame.font.Font(None, 40)
+        score_font = cached_font(40)
         score_text = score_font.render(f"Final Score: {self.score:06d}", True, YELLOW)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 10))
         self.screen.blit(score_text, score_rect)
@@ -1316,13 +1896,13 @@ class Game:
         self.screen.blit(coins_text, coins_rect)
         
         # Congratulations message
-        congrats_font = pygame.font.Font(None, 32)
+        congrats_font = cached_font(32)
         congrats_text = congrats_font.render("Congratulations, Champion!", True, CYAN)
         congrats_rect = congrats_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 90))
         self.screen.blit(congrats_text, congrats_rect)
         
         # Menu option
-        button_font = pygame.font.Font(None, 28)
+        button_font = cached_font(28)
         menu_text = button_font.render("Press M - Return to Main Menu", True, WHITE)
         menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 140))
         self.screen.blit(menu_text, menu_rect)
@@ -1330,72 +1910,46 @@ class Game:
         # Draw celebration particles
         self.particles.draw(self.screen, self.camera)
     
+    def frame(self, poll):
+        """One pass of the main loop; False once the player quits
+        
+        `poll` supplies the frame's events, so a launcher hosting the game
+        can keep its own hotkeys.
+        """
+        running = True
+        dt = self.clock.tick(FPS) / 1000.0
+        self.quality.frame(self.clock.get_rawtime())
+        self.menu_time += dt
+        
+        # Handle events
+        for event in poll():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.presenter.invalidate()
+            elif not self.scenes.handle_event(event):
+                running = False
+        
+        # Only the scene on top ticks and draws
+        self.scenes.update(dt)
+        self.scenes.draw()
+        
+        self.presenter.present()
+        return running
+    
+    def close(self):
+        """Stop background work, leaving pygame up for whatever runs next"""
+        self.level.streamer.close()
+    
     def run(self):
         """Main game loop"""
-        running = True
-        
-        while running:
-            dt = self.clock.tick(FPS) / 1000.0
-            keys = pygame.key.get_pressed()
-            self.menu_time += dt
-            
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                
-                elif event.type == pygame.KEYDOWN:
-                    if self.state == 'menu':
-                        if event.key == pygame.K_SPACE:
-                            self.start_game()
-                        elif event.key == pygame.K_ESCAPE:
-                            running = False
-                    
-                    elif self.state == 'playing':
-                        if event.key == pygame.K_p:
-                            self.state = 'paused'
-                    
-                    elif self.state == 'paused':
-                        if event.key == pygame.K_p:
-                            self.state = 'playing'
-                        elif event.key == pygame.K_m:
-                            self.state = 'menu'
-                    
-                    elif self.state == 'game_over':
-                        if event.key == pygame.K_r:
-                            self.start_game()
-                        elif event.key == pygame.K_m:
-                            self.state = 'menu'
-                    
-                    elif self.state == 'win':
-                        if event.key == pygame.K_m:
-                            self.state = 'menu'
-            
-            # Update game state
-            if self.state == 'playing':
-                self.update_playing(dt, keys)
-            elif self.state == 'menu':
-                # Animate menu background
-                self.camera.x += 20 * dt
-                if self.camera.x > 1000:
-                    self.camera.x = 0
-            
-            # Draw everything
-            if self.state == 'menu':
-                self.draw_menu()
-            elif self.state == 'playing':
-                self.draw_playing()
-            elif self.state == 'paused':
-                self.draw_paused()
-            elif self.state == 'game_over':
-                self.draw_game_over()
-            elif self.state == 'win':
-                self.draw_win()
-            
-            pygame.display.flip()
+        while self.frame(pygame.event.get):
+            pass
         
+        self.close()
         pygame.quit()
 
 if __name__ == "__main__":
-    game = Game()
+    # Optional argument: a level compiled with levels.py
+    game = Game(sys.argv[1] if len(sys.argv) > 1 else None)
     game.run()
\ No newline at end of file
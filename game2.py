@@ -2,15 +2,40 @@ import pygame
 import math
 import random
 import time
-
-# Initialize Pygame
-pygame.init()
+import sprites
+from assets import surface_bytes
+from canvas import Canvas
+from drawlist import DrawList
+from glyphs import DIGITS, GlyphAtlas, cached_font, init_fonts
+from hud import HudLayer
+from particles import ParticleEngine
+from presenter import Presenter
+from scenes import Scene, SceneStack
+from quality import QualityGovernor
+from startup import open_game_window, timeline
 
 # Constants
 SCREEN_WIDTH = 1000
 SCREEN_HEIGHT = 700
 FPS = 60
 
+# Background detail per quality level (see quality.TIERS)
+GRADIENT_BANDS = (16, 4, 1)
+STAR_COUNTS = (40, 90, 150)
+
+# Animation steps baked into sprite sheets
+ROTATION_STEPS = 64  # Advanced enemy rotations
+PULSE_PHASES = 32    # Power-up glow cycle
+
+# Draw layers, bottom to top
+LAYER_SHIPS = 0
+LAYER_BULLETS = 1
+LAYER_PICKUPS = 2
+LAYER_PARTICLES = 3
+
+# HUD layout
+HEALTH_BAR_X = SCREEN_WIDTH - 220
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -25,86 +50,28 @@ GRAY = (128, 128, 128)
 DARK_BLUE = (20, 30, 60)
 GOLD = (255, 215, 0)
 
-class Particle:
-    """Individual particle for visual effects"""
-    def __init__(self, x, y, vx, vy, color, life, size=3):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.life = life
-        self.max_life = life
-        self.size = size
-        
-    def update(self, dt):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.life -= dt
-        
-    def draw(self, screen):
-        if self.life > 0:
-            alpha = self.life / self.max_life
-            size = max(1, int(self.size * alpha))
-            color = tuple(int(c * alpha) for c in self.color)
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), size)
-
-class ParticleSystem:
+class ParticleSystem(ParticleEngine):
     """Manages all particle effects"""
-    def __init__(self):
-        self.particles = []
-        
     def add_explosion(self, x, y, color=ORANGE, count=15):
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            self.particles.append(Particle(x, y, vx, vy, color, 1.0, random.randint(2, 6)))
-            
+        self.emit_radial(x, y, count, (50, 150), color, 1.0, (2, 6))
+        
     def add_trail(self, x, y, color=CYAN, count=3):
-        for _ in range(count):
-            vx = random.uniform(-20, 20)
-            vy = random.uniform(20, 60)
-            self.particles.append(Particle(x, y, vx, vy, color, 0.5, 2))
-            
+        self.emit_box(x, y, count, (-20, 20), (20, 60), color, 0.5, 2)
+        
     def add_pickup(self, x, y):
-        for _ in range(8):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(30, 80)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            color = random.choice([GOLD, YELLOW, WHITE])
-            self.particles.append(Particle(x, y, vx, vy, color, 0.8, 3))
-            
+        self.emit_radial(x, y, 8, (30, 80), [GOLD, YELLOW, WHITE], 0.8, 3)
+        
     def add_muzzle_flash(self, x, y):
-        for _ in range(5):
-            vx = random.uniform(-30, 30)
-            vy = random.uniform(-50, -20)
-            color = random.choice([WHITE, YELLOW, ORANGE])
-            self.particles.append(Particle(x, y, vx, vy, color, 0.2, random.randint(3, 6)))
-            
+        self.emit_box(x, y, 5, (-30, 30), (-50, -20), [WHITE, YELLOW, ORANGE], 0.2, (3, 6))
+        
     def add_hit_blast(self, x, y):
         """Add blast animation when bullet hits target"""
-        for _ in range(20):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(80, 200)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            color = random.choice([RED, ORANGE, YELLOW, WHITE])
-            self.particles.append(Particle(x, y, vx, vy, color, 0.8, random.randint(4, 8)))
-            
-    def update(self, dt):
-        self.particles = [p for p in self.particles if p.life > 0]
-        for particle in self.particles:
-            particle.update(dt)
-            
-    def draw(self, screen):
-        for particle in self.particles:
-            particle.draw(screen)
+        self.emit_radial(x, y, 20, (80, 200), [RED, ORANGE, YELLOW, WHITE], 0.8, (4, 8))
 
 class Player:
     """Player spaceship with smooth movement and animations"""
+    sheet = None  # SpriteSheet from bake_sprites()
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -183,18 +150,16 @@ class Player:
             return True
         return False
         
-    def draw(self, screen):
-        # Flash when invulnerable
-        if self.invulnerable and int(self.invuln_time * 15) % 2:
-            return
-            
+    @staticmethod
+    def render_frame(screen, index, x, y):
+        """Draw the ship centred on (x, y); used when baking"""
         # Ship body with gradient effect
         points = [
-            (self.x, self.y - 20),
-            (self.x - 12, self.y + 15),
-            (self.x - 6, self.y + 10),
-            (self.x + 6, self.y + 10),
-            (self.x + 12, self.y + 15)
+            (x, y - 20),
+            (x - 12, y + 15),
+            (x - 6, y + 10),
+            (x + 6, y + 10),
+            (x + 12, y + 15)
         ]
         
         # Shadow
@@ -206,11 +171,19 @@ class Player:
         pygame.draw.polygon(screen, CYAN, points, 2)
         
         # Cockpit
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y - 5)), 4)
-        pygame.draw.circle(screen, BLUE, (int(self.x), int(self.y - 5)), 4, 2)
+        pygame.draw.circle(screen, WHITE, (x, y - 5), 4)
+        pygame.draw.circle(screen, BLUE, (x, y - 5), 4, 2)
+        
+    def draw(self, screen):
+        # Flash when invulnerable
+        if self.invulnerable and int(self.invuln_time * 15) % 2:
+            return
+        self.sheet.blit(screen, 0, int(self.x), int(self.y))
 
 class Enemy:
     """Enemy with AI behavior"""
+    sheets = {}  # Enemy type -> SpriteSheet from bake_sprites()
+    
     def __init__(self, x, y, enemy_type="basic"):
         self.x = x
         self.y = y
@@ -271,35 +244,48 @@ class Enemy:
             return True
         return False
         
+    @staticmethod
+    def render_basic(screen, index, x, y):
+        """Draw the basic enemy centred on (x, y); used when baking"""
+        # Shadow
+        pygame.draw.circle(screen, (0, 0, 0, 80), (x + 2, y + 2), 12)
+        
+        # Basic enemy - red triangle
+        points = [
+            (x, y + 12),
+            (x - 10, y - 12),
+            (x + 10, y - 12)
+        ]
+        pygame.draw.polygon(screen, RED, points)
+        pygame.draw.polygon(screen, ORANGE, points, 2)
+        
+    @staticmethod
+    def render_advanced(screen, index, x, y):
+        """Draw the diamond at rotation bucket `index`; used when baking"""
+        # Shadow
+        pygame.draw.circle(screen, (0, 0, 0, 80), (x + 2, y + 2), 12)
+        
+        # Advanced enemy - rotating diamond
+        size = 12
+        angle = index * 2 * math.pi / ROTATION_STEPS
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        points = [
+            (x + cos_a * size, y + sin_a * size),
+            (x - sin_a * size, y + cos_a * size),
+            (x - cos_a * size, y - sin_a * size),
+            (x + sin_a * size, y - cos_a * size)
+        ]
+        pygame.draw.polygon(screen, PURPLE, points)
+        pygame.draw.polygon(screen, WHITE, points, 2)
+        
     def draw(self, screen):
         if not self.alive:
             return
-            
-        # Shadow
-        pygame.draw.circle(screen, (0, 0, 0, 80), (int(self.x + 2), int(self.y + 2)), self.width//2)
         
-        if self.type == "basic":
-            # Basic enemy - red triangle
-            points = [
-                (self.x, self.y + 12),
-                (self.x - 10, self.y - 12),
-                (self.x + 10, self.y - 12)
-            ]
-            pygame.draw.polygon(screen, RED, points)
-            pygame.draw.polygon(screen, ORANGE, points, 2)
-        else:
-            # Advanced enemy - rotating diamond
-            size = 12
-            cos_a = math.cos(self.angle)
-            sin_a = math.sin(self.angle)
-            points = [
-                (self.x + cos_a * size, self.y + sin_a * size),
-                (self.x - sin_a * size, self.y + cos_a * size),
-                (self.x - cos_a * size, self.y - sin_a * size),
-                (self.x + sin_a * size, self.y - cos_a * size)
-            ]
-            pygame.draw.polygon(screen, PURPLE, points)
-            pygame.draw.polygon(screen, WHITE, points, 2)
+        sheet = self.sheets[self.type]
+        index = round(self.angle * ROTATION_STEPS / (2 * math.pi)) % len(sheet)
+        sheet.blit(screen, index, int(self.x), int(self.y))
 
 class Bullet:
     """Bullet projectile"""
@@ -334,25 +320,27 @@ class Bullet:
                 # Player fire bullet - blue flame
                 # Outer flame
                 flame_size = 10 + math.sin(flame_time) * 3
-                pygame.draw.circle(screen, (0, 100, 255), (int(self.x), int(self.y)), int(flame_size))
+                screen.circle((0, 100, 255), (int(self.x), int(self.y)), int(flame_size))
                 # Middle flame
-                pygame.draw.circle(screen, (100, 200, 255), (int(self.x), int(self.y)), 6)
+                screen.circle((100, 200, 255), (int(self.x), int(self.y)), 6)
                 # Inner flame
-                pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), 3)
+                screen.circle(WHITE, (int(self.x), int(self.y)), 3)
                 # Fire trail
                 for i in range(3):
                     trail_y = self.y + (i + 1) * 8
                     trail_size = 4 - i
-                    pygame.draw.circle(screen, (0, 50 + i * 50, 255), (int(self.x), int(trail_y)), trail_size)
+                    screen.circle((0, 50 + i * 50, 255), (int(self.x), int(trail_y)), trail_size)
             else:
                 # Enemy fire bullet - red flame
                 flame_size = 8 + math.sin(flame_time) * 2
-                pygame.draw.circle(screen, RED, (int(self.x), int(self.y)), int(flame_size))
-                pygame.draw.circle(screen, ORANGE, (int(self.x), int(self.y)), 5)
-                pygame.draw.circle(screen, YELLOW, (int(self.x), int(self.y)), 2)
+                screen.circle(RED, (int(self.x), int(self.y)), int(flame_size))
+                screen.circle(ORANGE, (int(self.x), int(self.y)), 5)
+                screen.circle(YELLOW, (int(self.x), int(self.y)), 2)
 
 class PowerUp:
     """Collectible power-up"""
+    sheets = {}  # Power type -> SpriteSheet from bake_sprites()
+    
     def __init__(self, x, y, power_type="health"):
         self.x = x
         self.y = y
@@ -375,46 +363,202 @@ class PowerUp:
         if self.y > SCREEN_HEIGHT + 50:
             self.alive = False
             
-    def draw(self, screen):
-        if not self.alive:
-            return
-            
-        y_offset = math.sin(self.bob_time) * 3
-        glow_size = 15 + math.sin(self.glow_time) * 5
+    @staticmethod
+    def render_frame(screen, index, x, y, power_type):
+        """Draw pulse phase `index // 2`, with glow when `index` is odd; used when baking"""
+        glow_time = (index // 2) * 2 * math.pi / PULSE_PHASES
+        glow_size = 15 + math.sin(glow_time) * 5
         
         # Glow effect
-        color = GREEN if self.type == "health" else GOLD
-        pygame.draw.circle(screen, (*color, 100), (int(self.x), int(self.y + y_offset)), int(glow_size))
+        color = GREEN if power_type == "health" else GOLD
+        if index % 2:
+            pygame.draw.circle(screen, (*color, 100), (x, y), int(glow_size))
         
         # Main item
-        if self.type == "health":
+        if power_type == "health":
             # Big health cross with pulsing effect
-            pulse = 1.0 + math.sin(self.glow_time * 2) * 0.2
+            pulse = 1.0 + math.sin(glow_time * 2) * 0.2
             size = int(8 * pulse)
-            pygame.draw.rect(screen, GREEN, (self.x - size, self.y + y_offset - 2, size * 2, 4))
-            pygame.draw.rect(screen, GREEN, (self.x - 2, self.y + y_offset - size, 4, size * 2))
-            pygame.draw.rect(screen, WHITE, (self.x - size, self.y + y_offset - 2, size * 2, 4), 1)
-            pygame.draw.rect(screen, WHITE, (self.x - 2, self.y + y_offset - size, 4, size * 2), 1)
+            pygame.draw.rect(screen, GREEN, (x - size, y - 2, size * 2, 4))
+            pygame.draw.rect(screen, GREEN, (x - 2, y - size, 4, size * 2))
+            pygame.draw.rect(screen, WHITE, (x - size, y - 2, size * 2, 4), 1)
+            pygame.draw.rect(screen, WHITE, (x - 2, y - size, 4, size * 2), 1)
         else:
             # Score gem
             points = [
-                (self.x, self.y + y_offset - 8),
-                (self.x + 6, self.y + y_offset - 2),
-                (self.x, self.y + y_offset + 8),
-                (self.x - 6, self.y + y_offset - 2)
+                (x, y - 8),
+                (x + 6, y - 2),
+                (x, y + 8),
+                (x - 6, y - 2)
             ]
             pygame.draw.polygon(screen, GOLD, points)
             pygame.draw.polygon(screen, WHITE, points, 2)
+            
+    def draw(self, screen, glow=True):
+        if not self.alive:
+            return
+            
+        y_offset = math.sin(self.bob_time) * 3
+        phase = round(self.glow_time * PULSE_PHASES / (2 * math.pi)) % PULSE_PHASES
+        self.sheets[self.type].blit(screen, phase * 2 + bool(glow), int(self.x), int(self.y + y_offset))
+
+def bake_sprites():
+    """Bake the ship, both enemies at every rotation and the power-up pulse cycles"""
+    Player.sheet = sprites.bake('stellar_player', 1, (32, 42), (16, 21), Player.render_frame)
+    Enemy.sheets = {
+        'basic': sprites.bake('stellar_enemy_basic', 1, (32, 32), (16, 16), Enemy.render_basic),
+        'advanced': sprites.bake('stellar_enemy_advanced', ROTATION_STEPS, (32, 32), (16, 16), Enemy.render_advanced),
+    }
+    PowerUp.sheets = {
+        power_type: sprites.bake(f'stellar_powerup_{power_type}', PULSE_PHASES * 2, (44, 44), (22, 22),
+                                 lambda screen, index, x, y, power_type=power_type:
+                                 PowerUp.render_frame(screen, index, x, y, power_type))
+        for power_type in ("health", "score")
+    }
+
+def release_caches():
+    """Drop the baked sheets; returns the bytes they held"""
+    held = surface_bytes(Player.sheet, Enemy.sheets, PowerUp.sheets)
+    Player.sheet = None
+    Enemy.sheets = {}
+    PowerUp.sheets = {}
+    return held
+
+# Scenes
+class MenuScene(Scene):
+    """Title screen over the star field"""
+    name = "menu"
+    
+    def handle_event(self, event):
+        game = self.game
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RETURN:
+                game.state = "playing"
+                game._reset_game()
+            elif event.key == pygame.K_i:
+                game.state = "instructions"
+            elif event.key == pygame.K_ESCAPE or event.key == pygame.K_q:
+                return False
+        
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mouse_pos = pygame.mouse.get_pos()
+            
+            # Check button clicks
+            if 330 <= mouse_pos[1] <= 370:  # Play
+                game.state = "playing"
+                game._reset_game()
+            elif 400 <= mouse_pos[1] <= 440:  # Instructions
+                game.state = "instructions"
+            elif 470 <= mouse_pos[1] <= 510:  # Quit
+                return False
+        return True
+        
+    def update(self, dt):
+        self.game._update_stars(dt)
+        
+    def draw(self, screen):
+        self.game._draw_background()
+        self.game._draw_menu()
+
+class InstructionsScene(Scene):
+    """How-to-play panel over the frozen menu"""
+    name = "instructions"
+    overlay = True
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_RETURN):
+            self.game.state = "menu"
+        return True
+        
+    def draw(self, screen):
+        self.game._draw_instructions()
+
+class PlayScene(Scene):
+    """The battle itself"""
+    name = "playing"
+    
+    def handle_event(self, event):
+        game = self.game
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                bullet = game.player.shoot(game.particles)
+                if bullet:
+                    game.bullets.append(bullet)
+            elif event.key == pygame.K_ESCAPE:
+                game.state = "menu"
+        return True
+        
+    def update(self, dt):
+        self.game._update_playing(dt)
+        self.game._update_stars(dt)
+        
+    def draw(self, screen):
+        self.game._draw_background()
+        self.game._draw_playing()
+
+class GameOverScene(Scene):
+    """Final score panel over the frozen battle"""
+    name = "game_over"
+    overlay = True
+    
+    def handle_event(self, event):
+        game = self.game
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_r:
+                game.state = "playing"
+                game._reset_game()
+            elif event.key == pygame.K_ESCAPE:
+                game.state = "menu"
+        
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mouse_pos = pygame.mouse.get_pos()
+            if 430 <= mouse_pos[1] <= 470:  # Play Again
+                game.state = "playing"
+                game._reset_game()
+            elif 480 <= mouse_pos[1] <= 520:  # Main Menu
+                game.state = "menu"
+        return True
+        
+    def draw(self, screen):
+        self.game._draw_game_over()
+
+class VictoryScene(Scene):
+    """Mission accomplished"""
+    name = "victory"
+    
+    def handle_event(self, event):
+        game = self.game
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_r:
+                game.state = "playing"
+                game._reset_game()
+            elif event.key == pygame.K_ESCAPE:
+                game.state = "menu"
+        return True
+        
+    def update(self, dt):
+        self.game._update_stars(dt)
+        
+    def draw(self, screen):
+        self.game._draw_background()
+        self.game._draw_victory()
 
 class Game:
     """Main game class"""
     def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Stellar Defender - Space Shooter")
+        self.screen = open_game_window((SCREEN_WIDTH, SCREEN_HEIGHT), "Stellar Defender - Space Shooter")
         self.clock = pygame.time.Clock()
+        self.presenter = Presenter()
+        self.canvas = Canvas(self.screen)
+        self.draw_list = DrawList(self.screen)
+        self.button_hover = None  # Hovered game-over buttons, to redraw only when it changes
+        self.controls = pygame.key.get_pressed  # Held-key source; bots swap in their own
+        bake_sprites()
+        timeline.mark('sprites')
         
         # Game state
-        self.state = "menu"  # menu, playing, game_over, victory
+        self.scenes = SceneStack(self, self.screen, (MenuScene, InstructionsScene, PlayScene, GameOverScene, VictoryScene))
+        self.state = "menu"
         self.score = 0
         self.high_score = 0
         self.level = 1
@@ -426,7 +570,9 @@ class Game:
         self.enemies = []
         self.bullets = []
         self.powerups = []
+        self.quality = QualityGovernor(FPS)
         self.particles = ParticleSystem()
+        self.particles.governor = self.quality
         
         # Timers
         self.enemy_spawn_timer = 0
@@ -434,14 +580,31 @@ class Game:
         self.background_stars = self._generate_stars()
         
         # UI
-        self.font_large = pygame.font.Font(None, 72)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 32)
+        init_fonts()
+        self.font_large = cached_font(72)
+        self.font_medium = cached_font(48)
+        self.font_small = cached_font(32)
+        self.score_glyphs = GlyphAtlas(48, WHITE, DIGITS, ("Score: ",))
+        self.level_glyphs = GlyphAtlas(32, CYAN, DIGITS, ("Level: ",))
+        self.hud = HudLayer((SCREEN_WIDTH, 80), self._render_hud_panel)
+        self.hud_score = self.hud.add((20, 20, 300, 34), self._render_hud_score)
+        self.hud_level = self.hud.add((20, 50, 200, 24), self._render_hud_level)
+        self.hud_health = self.hud.add((HEALTH_BAR_X, 20, 200, 20), self._render_hud_health)
+        timeline.mark('font')
         
         # Menu animation
         self.menu_time = 0
         self.title_glow = 0
         
+    @property
+    def state(self):
+        """Name of the scene on top: menu, instructions, playing, game_over or victory"""
+        return self.scenes.name
+        
+    @state.setter
+    def state(self, name):
+        self.scenes.show(name)
+        
     def _generate_stars(self):
         """Generate shiny background stars"""
         stars = []
@@ -466,7 +629,8 @@ class Game:
                 
     def _draw_stars(self):
         """Draw shiny background stars"""
-        for star in self.background_stars:
+        tier = self.quality.tier
+        for star in self.background_stars[:STAR_COUNTS[tier.background_detail]]:
             # Twinkling effect
             twinkle = math.sin(star[6]) * 0.3 + 0.7
             brightness = int(255 * star[4] * twinkle)
@@ -480,22 +644,30 @@ class Game:
                 color = (brightness, brightness, brightness)
             
             # Draw star with glow
-            if star[2] >= 2:
+            if star[2] >= 2 and tier.glow:
                 # Glow effect for bigger stars
                 glow_size = star[2] + 2
                 glow_color = tuple(int(c * 0.3) for c in color)
-                pygame.draw.circle(self.screen, glow_color, (int(star[0]), int(star[1])), glow_size)
+                self.canvas.circle(glow_color, (int(star[0]), int(star[1])), glow_size)
             
-            pygame.draw.circle(self.screen, color, (int(star[0]), int(star[1])), star[2])
+            self.canvas.circle(color, (int(star[0]), int(star[1])), star[2])
             
+    def _draw_background(self):
+        """Gradient and star field at the tier's render scale, stretched over the window"""
+        self.canvas.set_scale(self.quality.tier.render_scale)
+        self._draw_gradient_bg()
+        self._draw_stars()
+        self.canvas.present()
+        
     def _draw_gradient_bg(self):
         """Draw gradient background"""
-        for y in range(SCREEN_HEIGHT):
+        band = max(GRADIENT_BANDS[self.quality.tier.background_detail], self.canvas.pixel)
+        for y in range(0, SCREEN_HEIGHT, band):
             ratio = y / SCREEN_HEIGHT
             r = int(10 * (1 - ratio) + 5 * ratio)
             g = int(15 * (1 - ratio) + 10 * ratio)
             b = int(40 * (1 - ratio) + 60 * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+            self.canvas.fill((r, g, b), (0, y, SCREEN_WIDTH, band))
             
     def _spawn_enemy(self):
         """Spawn new enemy"""
@@ -577,43 +749,34 @@ class Game:
                 else:
                     self.score += 500
                     
-    def _draw_hud(self):
-        """Draw heads-up display"""
+    def _render_hud_panel(self, surface):
         # Semi-transparent HUD background
-        hud_surface = pygame.Surface((SCREEN_WIDTH, 80))
-        hud_surface.set_alpha(150)
-        hud_surface.fill(DARK_BLUE)
-        self.screen.blit(hud_surface, (0, 0))
+        surface.fill((*DARK_BLUE, 150))
         
-        # Score
-        score_text = self.font_medium.render(f"Score: {self.score:06d}", True, WHITE)
-        self.screen.blit(score_text, (20, 20))
+        # Health bar background and label
+        pygame.draw.rect(surface, (100, 0, 0), (HEALTH_BAR_X, 20, 200, 20))
+        health_text = self.font_small.render("Health", True, WHITE)
+        surface.blit(health_text, (HEALTH_BAR_X, 20 - 25))
         
-        # Level
-        level_text = self.font_small.render(f"Level: {self.level}", True, CYAN)
-        self.screen.blit(level_text, (20, 50))
+    def _render_hud_score(self, surface, score):
+        self.score_glyphs.draw(surface, f"Score: {score:06d}", (20, 20))
         
-        # Health bar
-        bar_width = 200
-        bar_height = 20
-        bar_x = SCREEN_WIDTH - bar_width - 20
-        bar_y = 20
+    def _render_hud_level(self, surface, level):
+        self.level_glyphs.draw(surface, f"Level: {level}", (20, 50))
         
-        # Health bar background
-        pygame.draw.rect(self.screen, (100, 0, 0), (bar_x, bar_y, bar_width, bar_height))
+    def _render_hud_health(self, surface, value):
+        fill_width, color = value
+        pygame.draw.rect(surface, color, (HEALTH_BAR_X, 20, fill_width, 20))
+        pygame.draw.rect(surface, WHITE, (HEALTH_BAR_X, 20, 200, 20), 2)
         
-        # Health bar fill
+    def _draw_hud(self):
+        """Draw heads-up display from the cached layer"""
         health_ratio = self.player.health / self.player.max_health
-        fill_width = int(bar_width * health_ratio)
         color = GREEN if health_ratio > 0.6 else ORANGE if health_ratio > 0.3 else RED
-        pygame.draw.rect(self.screen, color, (bar_x, bar_y, fill_width, bar_height))
-        
-        # Health bar border
-        pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
-        
-        # Health text
-        health_text = self.font_small.render("Health", True, WHITE)
-        self.screen.blit(health_text, (bar_x, bar_y - 25))
+        self.hud.set(self.hud_score, self.score)
+        self.hud.set(self.hud_level, self.level)
+        self.hud.set(self.hud_health, (int(200 * health_ratio), color))
+        self.hud.draw(self.screen)
         
     def _draw_menu(self):
         """Draw main menu"""
@@ -625,9 +788,10 @@ class Game:
         title_y = 150 + math.sin(self.menu_time) * 10
         
         # Title glow
-        for i in range(int(glow_size)):
+        glow_layers = range(int(glow_size)) if self.quality.tier.glow else ()
+        for i in glow_layers:
             alpha = 50 - i * 8
-            glow_font = pygame.font.Font(None, 84 + i * 2)
+            glow_font = cached_font(84 + i * 2)
             glow_text = glow_font.render("STELLAR DEFENDER", True, (*CYAN, alpha))
             glow_rect = glow_text.get_rect(center=(SCREEN_WIDTH//2, title_y))
             self.screen.blit(glow_text, glow_rect)
@@ -673,7 +837,11 @@ class Game:
             self.screen.blit(high_score_text, high_score_rect)
             
     def _draw_instructions(self):
-        """Draw instructions overlay"""
+        """Draw instructions overlay over the frozen menu"""
+        if not self.presenter.still('instructions'):
+            return
+        self.scenes.top.draw_backdrop(self.screen)
+        
         # Semi-transparent background
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         overlay.set_alpha(200)
@@ -710,51 +878,57 @@ class Game:
             self.screen.blit(text, text_rect)
             
     def _draw_game_over(self):
-        """Draw game over screen"""
-        # Semi-transparent background
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Game over panel
-        panel_rect = pygame.Rect(200, 150, SCREEN_WIDTH - 400, SCREEN_HEIGHT - 300)
-        pygame.draw.rect(self.screen, DARK_BLUE, panel_rect, border_radius=20)
-        pygame.draw.rect(self.screen, RED, panel_rect, 3, border_radius=20)
-        
-        # Game over text
-        game_over_text = self.font_large.render("GAME OVER", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, 220))
-        self.screen.blit(game_over_text, game_over_rect)
-        
-        # Final score
-        score_text = self.font_medium.render(f"Final Score: {self.score:06d}", True, WHITE)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, 300))
-        self.screen.blit(score_text, score_rect)
-        
-        # Level reached
-        level_text = self.font_small.render(f"Level Reached: {self.level}", True, CYAN)
-        level_rect = level_text.get_rect(center=(SCREEN_WIDTH//2, 340))
-        self.screen.blit(level_text, level_rect)
-        
-        # New high score
-        if self.score > self.high_score:
-            new_high_text = self.font_medium.render("NEW HIGH SCORE!", True, GOLD)
-            new_high_rect = new_high_text.get_rect(center=(SCREEN_WIDTH//2, 380))
-            self.screen.blit(new_high_text, new_high_rect)
+        """Draw game over screen over the frozen last frame"""
+        if self.presenter.still('game_over'):
+            self.scenes.top.draw_backdrop(self.screen)
+            
+            # Semi-transparent background
+            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            overlay.set_alpha(180)
+            overlay.fill(BLACK)
+            self.screen.blit(overlay, (0, 0))
+            
+            # Game over panel
+            panel_rect = pygame.Rect(200, 150, SCREEN_WIDTH - 400, SCREEN_HEIGHT - 300)
+            pygame.draw.rect(self.screen, DARK_BLUE, panel_rect, border_radius=20)
+            pygame.draw.rect(self.screen, RED, panel_rect, 3, border_radius=20)
             
-        # Buttons
+            # Game over text
+            game_over_text = self.font_large.render("GAME OVER", True, RED)
+            game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, 220))
+            self.screen.blit(game_over_text, game_over_rect)
+            
+            # Final score
+            score_text = self.font_medium.render(f"Final Score: {self.score:06d}", True, WHITE)
+            score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, 300))
+            self.screen.blit(score_text, score_rect)
+            
+            # Level reached
+            level_text = self.font_small.render(f"Level Reached: {self.level}", True, CYAN)
+            level_rect = level_text.get_rect(center=(SCREEN_WIDTH//2, 340))
+            self.screen.blit(level_text, level_rect)
+            
+            # New high score
+            if self.score > self.high_score:
+                new_high_text = self.font_medium.render("NEW HIGH SCORE!", True, GOLD)
+                new_high_rect = new_high_text.get_rect(center=(SCREEN_WIDTH//2, 380))
+                self.screen.blit(new_high_text, new_high_rect)
+            self.button_hover = None
+        
+        # Buttons, repainted only when the hover changes
         mouse_pos = pygame.mouse.get_pos()
         
         buttons = [
             ("PLAY AGAIN", 450),
             ("MAIN MENU", 500)
         ]
+        button_rects = [pygame.Rect(SCREEN_WIDTH//2 - 100, y - 20, 200, 40) for _, y in buttons]
+        button_hover = tuple(button_rect.collidepoint(mouse_pos) for button_rect in button_rects)
+        if button_hover == self.button_hover:
+            return
+        self.button_hover = button_hover
         
-        for text, y in buttons:
-            button_rect = pygame.Rect(SCREEN_WIDTH//2 - 100, y - 20, 200, 40)
-            hover = button_rect.collidepoint(mouse_pos)
-            
+        for (text, y), button_rect, hover in zip(buttons, button_rects, button_hover):
             color = (100, 150, 255) if hover else (50, 50, 100)
             pygame.draw.rect(self.screen, color, button_rect, border_radius=10)
             pygame.draw.rect(self.screen, WHITE, button_rect, 2, border_radius=10)
@@ -763,6 +937,7 @@ class Game:
             button_text = self.font_small.render(text, True, text_color)
             text_rect = button_text.get_rect(center=button_rect.center)
             self.screen.blit(button_text, text_rect)
+            self.presenter.mark(button_rect)
             
     def _reset_game(self):
         """Reset game state for new game"""
@@ -770,7 +945,7 @@ class Game:
         self.enemies = []
         self.bullets = []
         self.powerups = []
-        self.particles = ParticleSystem()
+        self.particles.clear()
         self.score = 0
         self.level = 1
         self.difficulty = 1.0
@@ -781,171 +956,106 @@ class Game:
         """Handle pygame events"""
         if event.type == pygame.QUIT:
             return False
+        
+        elif event.type == pygame.WINDOWEXPOSED:
+            self.presenter.invalidate()
+            return True
             
-        elif event.type == pygame.KEYDOWN:
-            if self.state == "menu":
-                if event.key == pygame.K_RETURN:
-                    self.state = "playing"
-                    self._reset_game()
-                elif event.key == pygame.K_i:
-                    self.state = "instructions"
-                elif event.key == pygame.K_ESCAPE or event.key == pygame.K_q:
-                    return False
-                    
-            elif self.state == "instructions":
-                if event.key == pygame.K_ESCAPE or event.key == pygame.K_RETURN:
-                    self.state = "menu"
-                    
-            elif self.state == "playing":
-                if event.key == pygame.K_SPACE:
-                    bullet = self.player.shoot(self.particles)
-                    if bullet:
-                        self.bullets.append(bullet)
-                elif event.key == pygame.K_ESCAPE:
-                    self.state = "menu"
-                    
-            elif self.state == "victory":
-                if event.key == pygame.K_r:
-                    self.state = "playing"
-                    self._reset_game()
-                elif event.key == pygame.K_ESCAPE:
-                    self.state = "menu"
-                    
-            elif self.state == "game_over":
-                if event.key == pygame.K_r:
-                    self.state = "playing"
-                    self._reset_game()
-                elif event.key == pygame.K_ESCAPE:
-                    self.state = "menu"
-                    
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mouse_pos = pygame.mouse.get_pos()
-            
-            if self.state == "menu":
-                # Check button clicks
-                if 330 <= mouse_pos[1] <= 370:  # Play
-                    self.state = "playing"
-                    self._reset_game()
-                elif 400 <= mouse_pos[1] <= 440:  # Instructions
-                    self.state = "instructions"
-                elif 470 <= mouse_pos[1] <= 510:  # Quit
-                    return False
-                    
-            elif self.state == "game_over":
-                if 430 <= mouse_pos[1] <= 470:  # Play Again
-                    self.state = "playing"
-                    self._reset_game()
-                elif 480 <= mouse_pos[1] <= 520:  # Main Menu
-                    self.state = "menu"
-                    
-        return True
+        return self.scenes.handle_event(event)
         
     def update(self, dt):
-        """Update game logic"""
-        if self.state == "playing":
-            keys = pygame.key.get_pressed()
+        """Update game logic; only the scene on top ticks"""
+        self.scenes.update(dt)
+        
+    def _update_playing(self, dt):
+        """Update the battle"""
+        keys = self.controls()
+        
+        # Update player
+        self.player.update(dt, keys, self.particles)
+        
+        # Update enemies
+        for enemy in self.enemies[:]:
+            enemy.update(dt, self.player, self.bullets, self.particles)
+            if not enemy.alive:
+                self.enemies.remove(enemy)
+        
+        # Update bullets
+        for bullet in self.bullets[:]:
+            bullet.update(dt)
+            if not bullet.alive:
+                self.bullets.remove(bullet)
+        
+        # Update power-ups
+        for powerup in self.powerups[:]:
+            powerup.update(dt)
+            if not powerup.alive:
+                self.powerups.remove(powerup)
+        
+        # Update particles
+        self.particles.update(dt)
+        
+        # Spawn enemies
+        self.enemy_spawn_timer += dt
+        spawn_rate = max(0.5, 2.0 - self.difficulty * 0.3)
+        if self.enemy_spawn_timer > spawn_rate:
+            self.enemy_spawn_timer = 0
+            self._spawn_enemy()
             
-            # Update player
-            self.player.update(dt, keys, self.particles)
+        # Spawn power-ups more frequently
+        self.powerup_spawn_timer += dt
+        if self.powerup_spawn_timer > random.uniform(3, 6):  # Much more frequent
+            self.powerup_spawn_timer = 0
+            self._spawn_powerup()
             
-            # Update enemies
-            for enemy in self.enemies[:]:
-                enemy.update(dt, self.player, self.bullets, self.particles)
-                if not enemy.alive:
-                    self.enemies.remove(enemy)
-                    
-            # Update bullets
-            for bullet in self.bullets[:]:
-                bullet.update(dt)
-                if not bullet.alive:
-                    self.bullets.remove(bullet)
-                    
-            # Update power-ups
-            for powerup in self.powerups[:]:
-                powerup.update(dt)
-                if not powerup.alive:
-                    self.powerups.remove(powerup)
-                    
-            # Update particles
-            self.particles.update(dt)
-            
-            # Spawn enemies
-            self.enemy_spawn_timer += dt
-            spawn_rate = max(0.5, 2.0 - self.difficulty * 0.3)
-            if self.enemy_spawn_timer > spawn_rate:
-                self.enemy_spawn_timer = 0
-                self._spawn_enemy()
-                
-            # Spawn power-ups more frequently
-            self.powerup_spawn_timer += dt
-            if self.powerup_spawn_timer > random.uniform(3, 6):  # Much more frequent
-                self.powerup_spawn_timer = 0
-                self._spawn_powerup()
+        # Update difficulty
+        self._update_difficulty()
+        
+        # Check collisions
+        self._check_collisions()
+        
+        # Check game over
+        if self.player.health <= 0:
+            self.state = "game_over"
+            if self.score > self.high_score:
+                self.high_score = self.score
                 
-            # Update difficulty
-            self._update_difficulty()
-            
-            # Check collisions
-            self._check_collisions()
-            
-            # Check game over
-            if self.player.health <= 0:
-                self.state = "game_over"
-                if self.score > self.high_score:
-                    self.high_score = self.score
-                    
-            # Check victory condition - win at level 4
-            if self.level >= self.victory_level:
-                self.state = "victory"
-                if self.score > self.high_score:
-                    self.high_score = self.score
-                    
-        # Update background
-        self._update_stars(dt)
+        # Check victory condition - win at level 4
+        if self.level >= self.victory_level:
+            self.state = "victory"
+            if self.score > self.high_score:
+                self.high_score = self.score
         
     def draw(self):
         """Draw everything"""
-        # Background
-        self._draw_gradient_bg()
-        self._draw_stars()
+        self.scenes.draw()
         
-        if self.state == "menu":
-            self._draw_menu()
-        elif self.state == "instructions":
-            self._draw_instructions()
-        elif self.state == "playing":
-            # Game objects
-            self.player.draw(self.screen)
-            
-            for enemy in self.enemies:
-                enemy.draw(self.screen)
-                
-            for bullet in self.bullets:
-                bullet.draw(self.screen)
-                
-            for powerup in self.powerups:
-                powerup.draw(self.screen)
-                
-            # Effects
-            self.particles.draw(self.screen)
-            
-            # UI
-            self._draw_hud()
-            
-        elif self.state == "game_over":
-            # Still draw game objects faded
-            for enemy in self.enemies:
-                enemy.draw(self.screen)
-            for bullet in self.bullets:
-                bullet.draw(self.screen)
-            self.particles.draw(self.screen)
+    def _draw_playing(self):
+        """Draw the battle over the background"""
+        # Game objects, recorded and then replayed onto the screen
+        draw_list = self.draw_list
+        draw_list.layer = LAYER_SHIPS
+        self.player.draw(draw_list)
+        
+        for enemy in self.enemies:
+            enemy.draw(draw_list)
             
-            self._draw_game_over()
+        draw_list.layer = LAYER_BULLETS
+        for bullet in self.bullets:
+            bullet.draw(draw_list)
             
-        elif self.state == "victory":
-            # Draw victory screen
-            self._draw_victory()
+        draw_list.layer = LAYER_PICKUPS
+        for powerup in self.powerups:
+            powerup.draw(draw_list, self.quality.tier.glow)
             
+        # Effects
+        draw_list.layer = LAYER_PARTICLES
+        self.particles.draw(draw_list)
+        draw_list.flush()
+        
+        # UI
+        self._draw_hud()
+        
     def _draw_victory(self):
         """Draw victory screen"""
         # Celebration background with particles
@@ -986,26 +1096,31 @@ class Game:
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, 450))
         self.screen.blit(restart_text, restart_rect)
     
-    def run(self):
-        """Main game loop"""
+    def frame(self, poll):
+        """One pass of the main loop; False once the player quits"""
         running = True
+        dt = self.clock.tick(FPS) / 1000.0
+        self.quality.frame(self.clock.get_rawtime())
         
-        while running:
-            dt = self.clock.tick(FPS) / 1000.0
-            
-            # Handle events
-            for event in pygame.event.get():
-                if not self.handle_events(event):
-                    running = False
-                    
-            # Update
-            self.update(dt)
-            
-            # Draw
-            self.draw()
-            
-            # Display
-            pygame.display.flip()
+        # Handle events
+        for event in poll():
+            if not self.handle_events(event):
+                running = False
+        
+        # Update
+        self.update(dt)
+        
+        # Draw
+        self.draw()
+        
+        # Display
+        self.presenter.present()
+        return running
+        
+    def run(self):
+        """Main game loop"""
+        while self.frame(pygame.event.get):
+            pass
             
         pygame.quit()
 
@@ -2,16 +2,43 @@ import pygame
 import math
 import random
 import time
-from typing import List, Tuple
-
-# Initialize Pygame
-pygame.init()
+import heapq
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from assets import surface_bytes
+from canvas import Canvas
+from drawlist import DrawList
+from glyphs import DIGITS, GlyphAtlas, cached_font, init_fonts
+from hud import HudLayer
+from keystate import HeldKeys
+from particles import ParticleEngine
+from presenter import Presenter
+from scenes import Scene, SceneStack
+from quality import QualityGovernor
+from startup import open_game_window, timeline
 
 # Constants
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
 GRID_SIZE = 20
+GRID_COLS = SCREEN_WIDTH // GRID_SIZE
+GRID_ROWS = SCREEN_HEIGHT // GRID_SIZE
+
+# Arena mode
+ARENA_RIVALS = 8
+MAX_ARENA_RIVALS = 32
+MAX_ARENA_ORBS = 60
+ORB_SPAWN_ATTEMPTS = 200
+GRADIENT_BANDS = (16, 4, 1)  # Background gradient band height per quality detail level
+RIVAL_RESPAWN_TIME = 3.0
+
+# Draw layers, bottom to top
+LAYER_ORBS = 0
+LAYER_ORB_CORES = 1
+LAYER_PICKUPS = 2
+LAYER_SERPENTS = 3
+LAYER_PARTICLES = 4
 
 # Colors
 BLACK = (0, 0, 0)
@@ -24,63 +51,16 @@ DARK_BLUE = (10, 20, 40)
 GLASS_BLUE = (50, 100, 200, 120)
 QUANTUM_GOLD = (255, 215, 0)
 
-class Particle:
-    """Individual particle for visual effects"""
-    def __init__(self, x: float, y: float, vx: float, vy: float, color: Tuple[int, int, int], life: float, size: float = 3):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.life = life
-        self.max_life = life
-        self.size = size
-        
-    def update(self, dt: float):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.life -= dt
-        
-    def draw(self, screen: pygame.Surface):
-        if self.life > 0:
-            alpha = self.life / self.max_life
-            size = max(1, int(self.size * alpha))
-            color = tuple(int(c * alpha) for c in self.color)
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), size)
-
-class ParticleSystem:
+class ParticleSystem(ParticleEngine):
     """Manages all particle effects"""
-    def __init__(self):
-        self.particles: List[Particle] = []
-        
     def add_burst(self, x: float, y: float, color: Tuple[int, int, int] = NEON_CYAN, count: int = 15):
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 200)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            self.particles.append(Particle(x, y, vx, vy, color, random.uniform(0.5, 1.5), random.uniform(2, 6)))
-            
+        self.emit_radial(x, y, count, (50, 200), color, (0.5, 1.5), (2.0, 6.0))
+        
     def add_trail(self, x: float, y: float, color: Tuple[int, int, int] = NEON_PURPLE):
-        for _ in range(3):
-            vx = random.uniform(-30, 30)
-            vy = random.uniform(-30, 30)
-            self.particles.append(Particle(x, y, vx, vy, color, 0.8, 4))
-            
-    def add_ambient(self, x: float, y: float):
-        vx = random.uniform(-20, 20)
-        vy = random.uniform(-20, 20)
-        color = random.choice([NEON_CYAN, NEON_PURPLE, NEON_GREEN])
-        self.particles.append(Particle(x, y, vx, vy, color, 2.0, 2))
+        self.emit_box(x, y, 3, (-30, 30), (-30, 30), color, 0.8, 4)
         
-    def update(self, dt: float):
-        self.particles = [p for p in self.particles if p.life > 0]
-        for particle in self.particles:
-            particle.update(dt)
-            
-    def draw(self, screen: pygame.Surface):
-        for particle in self.particles:
-            particle.draw(screen)
+    def add_ambient(self, x: float, y: float):
+        self.emit_box(x, y, 1, (-20, 20), (-20, 20), [NEON_CYAN, NEON_PURPLE, NEON_GREEN], 2.0, 2)
 
 class QuantumOrb:
     """Futuristic collectible orb"""
@@ -95,17 +75,18 @@ class QuantumOrb:
         self.pulse_time += dt * 4
         self.spin_angle += dt * 3
         
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface, glow: bool = True):
         if self.collected:
             return
             
         pulse = 1.0 + math.sin(self.pulse_time) * 0.3
         
         # Outer glow
-        glow_size = int(25 * pulse)
-        glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (*QUANTUM_GOLD, 30), (glow_size, glow_size), glow_size)
-        screen.blit(glow_surface, (self.x - glow_size, self.y - glow_size))
+        if glow:
+            glow_size = int(25 * pulse)
+            glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surface, (*QUANTUM_GOLD, 30), (glow_size, glow_size), glow_size)
+            screen.blit(glow_surface, (self.x - glow_size, self.y - glow_size))
         
         # Main orb layers
         for i in range(3):
@@ -116,10 +97,12 @@ class QuantumOrb:
             pygame.draw.circle(orb_surface, color, (size, size), size)
             screen.blit(orb_surface, (self.x - size, self.y - size))
             
-        # Spinning core
+        # Spinning core, on its own layer so every orb's blits go out in one batch
         core_x = self.x + math.cos(self.spin_angle) * 3
         core_y = self.y + math.sin(self.spin_angle) * 3
-        pygame.draw.circle(screen, WHITE, (int(core_x), int(core_y)), 3)
+        layer, screen.layer = screen.layer, LAYER_ORB_CORES
+        screen.circle(WHITE, (int(core_x), int(core_y)), 3)
+        screen.layer = layer
 
 class PowerUp:
     """Special power-up items"""
@@ -140,7 +123,7 @@ class PowerUp:
     def update(self, dt: float):
         self.time += dt * 2
         
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface, glow: bool = True):
         if self.collected:
             return
             
@@ -148,21 +131,22 @@ class PowerUp:
         pulse = 1.0 + math.sin(self.time) * 0.4
         
         # Aura
-        aura_size = int(20 * pulse)
-        aura_surface = pygame.Surface((aura_size * 2, aura_size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(aura_surface, (*color, 50), (aura_size, aura_size), aura_size)
-        screen.blit(aura_surface, (self.x - aura_size, self.y - aura_size))
+        if glow:
+            aura_size = int(20 * pulse)
+            aura_surface = pygame.Surface((aura_size * 2, aura_size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(aura_surface, (*color, 50), (aura_size, aura_size), aura_size)
+            screen.blit(aura_surface, (self.x - aura_size, self.y - aura_size))
         
         # Main shape
         size = int(12 * pulse)
         if self.type == 'speed':
             # Triangle
             points = [(self.x + size, self.y), (self.x - size//2, self.y - size), (self.x - size//2, self.y + size)]
-            pygame.draw.polygon(screen, color, points)
+            screen.polygon(color, points)
         elif self.type == 'slow':
             # Diamond
             points = [(self.x, self.y - size), (self.x + size, self.y), (self.x, self.y + size), (self.x - size, self.y)]
-            pygame.draw.polygon(screen, color, points)
+            screen.polygon(color, points)
         elif self.type == 'shield':
             # Hexagon
             points = []
@@ -171,7 +155,7 @@ class PowerUp:
                 px = self.x + math.cos(angle) * size
                 py = self.y + math.sin(angle) * size
                 points.append((px, py))
-            pygame.draw.polygon(screen, color, points)
+            screen.polygon(color, points)
         else:  # multi
             # Star
             points = []
@@ -181,7 +165,7 @@ class PowerUp:
                 px = self.x + math.cos(angle) * radius
                 py = self.y + math.sin(angle) * radius
                 points.append((px, py))
-            pygame.draw.polygon(screen, color, points)
+            screen.polygon(color, points)
 
 class SnakeSegment:
     """Individual snake segment with smooth positioning"""
@@ -210,6 +194,12 @@ class QuantumSerpent:
         self.trail_positions = []
         self.last_turn_time = 0
         
+        # AI-driven serpents snap to lane centres on turns and skip cosmetic effects
+        self.snap_to_lanes = False
+        self.effects = True
+        # Where a lane-snapped head turned, oldest first; its body is laid along these
+        self.bends: Deque[Tuple[float, float]] = deque([(x, y)])
+        
         # Power-up effects
         self.speed_boost_time = 0
         self.slow_time = 0
@@ -232,7 +222,11 @@ class QuantumSerpent:
         if new_direction != self.direction:
             self.direction = new_direction
             self.last_turn_time = time.time()
-            particles.add_burst(self.segments[0].x, self.segments[0].y, NEON_CYAN, 8)
+            if self.snap_to_lanes:
+                self._snap_head_to_lane()
+                self.bends.append((self.segments[0].x, self.segments[0].y))
+            if self.effects:
+                particles.add_burst(self.segments[0].x, self.segments[0].y, NEON_CYAN, 8)
             
         # Update power-up effects
         self.speed_boost_time = max(0, self.speed_boost_time - dt)
@@ -253,28 +247,72 @@ class QuantumSerpent:
         head.y += self.direction.y * current_speed * dt
         
         # Update trail
-        self.trail_positions.append((head.x, head.y, time.time()))
-        self.trail_positions = [(x, y, t) for x, y, t in self.trail_positions if time.time() - t < 0.5]
+        if self.effects:
+            self.trail_positions.append((head.x, head.y, time.time()))
+            self.trail_positions = [(x, y, t) for x, y, t in self.trail_positions if time.time() - t < 0.5]
+        
+        # Update segments to follow smoothly; on lanes, exactly along the head's path
+        if self.snap_to_lanes:
+            self._follow_bends()
+        else:
+            for i in range(1, len(self.segments)):
+                prev_segment = self.segments[i - 1]
+                segment = self.segments[i]
+                
+                # Calculate target position
+                dx = prev_segment.x - segment.x
+                dy = prev_segment.y - segment.y
+                distance = math.sqrt(dx * dx + dy * dy)
+                
+                if distance > GRID_SIZE:
+                    target_x = prev_segment.x - (dx / distance) * GRID_SIZE
+                    target_y = prev_segment.y - (dy / distance) * GRID_SIZE
+                    segment.update(dt, target_x, target_y)
         
-        # Update segments to follow smoothly
-        for i in range(1, len(self.segments)):
-            prev_segment = self.segments[i - 1]
-            segment = self.segments[i]
-            
-            # Calculate target position
-            dx = prev_segment.x - segment.x
-            dy = prev_segment.y - segment.y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance > GRID_SIZE:
-                target_x = prev_segment.x - (dx / distance) * GRID_SIZE
-                target_y = prev_segment.y - (dy / distance) * GRID_SIZE
-                segment.update(dt, target_x, target_y)
-            
         # Add trail particles
-        if random.random() < 0.3:
+        if self.effects and random.random() < 0.3:
             particles.add_trail(head.x, head.y)
             
+    def _follow_bends(self):
+        """Lay the body GRID_SIZE apart along the head's path, so it never cuts a corner"""
+        segments = self.segments
+        bends = self.bends
+        head = segments[0]
+        x, y = head.x, head.y        # Start of the path piece being walked
+        index = len(bends) - 1
+        bx, by = bends[index]        # Its far end, towards the tail
+        length = abs(bx - x) + abs(by - y)
+        walked = 0.0                 # Path distance from the head to (x, y)
+        for i in range(1, len(segments)):
+            distance = i * GRID_SIZE
+            while distance > walked + length and index > 0:
+                walked += length
+                x, y = bx, by
+                index -= 1
+                bx, by = bends[index]
+                length = abs(bx - x) + abs(by - y)
+            segment = segments[i]
+            if distance >= walked + length:
+                # Newly grown segments wait at the tail until the path is long enough
+                segment.x, segment.y = bx, by
+            else:
+                t = (distance - walked) / length
+                segment.x = x + (bx - x) * t
+                segment.y = y + (by - y) * t
+        
+        # Bends behind the tail are no longer needed, and the path now ends at the tail,
+        # which is where a grown segment appears
+        for _ in range(index):
+            bends.popleft()
+        tail = segments[-1]
+        bends[0] = (tail.x, tail.y)
+            
+    def _snap_head_to_lane(self):
+        """Centre the head on its grid cell so turns stay on lane lines"""
+        head = self.segments[0]
+        head.x = int(head.x // GRID_SIZE) * GRID_SIZE + GRID_SIZE / 2
+        head.y = int(head.y // GRID_SIZE) * GRID_SIZE + GRID_SIZE / 2
+        
     def grow(self):
         """Add a new segment to the snake"""
         if len(self.segments) > 0:
@@ -306,7 +344,7 @@ class QuantumSerpent:
         head = self.segments[0]
         return (int(head.x // GRID_SIZE), int(head.y // GRID_SIZE))
         
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface, glow: bool = True):
         # Draw trail
         current_time = time.time()
         for i, (x, y, t) in enumerate(self.trail_positions):
@@ -338,17 +376,18 @@ class QuantumSerpent:
                 glow_color = (*color, 80)
                 
             # Glow effect
-            glow_size = size + 8
-            glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, glow_color, (glow_size, glow_size), glow_size)
-            screen.blit(glow_surface, (segment.x - glow_size, segment.y - glow_size))
+            if glow:
+                glow_size = size + 8
+                glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(glow_surface, glow_color, (glow_size, glow_size), glow_size)
+                screen.blit(glow_surface, (segment.x - glow_size, segment.y - glow_size))
             
             # Main segment
-            pygame.draw.circle(screen, color, (int(segment.x), int(segment.y)), size)
+            screen.circle(color, (int(segment.x), int(segment.y)), size)
             
             # Inner highlight
             highlight_size = max(2, size // 3)
-            pygame.draw.circle(screen, WHITE, (int(segment.x), int(segment.y)), highlight_size)
+            screen.circle(WHITE, (int(segment.x), int(segment.y)), highlight_size)
             
             # Snake eyes on head
             if is_head:
@@ -372,11 +411,11 @@ class QuantumSerpent:
                     screen.blit(eye_glow_surface, (eye_x - 6, eye_y - 6))
                     
                     # Eye base
-                    pygame.draw.circle(screen, WHITE, (int(eye_x), int(eye_y)), 4)
+                    screen.circle(WHITE, (int(eye_x), int(eye_y)), 4)
                     # Pupil
-                    pygame.draw.circle(screen, NEON_CYAN, (int(eye_x), int(eye_y)), 2)
+                    screen.circle(NEON_CYAN, (int(eye_x), int(eye_y)), 2)
                     # Eye shine
-                    pygame.draw.circle(screen, WHITE, (int(eye_x - 1), int(eye_y - 1)), 1)
+                    screen.circle(WHITE, (int(eye_x - 1), int(eye_y - 1)), 1)
             
         # Draw power-up effects
         if self.shield_time > 0:
@@ -387,15 +426,701 @@ class QuantumSerpent:
             pygame.draw.circle(shield_surface, (*NEON_CYAN, 60), (shield_size, shield_size), shield_size, 3)
             screen.blit(shield_surface, (head.x - shield_size, head.y - shield_size))
 
+class DirectionKeys(HeldKeys):
+    """Key state that holds down a single direction key, or none"""
+    DIRECTION_KEYS = {
+        (-1, 0): pygame.K_LEFT,
+        (1, 0): pygame.K_RIGHT,
+        (0, -1): pygame.K_UP,
+        (0, 1): pygame.K_DOWN
+    }
+    
+    def __init__(self, direction: Optional[Tuple[int, int]] = None):
+        key = self.DIRECTION_KEYS.get(direction)
+        super().__init__(() if key is None else (key,))
+
+def neighbor_table(cols: int, rows: int) -> List[List[int]]:
+    """4-connected neighbours of every flat cell index"""
+    table = []
+    for cell in range(cols * rows):
+        col, row = cell % cols, cell // cols
+        adjacent = []
+        if col > 0:
+            adjacent.append(cell - 1)
+        if col < cols - 1:
+            adjacent.append(cell + 1)
+        if row > 0:
+            adjacent.append(cell - cols)
+        if row < rows - 1:
+            adjacent.append(cell + cols)
+        table.append(adjacent)
+    return table
+
+class OccupancyGrid:
+    """Per-cell segment counts shared by every serpent in the arena"""
+    def __init__(self, cols: int = GRID_COLS, rows: int = GRID_ROWS, cell_size: int = GRID_SIZE):
+        self.cols = cols
+        self.rows = rows
+        self.cell_size = cell_size
+        self.counts = [0] * (cols * rows)
+        self.tracked: Dict[int, List[int]] = {}
+        
+    def cell_at(self, x: float, y: float) -> int:
+        """Flat cell index for a pixel position, or -1 outside the board"""
+        col = int(x // self.cell_size)
+        row = int(y // self.cell_size)
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return row * self.cols + col
+        return -1
+        
+    def is_free(self, cell: int) -> bool:
+        return cell >= 0 and self.counts[cell] == 0
+        
+    def track(self, snake: 'QuantumSerpent'):
+        """Move a snake's footprint to its current segment cells"""
+        cells = self.tracked.setdefault(id(snake), [])
+        counts = self.counts
+        segments = snake.segments
+        
+        # Segments only ever get appended, so new ones start untracked
+        while len(cells) < len(segments):
+            cells.append(-1)
+        
+        for i, segment in enumerate(segments):
+            cell = self.cell_at(segment.x, segment.y)
+            old = cells[i]
+            if cell != old:
+                if old >= 0:
+                    counts[old] -= 1
+                if cell >= 0:
+                    counts[cell] += 1
+                cells[i] = cell
+                
+    def release(self, snake: 'QuantumSerpent'):
+        """Remove a snake's footprint from the grid"""
+        for cell in self.tracked.pop(id(snake), []):
+            if cell >= 0:
+                self.counts[cell] -= 1
+                
+    def foreign_count(self, snake: 'QuantumSerpent', cell: int) -> int:
+        """Number of segments in a cell that belong to other snakes"""
+        if cell < 0:
+            return 0
+        own = self.tracked.get(id(snake), [])
+        return self.counts[cell] - own.count(cell)
+
+class FlowField:
+    """BFS distance map to the nearest orb, patched incrementally as orbs come and go"""
+    UNREACHED = 1 << 30
+    
+    def __init__(self, cols: int = GRID_COLS, rows: int = GRID_ROWS):
+        self.cols = cols
+        self.rows = rows
+        size = cols * rows
+        self.dist = [self.UNREACHED] * size
+        self.owner = [-1] * size
+        self.sources: Dict[int, int] = {}
+        self.neighbors = neighbor_table(cols, rows)
+        
+    def add_source(self, cell: int):
+        """Lower wave: only cells that get closer to the new orb are touched"""
+        self.sources[cell] = self.sources.get(cell, 0) + 1
+        if self.dist[cell] == 0:
+            return
+        self.dist[cell] = 0
+        self.owner[cell] = cell
+        self._relax([(0, cell)])
+        
+    def remove_source(self, cell: int):
+        """Raise wave: clear the orb's region, then re-flood it from its border"""
+        remaining = self.sources.get(cell, 0) - 1
+        if remaining > 0:
+            self.sources[cell] = remaining
+            return
+        self.sources.pop(cell, None)
+        
+        dist, owner, neighbors = self.dist, self.owner, self.neighbors
+        region = [cell]
+        owner[cell] = -1
+        dist[cell] = self.UNREACHED
+        frontier = []
+        i = 0
+        while i < len(region):
+            current = region[i]
+            i += 1
+            for n in neighbors[current]:
+                if owner[n] == cell:
+                    owner[n] = -1
+                    dist[n] = self.UNREACHED
+                    region.append(n)
+                elif owner[n] >= 0:
+                    frontier.append((dist[n], n))
+        
+        heapq.heapify(frontier)
+        self._relax(frontier)
+        
+    def _relax(self, queue: List[Tuple[int, int]]):
+        dist, owner, neighbors = self.dist, self.owner, self.neighbors
+        while queue:
+            d, cell = heapq.heappop(queue)
+            if d > dist[cell]:
+                continue
+            nd = d + 1
+            source = owner[cell]
+            for n in neighbors[cell]:
+                if nd < dist[n]:
+                    dist[n] = nd
+                    owner[n] = source
+                    heapq.heappush(queue, (nd, n))
+
+class SerpentAgent:
+    """Produces the key state a serpent reads from `keys` each frame"""
+    def reset(self, game: 'Game', snake: QuantumSerpent):
+        """Called whenever the agent takes over a fresh snake"""
+        pass
+        
+    def get_keys(self, game: 'Game', snake: QuantumSerpent):
+        raise NotImplementedError
+
+class KeyboardAgent(SerpentAgent):
+    """Human control straight from the keyboard"""
+    def get_keys(self, game: 'Game', snake: QuantumSerpent):
+        return pygame.key.get_pressed()
+
+class LaneAgent(SerpentAgent):
+    """Base for AI agents: plans one move per grid cell as the head enters it"""
+    def __init__(self):
+        self.planned_cell = -1
+        self.planned_direction: Optional[Tuple[int, int]] = None
+        
+    def reset(self, game: 'Game', snake: QuantumSerpent):
+        snake.snap_to_lanes = True
+        self.planned_cell = -1
+        self.planned_direction = None
+        
+    def get_keys(self, game: 'Game', snake: QuantumSerpent) -> DirectionKeys:
+        head = snake.segments[0]
+        col = int(head.x // GRID_SIZE)
+        row = int(head.y // GRID_SIZE)
+        if not (0 <= col < GRID_COLS and 0 <= row < GRID_ROWS):
+            return DirectionKeys()
+        cell = row * GRID_COLS + col
+        
+        if cell != self.planned_cell:
+            self.planned_cell = cell
+            self.planned_direction = self.plan(game, snake, cell)
+        
+        # Turning snaps the head to the cell centre, so turns stay on lane lines even
+        # when a fast snake only spends a frame or two in each cell
+        return DirectionKeys(self.planned_direction)
+        
+    def plan(self, game: 'Game', snake: QuantumSerpent, cell: int) -> Tuple[int, int]:
+        """Direction to take from `cell`"""
+        raise NotImplementedError
+        
+    @staticmethod
+    def candidates(snake: QuantumSerpent, cell: int) -> List[Tuple[Tuple[int, int], int]]:
+        """In-bounds (direction, cell) moves, straight ahead first, never reversing"""
+        current = (int(snake.direction.x), int(snake.direction.y))
+        col, row = cell % GRID_COLS, cell // GRID_COLS
+        moves = []
+        for dx, dy in (current, (current[1], current[0]), (-current[1], -current[0])):
+            ncol, nrow = col + dx, row + dy
+            if 0 <= ncol < GRID_COLS and 0 <= nrow < GRID_ROWS:
+                moves.append(((dx, dy), nrow * GRID_COLS + ncol))
+        return moves
+
+class FlowFieldAgent(LaneAgent):
+    """Arena rival brain: walk downhill on the shared orb flow field"""
+    def plan(self, game: 'Game', snake: QuantumSerpent, cell: int) -> Tuple[int, int]:
+        field, grid = game.arena.field, game.arena.grid
+        best = (int(snake.direction.x), int(snake.direction.y))
+        best_dist = FlowField.UNREACHED + 1
+        for direction, ncell in self.candidates(snake, cell):
+            if grid.is_free(ncell) and field.dist[ncell] < best_dist:
+                best = direction
+                best_dist = field.dist[ncell]
+        return best
+
+class AutopilotAgent(LaneAgent):
+    """A* toward the nearest orb, kept safe by a Hamiltonian cycle over the board
+
+    Lane-snapped bodies follow the head's path exactly, so the planner works
+    on the cell grid itself and a one-cell hairpin is as safe as any turn.
+    While the shield is up the body can't hurt, so it heads straight for
+    orbs instead.
+    """
+    SAFETY_MARGIN = 4
+    ASTAR_MAX_FILL = 0.25
+    ASTAR_PATIENCE = 60
+    STALL_PLANS = 1500
+    SHORTCUT_MAX_FILL = 0.5
+    
+    def __init__(self):
+        super().__init__()
+        self.order = self._build_cycle(GRID_COLS, GRID_ROWS)
+        self.neighbors = neighbor_table(GRID_COLS, GRID_ROWS)
+        self.grid = OccupancyGrid()
+        self.length = 0
+        self.plans_since_growth = 0
+        self.detour = False
+        
+    @staticmethod
+    def _build_cycle(cols: int, rows: int) -> List[int]:
+        """Cycle position of every cell: snake the rows from column 1, return up column 0"""
+        if rows % 2:
+            raise ValueError("Hamiltonian cycle needs an even number of rows")
+        path = [0]
+        for row in range(rows):
+            columns = range(1, cols) if row % 2 == 0 else range(cols - 1, 0, -1)
+            path.extend(row * cols + col for col in columns)
+        path.extend(row * cols for row in range(rows - 1, 0, -1))
+        
+        order = [0] * (cols * rows)
+        for index, cell in enumerate(path):
+            order[cell] = index
+        return order
+        
+    def reset(self, game: 'Game', snake: QuantumSerpent):
+        super().reset(game, snake)
+        self.grid = OccupancyGrid()
+        self.length = 0
+        self.plans_since_growth = 0
+        self.detour = False
+        
+    def get_keys(self, game: 'Game', snake: QuantumSerpent) -> DirectionKeys:
+        self.grid.track(snake)
+        return super().get_keys(game, snake)
+        
+    def plan(self, game: 'Game', snake: QuantumSerpent, cell: int) -> Tuple[int, int]:
+        if len(snake.segments) != self.length:
+            self.length = len(snake.segments)
+            self.plans_since_growth = 0
+            self.detour = False
+        self.plans_since_growth += 1
+        
+        if snake.shield_time > 0 or self.detour:
+            return self._plan_direct(game, snake, cell)
+        return self._plan_cycle(game, snake, cell)
+        
+    def _node_free(self, game: 'Game', cell: int) -> bool:
+        """No segment of ours or of a rival in the cell"""
+        if not self.grid.is_free(cell):
+            return False
+        return not game.arena or game.arena.grid.is_free(cell)
+        
+    def _cell_free(self, game: 'Game', snake: QuantumSerpent, cell: int) -> bool:
+        if snake.shield_time > 0:
+            return True  # Shielded: neither our body nor rivals can end the run
+        return self._node_free(game, cell)
+        
+    def _plan_direct(self, game: 'Game', snake: QuantumSerpent, cell: int) -> Tuple[int, int]:
+        """A* straight to the nearest orb cell, ignoring the cycle"""
+        moves = [(direction, n) for direction, n in self.candidates(snake, cell)
+                 if self._cell_free(game, snake, n)]
+        if not moves:
+            return (int(snake.direction.x), int(snake.direction.y))
+        goals = self._orb_goals(game)
+        goals.discard(cell)
+        first_step = self._astar_first_step(cell, goals, self.neighbors,
+                                            lambda n: self._cell_free(game, snake, n))
+        for direction, n in moves:
+            if n == first_step:
+                return direction
+        return moves[0][0]
+        
+    @staticmethod
+    def _orb_goals(game: 'Game') -> set:
+        """Cells holding an orb"""
+        return {int(orb.y // GRID_SIZE) * GRID_COLS + int(orb.x // GRID_SIZE) for orb in game.orbs}
+        
+    def _cycle_distance(self, neighbor: int, goals: set) -> int:
+        """Cycle steps from neighbor until an orb is reached"""
+        order = self.order
+        size = len(order)
+        return min(((order[goal] - order[neighbor]) % size for goal in goals), default=size * 2)
+        
+    def _plan_cycle(self, game: 'Game', snake: QuantumSerpent, cell: int) -> Tuple[int, int]:
+        current = (int(snake.direction.x), int(snake.direction.y))
+        order = self.order
+        size = len(order)
+        head_index = order[cell]
+        
+        # Free room ahead of the head before the cycle runs into the tail
+        tail = snake.segments[-1]
+        tail_cell = self.grid.cell_at(tail.x, tail.y)
+        room = (order[tail_cell] - head_index) % size if tail_cell >= 0 else 0
+        room = (room or size) - self.SAFETY_MARGIN - len(snake.segments) // 10
+        fill = 1.0 - room / size
+        
+        safe = []
+        fallback = []
+        for direction, neighbor in self.candidates(snake, cell):
+            step = (order[neighbor] - head_index) % size
+            free = self._node_free(game, neighbor)
+            if free and (step == 1 or (fill < self.SHORTCUT_MAX_FILL and 0 < step < room)):
+                safe.append((direction, neighbor))
+            elif free:
+                fallback.append((step, direction))
+        
+        if not safe:
+            # Off the cycle (e.g. right after a reset): take the nearest free cycle step
+            return min(fallback)[1] if fallback else current
+        
+        goals = self._orb_goals(game)
+        goals.discard(cell)
+        stalled = not goals or self.plans_since_growth > self.STALL_PLANS
+        if stalled and game.orbs and fill < self.ASTAR_MAX_FILL:
+            # Orbs fenced in by our own body; short snakes can leave the cycle for them
+            self.detour = True
+            return self._plan_direct(game, snake, cell)
+        if not goals:
+            return safe[0][0]
+        
+        # A* can circle an orb whose last step the cycle forbids; give up on it for a while
+        if fill < self.ASTAR_MAX_FILL and self.plans_since_growth < self.ASTAR_PATIENCE:
+            first_step = self._astar_first_step(cell, goals, self.neighbors,
+                                                lambda n: self._node_free(game, n))
+            for direction, neighbor in safe:
+                if neighbor == first_step:
+                    return direction
+        
+        # Shortcut along the cycle: the safe move that leaves the fewest steps to an orb
+        return min(safe, key=lambda move: self._cycle_distance(move[1], goals))[0]
+        
+    @staticmethod
+    def _astar_first_step(start: int, goals: set, neighbors: List[List[int]], is_free) -> int:
+        """First cell of the shortest free path to an orb, or -1"""
+        if not goals:
+            return -1
+        start_col, start_row = start % GRID_COLS, start // GRID_COLS
+        goal_points = sorted(((g % GRID_COLS, g // GRID_COLS) for g in goals),
+                             key=lambda p: abs(p[0] - start_col) + abs(p[1] - start_row))[:8]
+                             
+        def heuristic(cell: int) -> int:
+            col, row = cell % GRID_COLS, cell // GRID_COLS
+            return min(abs(col - gc) + abs(row - gr) for gc, gr in goal_points)
+        
+        came_from = {start: -1}
+        cost = {start: 0}
+        queue = [(heuristic(start), start)]
+        while queue:
+            _, current = heapq.heappop(queue)
+            for n in neighbors[current]:
+                if n in goals:
+                    while current != start:
+                        n, current = current, came_from[current]
+                    return n
+                new_cost = cost[current] + 1
+                if new_cost < cost.get(n, FlowField.UNREACHED) and is_free(n):
+                    cost[n] = new_cost
+                    came_from[n] = current
+                    heapq.heappush(queue, (new_cost + heuristic(n), n))
+        return -1
+
+class RivalSerpent(QuantumSerpent):
+    """AI serpent that follows the shared orb flow field"""
+    _sprite_cache: Dict[Tuple[Tuple[int, int, int], int], pygame.Surface] = {}
+    
+    def __init__(self, x: float, y: float, color: Tuple[int, int, int], direction: Tuple[int, int] = (1, 0)):
+        super().__init__(x, y)
+        self.color = color
+        self.direction = pygame.Vector2(direction)
+        self.effects = False
+        self.alive = True
+        self.agent = FlowFieldAgent()
+        self.agent.reset(None, self)
+        for _ in range(2):
+            self.grow()
+            
+    def _segment_sprite(self, color: Tuple[int, int, int], size: int) -> pygame.Surface:
+        """Glow, body and highlight baked into one surface per colour"""
+        key = (color, size)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            glow_size = size + 8
+            sprite = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, 80), (glow_size, glow_size), glow_size)
+            pygame.draw.circle(sprite, color, (glow_size, glow_size), size)
+            pygame.draw.circle(sprite, WHITE, (glow_size, glow_size), max(2, size // 3))
+            self._sprite_cache[key] = sprite
+        return sprite
+        
+    def draw(self, screen: pygame.Surface):
+        size = max(12, int(GRID_SIZE * 0.6))
+        body = self._segment_sprite(tuple(c // 2 for c in self.color), size)
+        head_sprite = self._segment_sprite(self.color, size)
+        offset = size + 8
+        
+        screen.blits([(body, (segment.x - offset, segment.y - offset)) for segment in reversed(self.segments[1:])], False)
+        head = self.segments[0]
+        screen.blit(head_sprite, (head.x - offset, head.y - offset))
+        
+        # Eyes look along the heading
+        for side in (-1, 1):
+            eye_x = head.x + self.direction.x * 4 - self.direction.y * side * 5
+            eye_y = head.y + self.direction.y * 4 + self.direction.x * side * 5
+            screen.circle(WHITE, (int(eye_x), int(eye_y)), 3)
+            screen.circle(BLACK, (int(eye_x), int(eye_y)), 1)
+
+class Arena:
+    """Arena mode: AI rivals, a shared occupancy grid and the orb flow field"""
+    RIVAL_COLORS = [
+        (255, 80, 80), (255, 160, 40), (120, 255, 80), (80, 160, 255),
+        (255, 80, 200), (200, 120, 255), (255, 255, 120), (80, 255, 220)
+    ]
+    
+    def __init__(self, rival_count: int = ARENA_RIVALS, player: Optional[QuantumSerpent] = None):
+        self.grid = OccupancyGrid()
+        self.field = FlowField()
+        self.rivals: List[Optional[RivalSerpent]] = []  # None until a slot finds room to spawn
+        self.respawn_timers: List[float] = []
+        self.orb_cells: Dict[int, List[QuantumOrb]] = {}
+        
+        if player is not None:
+            self.grid.track(player)
+        for i in range(min(rival_count, MAX_ARENA_RIVALS)):
+            self.rivals.append(self._spawn_rival(i))
+            self.respawn_timers.append(0)
+            
+    def _spawn_rival(self, index: int) -> Optional[RivalSerpent]:
+        """A new rival on a clear runway, or None when the board has no room for one"""
+        color = self.RIVAL_COLORS[index % len(self.RIVAL_COLORS)]
+        # Same bound as spawn_orb; a crowded board leaves the slot to retry on a later frame
+        for _ in range(ORB_SPAWN_ATTEMPTS):
+            col = random.randint(3, GRID_COLS - 4)
+            row = random.randint(5, GRID_ROWS - 4)
+            direction = random.choice(list(DirectionKeys.DIRECTION_KEYS))
+            
+            # Need a clear runway so the rival doesn't spawn into a body
+            cells = [(row + direction[1] * k) * GRID_COLS + col + direction[0] * k for k in range(-2, 4)]
+            if all(self.grid.is_free(cell) for cell in cells):
+                break
+        else:
+            return None
+        
+        rival = RivalSerpent(col * GRID_SIZE + GRID_SIZE / 2, row * GRID_SIZE + GRID_SIZE / 2, color, direction)
+        self.grid.track(rival)
+        return rival
+        
+    def is_clear(self, x: float, y: float) -> bool:
+        return self.grid.is_free(self.grid.cell_at(x, y))
+        
+    def add_orb(self, orb: QuantumOrb):
+        cell = self.grid.cell_at(orb.x, orb.y)
+        self.orb_cells.setdefault(cell, []).append(orb)
+        self.field.add_source(cell)
+        
+    def remove_orb(self, orb: QuantumOrb):
+        cell = self.grid.cell_at(orb.x, orb.y)
+        orbs = self.orb_cells.get(cell)
+        if orbs and orb in orbs:
+            orbs.remove(orb)
+            if not orbs:
+                del self.orb_cells[cell]
+            self.field.remove_source(cell)
+            
+    def _orb_near(self, x: float, y: float) -> Optional[QuantumOrb]:
+        cell = self.grid.cell_at(x, y)
+        if cell < 0:
+            return None
+        for n in [cell] + self.field.neighbors[cell]:
+            for orb in self.orb_cells.get(n, ()):
+                dx = x - orb.x
+                dy = y - orb.y
+                if dx * dx + dy * dy < GRID_SIZE * GRID_SIZE:
+                    return orb
+        return None
+        
+    def hits_rival(self, snake: QuantumSerpent) -> bool:
+        """True when the snake's head runs into another serpent's body"""
+        head = snake.segments[0]
+        return self.grid.foreign_count(snake, self.grid.cell_at(head.x, head.y)) > 0
+        
+    def alive_count(self) -> int:
+        return sum(1 for rival in self.rivals if rival is not None and rival.alive)
+        
+    def update(self, dt: float, game: 'Game'):
+        self.grid.track(game.snake)
+        
+        for i, rival in enumerate(self.rivals):
+            if rival is None or not rival.alive:
+                self.respawn_timers[i] -= dt
+                if self.respawn_timers[i] <= 0:
+                    spawned = self._spawn_rival(i)
+                    if spawned is None:
+                        # No room yet: keep the fallen rival (or None) and try again later
+                        self.respawn_timers[i] = RIVAL_RESPAWN_TIME
+                    else:
+                        self.rivals[i] = spawned
+                continue
+            rival.update(dt, rival.agent.get_keys(game, rival), game.particles)
+            self.grid.track(rival)
+        
+        for i, rival in enumerate(self.rivals):
+            if rival is None or not rival.alive:
+                continue
+            head = rival.segments[0]
+            
+            if rival.check_collision() or self.hits_rival(rival):
+                self._kill_rival(i, game)
+                continue
+            
+            orb = self._orb_near(head.x, head.y)
+            if orb is not None:
+                orb.collected = True
+                game.orbs.remove(orb)
+                self.remove_orb(orb)
+                rival.grow()
+                game.particles.add_burst(orb.x, orb.y, rival.color, 8)
+                game.spawn_orb()
+                
+    def _kill_rival(self, index: int, game: 'Game'):
+        rival = self.rivals[index]
+        rival.alive = False
+        self.grid.release(rival)
+        self.respawn_timers[index] = RIVAL_RESPAWN_TIME
+        head = rival.segments[0]
+        game.particles.add_burst(head.x, head.y, rival.color, 20)
+        
+        # Fallen rivals leave a few orbs behind
+        for segment in rival.segments[::4][:3]:
+            if len(game.orbs) >= MAX_ARENA_ORBS:
+                break
+            x = int(segment.x // GRID_SIZE) * GRID_SIZE + GRID_SIZE // 2
+            y = int(segment.y // GRID_SIZE) * GRID_SIZE + GRID_SIZE // 2
+            if 0 <= x < SCREEN_WIDTH and 0 <= y < SCREEN_HEIGHT and self.is_clear(x, y):
+                orb = QuantumOrb(x, y)
+                game.orbs.append(orb)
+                self.add_orb(orb)
+                
+    def draw(self, screen: pygame.Surface):
+        for rival in self.rivals:
+            if rival is not None and rival.alive:
+                rival.draw(screen)
+
+def release_caches() -> int:
+    """Drop the rivals' segment sprites; returns the bytes they held"""
+    held = surface_bytes(RivalSerpent._sprite_cache)
+    RivalSerpent._sprite_cache.clear()
+    return held
+
+# Scenes
+class MenuScene(Scene):
+    """Title screen; pick classic, arena or full-arena mode"""
+    name = "menu"
+    
+    def handle_event(self, event):
+        game = self.game
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                game.arena_mode = False
+                game.state = "target_select"
+            elif event.key in (pygame.K_a, pygame.K_x):
+                # X fills the arena to its cap
+                game.arena_mode = True
+                game.arena_rivals = MAX_ARENA_RIVALS if event.key == pygame.K_x else ARENA_RIVALS
+                game.state = "target_select"
+            elif event.key == pygame.K_ESCAPE:
+                return False
+        return True
+        
+    def update(self, dt: float):
+        self.game.particles.update(dt)
+        
+    def draw(self, screen: pygame.Surface):
+        self.game.draw_background()
+        self.game.draw_menu()
+
+class TargetSelectScene(Scene):
+    """Choose the score that wins the round"""
+    name = "target_select"
+    
+    def handle_event(self, event):
+        game = self.game
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_UP:
+                game.selected_target = (game.selected_target - 1) % len(game.target_options)
+            elif event.key == pygame.K_DOWN:
+                game.selected_target = (game.selected_target + 1) % len(game.target_options)
+            elif event.key == pygame.K_SPACE:
+                game.target_score = game.target_options[game.selected_target]
+                game.state = "playing"
+                game.reset_game()
+            elif event.key == pygame.K_ESCAPE:
+                game.state = "menu"
+        return True
+        
+    def update(self, dt: float):
+        self.game.particles.update(dt)
+        
+    def draw(self, screen: pygame.Surface):
+        self.game.draw_background()
+        self.game.draw_target_select()
+
+class PlayScene(Scene):
+    """The board itself"""
+    name = "playing"
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.game.state = "menu"
+        return True
+        
+    def update(self, dt: float):
+        self.game.update_playing(dt)
+        
+    def draw(self, screen: pygame.Surface):
+        self.game.draw_background()
+        self.game.draw_playing()
+
+class RoundOverScene(Scene):
+    """Panel over the frozen board; play again or go back to the menu"""
+    overlay = True
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                self.game.state = "target_select"
+            elif event.key == pygame.K_ESCAPE:
+                self.game.state = "menu"
+        return True
+
+class GameOverScene(RoundOverScene):
+    name = "game_over"
+    
+    def draw(self, screen: pygame.Surface):
+        self.game.draw_game_over()
+
+class VictoryScene(RoundOverScene):
+    """Fireworks stay live; the board behind them is the frozen last frame"""
+    name = "victory"
+    
+    def update(self, dt: float):
+        self.game.particles.update(dt)
+        
+    def draw(self, screen: pygame.Surface):
+        self.draw_backdrop(screen)
+        self.game.particles.draw(screen)
+        self.game.draw_victory()
+
 class Game:
     """Main game class"""
     def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Quantum Serpent")
+        self.screen = open_game_window((SCREEN_WIDTH, SCREEN_HEIGHT), "Quantum Serpent")
         self.clock = pygame.time.Clock()
+        self.presenter = Presenter()
+        self.canvas = Canvas(self.screen)
+        self.draw_list = DrawList(self.screen)
         
         # Game state
-        self.state = "menu"  # menu, target_select, playing, game_over, victory
+        self.scenes = SceneStack(self, self.screen, (MenuScene, TargetSelectScene, PlayScene,
+                                                     GameOverScene, VictoryScene))
+        self.state = "menu"
+        self.arena_mode = False
+        self.arena_rivals = ARENA_RIVALS
+        self.arena: Optional[Arena] = None
+        self.agent: SerpentAgent = KeyboardAgent()
         self.score = 0
         self.high_score = 0
         self.level = 1
@@ -407,7 +1132,9 @@ class Game:
         self.snake = QuantumSerpent(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
         self.orbs: List[QuantumOrb] = []
         self.powerups: List[PowerUp] = []
+        self.quality = QualityGovernor(FPS)
         self.particles = ParticleSystem()
+        self.particles.governor = self.quality
         
         # Timers
         self.orb_spawn_timer = 0
@@ -415,9 +1142,30 @@ class Game:
         self.background_time = 0
         
         # Fonts
-        self.font_large = pygame.font.Font(None, 72)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 32)
+        init_fonts()
+        self.font_large = cached_font(72)
+        self.font_medium = cached_font(48)
+        self.font_small = cached_font(32)
+        
+        # HUD counters, composed from baked digits; the score's glow is baked in too
+        self.score_glyphs = GlyphAtlas(48, WHITE, DIGITS, ("SCORE: ",), glow_color=NEON_CYAN,
+                                       glow_alpha=100, glow_offsets=((2, 2), (-2, -2), (2, -2), (-2, 2)))
+        self.level_glyphs = GlyphAtlas(32, NEON_GREEN, DIGITS, ("LEVEL ",))
+        self.length_glyphs = GlyphAtlas(32, NEON_PURPLE, DIGITS, ("LENGTH: ",))
+        self.rivals_glyphs = GlyphAtlas(32, NEON_ORANGE, DIGITS + "/", ("RIVALS: ",))
+        self.powerup_glyphs = {
+            NEON_GREEN: GlyphAtlas(32, NEON_GREEN, DIGITS + ".s", ("SPEED BOOST: ",)),
+            NEON_CYAN: GlyphAtlas(32, NEON_CYAN, DIGITS + ".s", ("SHIELD: ",))
+        }
+        
+        # HUD; the layer runs below the panel for a second power-up line
+        self.hud = HudLayer((SCREEN_WIDTH, 100), self.render_hud_panel)
+        self.hud_score = self.hud.add((18, 18, 262, 37), self.render_hud_score)
+        self.hud_level = self.hud.add((20, 50, 200, 24), self.render_hud_level)
+        self.hud_length = self.hud.add((SCREEN_WIDTH - 200, 20, 190, 24), self.render_hud_length)
+        self.hud_rivals = self.hud.add((SCREEN_WIDTH // 2 - 60, 20, 180, 24), self.render_hud_rivals)
+        self.hud_powerups = self.hud.add((SCREEN_WIDTH - 300, 50, 290, 50), self.render_hud_powerups)
+        timeline.mark('font')
         
         # Animation
         self.menu_pulse = 0
@@ -428,10 +1176,23 @@ class Game:
         # Spawn initial orbs
         for _ in range(3):
             self.spawn_orb()
+            
+    @property
+    def state(self) -> str:
+        """Name of the scene on top: menu, target_select, playing, game_over or victory"""
+        return self.scenes.name
+        
+    @state.setter
+    def state(self, name: str):
+        self.scenes.show(name)
         
     def spawn_orb(self):
         """Spawn a new quantum orb"""
-        while True:
+        if self.arena and len(self.orbs) >= MAX_ARENA_ORBS:
+            return
+        
+        # A long enough body can cover the board; give up rather than spin forever
+        for _ in range(ORB_SPAWN_ATTEMPTS):
             x = random.randint(2, SCREEN_WIDTH // GRID_SIZE - 2) * GRID_SIZE + GRID_SIZE // 2
             y = random.randint(2, SCREEN_HEIGHT // GRID_SIZE - 2) * GRID_SIZE + GRID_SIZE // 2
             
@@ -441,9 +1202,14 @@ class Game:
                 if abs(segment.x - x) < GRID_SIZE and abs(segment.y - y) < GRID_SIZE:
                     clear = False
                     break
+            if self.arena and not self.arena.is_clear(x, y):
+                clear = False
                     
             if clear:
-                self.orbs.append(QuantumOrb(x, y))
+                orb = QuantumOrb(x, y)
+                self.orbs.append(orb)
+                if self.arena:
+                    self.arena.add_orb(orb)
                 break
                 
     def spawn_powerup(self):
@@ -451,7 +1217,8 @@ class Game:
         power_types = ['speed', 'slow', 'shield', 'multi']
         power_type = random.choice(power_types)
         
-        while True:
+        # Same bound as spawn_orb; a crowded board just skips this power-up
+        for _ in range(ORB_SPAWN_ATTEMPTS):
             x = random.randint(2, SCREEN_WIDTH // GRID_SIZE - 2) * GRID_SIZE + GRID_SIZE // 2
             y = random.randint(2, SCREEN_HEIGHT // GRID_SIZE - 2) * GRID_SIZE + GRID_SIZE // 2
             
@@ -461,6 +1228,8 @@ class Game:
                 if abs(segment.x - x) < GRID_SIZE and abs(segment.y - y) < GRID_SIZE:
                     clear = False
                     break
+            if self.arena and not self.arena.is_clear(x, y):
+                clear = False
                     
             if clear:
                 self.powerups.append(PowerUp(x, y, power_type))
@@ -469,30 +1238,33 @@ class Game:
     def draw_background(self):
         """Draw animated holographic background"""
         self.background_time += 1/60
+        canvas = self.canvas
+        canvas.set_scale(self.quality.tier.render_scale)
         
-        # Subtle gradient background
-        for y in range(SCREEN_HEIGHT):
+        # Subtle gradient background, in coarser bands when quality drops
+        band = max(GRADIENT_BANDS[self.quality.tier.background_detail], canvas.pixel)
+        for y in range(0, SCREEN_HEIGHT, band):
             ratio = y / SCREEN_HEIGHT
             # Much more subtle wave effect
             wave = math.sin(self.background_time * 0.2 + ratio * 2) * 0.05
             r = int(8 + wave * 12)
             g = int(12 + wave * 18)
             b = int(35 + wave * 25)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+            canvas.fill((r, g, b), (0, y, SCREEN_WIDTH, band))
         
         # Square grid with subtle glow
         grid_alpha = 25 + int(math.sin(self.background_time * 0.5) * 8)
         
         # Vertical lines
         for x in range(0, SCREEN_WIDTH, GRID_SIZE):
-            pygame.draw.line(self.screen, (*NEON_CYAN, grid_alpha), (x, 0), (x, SCREEN_HEIGHT))
+            canvas.line((*NEON_CYAN, grid_alpha), (x, 0), (x, SCREEN_HEIGHT))
             
         # Horizontal lines  
         for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
-            pygame.draw.line(self.screen, (*NEON_CYAN, grid_alpha), (0, y), (SCREEN_WIDTH, y))
+            canvas.line((*NEON_CYAN, grid_alpha), (0, y), (SCREEN_WIDTH, y))
         
         # Subtle corner accents (only in menu)
-        if self.state == "menu":
+        if self.state == "menu" and self.quality.tier.glow:
             # Corner glow effects
             corner_glow = int(40 + math.sin(self.background_time) * 20)
             corners = [(0, 0), (SCREEN_WIDTH, 0), (0, SCREEN_HEIGHT), (SCREEN_WIDTH, SCREEN_HEIGHT)]
@@ -500,7 +1272,9 @@ class Game:
             for corner_x, corner_y in corners:
                 glow_surface = pygame.Surface((100, 100), pygame.SRCALPHA)
                 pygame.draw.circle(glow_surface, (*NEON_PURPLE, corner_glow), (50, 50), 50)
-                self.screen.blit(glow_surface, (corner_x - 50, corner_y - 50))
+                canvas.blit(glow_surface, (corner_x - 50, corner_y - 50))
+        
+        canvas.present()
         
         # Very minimal ambient particles (only during menu)
         if self.state == "menu" and random.random() < 0.05:
@@ -508,48 +1282,47 @@ class Game:
             y = random.randint(0, SCREEN_HEIGHT)
             self.particles.add_ambient(x, y)
             
-    def draw_hud(self):
-        """Draw the heads-up display"""
-        # Glass panel background
-        panel_surface = pygame.Surface((SCREEN_WIDTH, 80), pygame.SRCALPHA)
-        pygame.draw.rect(panel_surface, GLASS_BLUE, (0, 0, SCREEN_WIDTH, 80))
-        pygame.draw.rect(panel_surface, (*WHITE, 50), (0, 0, SCREEN_WIDTH, 80), 2)
-        self.screen.blit(panel_surface, (0, 0))
-        
-        # Score with glow
-        score_text = f"SCORE: {self.score:06d}"
-        text_surface = self.font_medium.render(score_text, True, WHITE)
-        
-        # Glow effect
-        for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
-            glow_surface = self.font_medium.render(score_text, True, NEON_CYAN)
-            glow_surface.set_alpha(100)
-            self.screen.blit(glow_surface, (20 + offset[0], 20 + offset[1]))
-            
-        self.screen.blit(text_surface, (20, 20))
+    def render_hud_panel(self, surface):
+        """Glass panel background"""
+        pygame.draw.rect(surface, GLASS_BLUE, (0, 0, SCREEN_WIDTH, 80))
+        pygame.draw.rect(surface, (*WHITE, 50), (0, 0, SCREEN_WIDTH, 80), 2)
+        
+    def render_hud_score(self, surface, value):
+        score, glow = value
+        self.score_glyphs.draw(surface, f"SCORE: {score:06d}", (20, 20), glow)
+        
+    def render_hud_level(self, surface, level):
+        self.level_glyphs.draw(surface, f"LEVEL {level}", (20, 50))
         
-        # Level
-        level_text = f"LEVEL {self.level}"
-        level_surface = self.font_small.render(level_text, True, NEON_GREEN)
-        self.screen.blit(level_surface, (20, 50))
+    def render_hud_length(self, surface, length):
+        self.length_glyphs.draw(surface, f"LENGTH: {length}", (SCREEN_WIDTH - 200, 20))
         
-        # Length
-        length_text = f"LENGTH: {len(self.snake.segments)}"
-        length_surface = self.font_small.render(length_text, True, NEON_PURPLE)
-        self.screen.blit(length_surface, (SCREEN_WIDTH - 200, 20))
+    def render_hud_rivals(self, surface, value):
+        alive, total = value
+        self.rivals_glyphs.draw(surface, f"RIVALS: {alive}/{total}", (SCREEN_WIDTH // 2 - 60, 20))
         
-        # Power-up indicators
+    def render_hud_powerups(self, surface, value):
+        """Power-up indicators, stacked in the order they appear"""
         y_offset = 50
-        if self.snake.speed_boost_time > 0:
-            boost_text = f"SPEED BOOST: {self.snake.speed_boost_time:.1f}s"
-            boost_surface = self.font_small.render(boost_text, True, NEON_GREEN)
-            self.screen.blit(boost_surface, (SCREEN_WIDTH - 300, y_offset))
+        for text, color in value:
+            self.powerup_glyphs[color].draw(surface, text, (SCREEN_WIDTH - 300, y_offset))
             y_offset += 25
             
+    def draw_hud(self):
+        """Draw the heads-up display from the cached layer"""
+        hud = self.hud
+        hud.set(self.hud_score, (self.score, self.quality.tier.glow))
+        hud.set(self.hud_level, self.level)
+        hud.set(self.hud_length, len(self.snake.segments))
+        hud.set(self.hud_rivals, (self.arena.alive_count(), len(self.arena.rivals)) if self.arena else None)
+        
+        powerups = []
+        if self.snake.speed_boost_time > 0:
+            powerups.append((f"SPEED BOOST: {self.snake.speed_boost_time:.1f}s", NEON_GREEN))
         if self.snake.shield_time > 0:
-            shield_text = f"SHIELD: {self.snake.shield_time:.1f}s"
-            shield_surface = self.font_small.render(shield_text, True, NEON_CYAN)
-            self.screen.blit(shield_surface, (SCREEN_WIDTH - 300, y_offset))
+            powerups.append((f"SHIELD: {self.snake.shield_time:.1f}s", NEON_CYAN))
+        hud.set(self.hud_powerups, tuple(powerups))
+        hud.draw(self.screen)
             
     def draw_menu(self):
         """Draw main menu with animations"""
@@ -561,7 +1334,7 @@ class Game:
         # 3D Shadow layers
         for depth in range(8, 0, -1):
             shadow_alpha = 30 - depth * 3
-            shadow_font = pygame.font.Font(None, 84)
+            shadow_font = cached_font(84)
             shadow_text = shadow_font.render("QUANTUM SERPENT", True, (0, 0, 0, shadow_alpha))
             shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH // 2 + depth, title_y + depth))
             self.screen.blit(shadow_text, shadow_rect)
@@ -593,15 +1366,16 @@ class Game:
             pulse = 1.0 + math.sin(self.menu_pulse * 4 + i * 0.5) * 0.4
             
             # Multiple glow layers
-            for glow in range(6, 0, -1):
+            glow_layers = range(6, 0, -1) if self.quality.tier.glow else ()
+            for glow in glow_layers:
                 glow_alpha = int(40 - glow * 5)
-                glow_font = pygame.font.Font(None, int(84 + glow * 2 * pulse))
+                glow_font = cached_font(int(84 + glow * 2 * pulse))
                 glow_surface = glow_font.render(letter, True, (*color, glow_alpha))
                 glow_rect = glow_surface.get_rect(center=(letter_x, title_y))
                 self.screen.blit(glow_surface, glow_rect)
             
             # Main letter with pulse
-            main_font = pygame.font.Font(None, int(84 * pulse))
+            main_font = cached_font(int(84 * pulse))
             letter_surface = main_font.render(letter, True, WHITE)
             letter_rect = letter_surface.get_rect(center=(letter_x, title_y))
             self.screen.blit(letter_surface, letter_rect)
@@ -620,13 +1394,14 @@ class Game:
             "Avoid walls and your own tail",
             "Grab power-ups for special abilities",
             "",
-            "Press SPACE to select target score"
+            "Press SPACE to select target score",
+            "Press A for Arena mode against AI serpents, X for a full arena"
         ]
         
         start_y = SCREEN_HEIGHT // 2 + 50
         for i, instruction in enumerate(instructions):
             if instruction:
-                color = NEON_GREEN if "SPACE" in instruction else WHITE
+                color = NEON_GREEN if "Press" in instruction else WHITE
                 text_surface = self.font_small.render(instruction, True, color)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, start_y + i * 30))
                 self.screen.blit(text_surface, text_rect)
@@ -723,7 +1498,7 @@ class Game:
         # Animated victory text
         victory_pulse = 1.0 + math.sin(self.victory_time * 4) * 0.2
         victory_font_size = int(80 * victory_pulse)
-        victory_font = pygame.font.Font(None, victory_font_size)
+        victory_font = cached_font(victory_font_size)
         
         # Victory text with rainbow effect
         victory_colors = [QUANTUM_GOLD, NEON_ORANGE, NEON_GREEN, NEON_CYAN, NEON_PURPLE]
@@ -772,7 +1547,11 @@ class Game:
         self.screen.blit(restart_surface, restart_rect)
             
     def draw_game_over(self):
-        """Draw game over screen"""
+        """Draw game over screen over the frozen last frame"""
+        if not self.presenter.still('game_over'):
+            return
+        self.scenes.top.draw_backdrop(self.screen)
+        
         # Semi-transparent overlay
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((*BLACK, 180))
@@ -827,6 +1606,8 @@ class Game:
             if math.sqrt(dx * dx + dy * dy) < GRID_SIZE:
                 orb.collected = True
                 self.orbs.remove(orb)
+                if self.arena:
+                    self.arena.remove_orb(orb)
                 self.snake.grow()
                 self.score += 100 * self.level
                 self.particles.add_burst(orb.x, orb.y, QUANTUM_GOLD, 20)
@@ -870,175 +1651,153 @@ class Game:
         self.snake = QuantumSerpent(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
         self.orbs = []
         self.powerups = []
-        self.particles = ParticleSystem()
+        self.particles.clear()
         self.score = 0
         self.level = 1
         self.orb_spawn_timer = 0
         self.powerup_spawn_timer = 0
+        self.arena = Arena(self.arena_rivals, self.snake) if self.arena_mode else None
         # Spawn multiple initial orbs
-        for _ in range(3):
+        orb_count = 3 + len(self.arena.rivals) // 2 if self.arena else 3
+        for _ in range(orb_count):
             self.spawn_orb()
+        self.agent.reset(self, self.snake)
         
     def handle_events(self, event):
         """Handle pygame events"""
         if event.type == pygame.QUIT:
             return False
             
-        elif event.type == pygame.KEYDOWN:
-            if self.state == "menu":
-                if event.key == pygame.K_SPACE:
-                    self.state = "target_select"
-                elif event.key == pygame.K_ESCAPE:
-                    return False
-                    
-            elif self.state == "target_select":
-                if event.key == pygame.K_UP:
-                    self.selected_target = (self.selected_target - 1) % len(self.target_options)
-                elif event.key == pygame.K_DOWN:
-                    self.selected_target = (self.selected_target + 1) % len(self.target_options)
-                elif event.key == pygame.K_SPACE:
-                    self.target_score = self.target_options[self.selected_target]
-                    self.state = "playing"
-                    self.reset_game()
-                elif event.key == pygame.K_ESCAPE:
-                    self.state = "menu"
-                    
-            elif self.state == "playing":
-                if event.key == pygame.K_ESCAPE:
-                    self.state = "menu"
-                    
-            elif self.state == "game_over":
-                if event.key == pygame.K_SPACE:
-                    self.state = "target_select"
-                elif event.key == pygame.K_ESCAPE:
-                    self.state = "menu"
-                    
-            elif self.state == "victory":
-                if event.key == pygame.K_SPACE:
-                    self.state = "target_select"
-                elif event.key == pygame.K_ESCAPE:
-                    self.state = "menu"
-                    
-        return True
+        elif event.type == pygame.WINDOWEXPOSED:
+            self.presenter.invalidate()
+            return True
+        
+        return self.scenes.handle_event(event)
+        
+    def _hit_rival(self) -> bool:
+        """Arena collision against rival bodies (the shield protects here too)"""
+        return bool(self.arena) and self.snake.shield_time <= 0 and self.arena.hits_rival(self.snake)
         
     def update(self, dt: float):
-        """Update game logic"""
-        if self.state == "playing":
-            keys = pygame.key.get_pressed()
+        """Update game logic; only the scene on top ticks"""
+        self.scenes.update(dt)
+        
+    def update_playing(self, dt: float):
+        """Advance the snake, rivals and orbs by one frame"""
+        keys = self.agent.get_keys(self, self.snake)
+        
+        # Update snake
+        self.snake.update(dt, keys, self.particles)
+        
+        # Update arena rivals
+        if self.arena:
+            self.arena.update(dt, self)
+        
+        # Update orbs
+        for orb in self.orbs:
+            orb.update(dt)
             
-            # Update snake
-            self.snake.update(dt, keys, self.particles)
+        # Update power-ups
+        for powerup in self.powerups:
+            powerup.update(dt)
             
-            # Update orbs
-            for orb in self.orbs:
-                orb.update(dt)
+        # Spawn power-ups occasionally
+        self.powerup_spawn_timer += dt
+        if self.powerup_spawn_timer > random.uniform(15, 25):
+            self.powerup_spawn_timer = 0
+            if len(self.powerups) < 2:
+                self.spawn_powerup()
                 
-            # Update power-ups
-            for powerup in self.powerups:
-                powerup.update(dt)
+        # Check collisions
+        self.check_collisions()
+        
+        # Update difficulty
+        self.update_difficulty()
+        
+        # Check victory condition
+        if self.score >= self.target_score:
+            self.state = "victory"
+            if self.score > self.high_score:
+                self.high_score = self.score
+            self.victory_time = 0
+            # Victory celebration particles
+            for _ in range(50):
+                x = random.randint(0, SCREEN_WIDTH)
+                y = random.randint(0, SCREEN_HEIGHT)
+                colors = [QUANTUM_GOLD, NEON_CYAN, NEON_PURPLE, NEON_GREEN]
+                self.particles.add_burst(x, y, random.choice(colors), 15)
                 
-            # Spawn power-ups occasionally
-            self.powerup_spawn_timer += dt
-            if self.powerup_spawn_timer > random.uniform(15, 25):
-                self.powerup_spawn_timer = 0
-                if len(self.powerups) < 2:
-                    self.spawn_powerup()
-                    
-            # Check collisions
-            self.check_collisions()
-            
-            # Update difficulty
-            self.update_difficulty()
-            
-            # Check victory condition
-            if self.score >= self.target_score:
-                self.state = "victory"
-                if self.score > self.high_score:
-                    self.high_score = self.score
-                self.victory_time = 0
-                # Victory celebration particles
-                for _ in range(50):
-                    x = random.randint(0, SCREEN_WIDTH)
-                    y = random.randint(0, SCREEN_HEIGHT)
-                    colors = [QUANTUM_GOLD, NEON_CYAN, NEON_PURPLE, NEON_GREEN]
-                    self.particles.add_burst(x, y, random.choice(colors), 15)
-                    
-            # Check game over
-            elif self.snake.check_collision():
-                self.state = "game_over"
-                if self.score > self.high_score:
-                    self.high_score = self.score
+        # Check game over
+        elif self.snake.check_collision() or self._hit_rival():
+            self.state = "game_over"
+            if self.score > self.high_score:
+                self.high_score = self.score
                     
         # Update particles
         self.particles.update(dt)
         
-    def draw(self):
-        """Draw everything"""
-        # Background
-        self.draw_background()
-        
-        if self.state == "menu":
-            self.draw_menu()
-        elif self.state == "target_select":
-            self.draw_target_select()
-        elif self.state == "playing":
-            # Game objects
-            for orb in self.orbs:
-                orb.draw(self.screen)
-                
-            for powerup in self.powerups:
-                powerup.draw(self.screen)
-                
-            self.snake.draw(self.screen)
-            
-            # Effects
-            self.particles.draw(self.screen)
-            
-            # UI
-            self.draw_hud()
-            
-        elif self.state == "game_over":
-            # Still draw game objects faded
-            for orb in self.orbs:
-                orb.draw(self.screen)
-            for powerup in self.powerups:
-                powerup.draw(self.screen)
-            self.snake.draw(self.screen)
-            self.particles.draw(self.screen)
-            
-            self.draw_game_over()
-            
-        elif self.state == "victory":
-            # Still draw game objects faded
-            for orb in self.orbs:
-                orb.draw(self.screen)
-            for powerup in self.powerups:
-                powerup.draw(self.screen)
-            self.snake.draw(self.screen)
-            self.particles.draw(self.screen)
-            
-            self.draw_victory()
+    def step(self, dt: float = 1 / FPS, render: bool = False):
+        """Advance one frame without the event loop or frame limiter (headless runs)"""
+        self.update(dt)
+        if render:
+            self.draw()
             
-    def run(self):
-        """Main game loop"""
+    def draw(self):
+        """Draw everything; only the scene on top draws"""
+        self.scenes.draw()
+        
+    def draw_playing(self):
+        """Draw the board over the background"""
+        glow = self.quality.tier.glow
+        
+        # Game objects, recorded and then replayed onto the screen
+        draw_list = self.draw_list
+        draw_list.layer = LAYER_ORBS
+        for orb in self.orbs:
+            orb.draw(draw_list, glow)
+        
+        draw_list.layer = LAYER_PICKUPS
+        for powerup in self.powerups:
+            powerup.draw(draw_list, glow)
+        
+        draw_list.layer = LAYER_SERPENTS
+        if self.arena:
+            self.arena.draw(draw_list)
+        self.snake.draw(draw_list, glow)
+        
+        # Effects
+        draw_list.layer = LAYER_PARTICLES
+        self.particles.draw(draw_list)
+        draw_list.flush()
+        
+        # UI
+        self.draw_hud()
+        
+    def frame(self, poll: Callable[[], List[pygame.event.Event]]) -> bool:
+        """One pass of the main loop; False once the player quits"""
         running = True
+        dt = self.clock.tick(FPS) / 1000.0
+        self.quality.frame(self.clock.get_rawtime())
         
-        while running:
-            dt = self.clock.tick(FPS) / 1000.0
-            
-            # Handle events
-            for event in pygame.event.get():
-                if not self.handle_events(event):
-                    running = False
-                    
-            # Update
-            self.update(dt)
-            
-            # Draw
-            self.draw()
-            
-            # Display
-            pygame.display.flip()
+        # Handle events
+        for event in poll():
+            if not self.handle_events(event):
+                running = False
+        
+        # Update
+        self.update(dt)
+        
+        # Draw
+        self.draw()
+        
+        # Display
+        self.presenter.present()
+        return running
+        
+    def run(self):
+        """Main game loop"""
+        while self.frame(pygame.event.get):
+            pass
             
         pygame.quit()
 
@@ -0,0 +1,147 @@
+import pygame
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+from assets import CACHE_DIR, asset_cache
+
+DIGITS = "0123456789"
+
+_fonts: Dict[int, pygame.font.Font] = {}
+_quit_hooked = False
+
+def _forget_fonts():
+    global _quit_hooked
+    _fonts.clear()
+    _quit_hooked = False
+
+def init_fonts():
+    """Start the font subsystem; cached fonts are dropped by the next pygame.quit()"""
+    global _quit_hooked
+    pygame.font.init()
+    if not _quit_hooked:
+        # pygame forgets its quit hooks once it has run them, so this is renewed per session
+        pygame.register_quit(_forget_fonts)
+        _quit_hooked = True
+
+def cached_font(size: int) -> pygame.font.Font:
+    """The default font at `size`, built once; animated titles cycle through many sizes"""
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
+class GlyphAtlas:
+    """Pre-rendered glyphs for one font, size and color, composed into strings with one blits() call
+
+    Counters change too often to cache as whole strings, but their digits
+    never change. Each entry is rendered once onto a shared surface: the
+    single characters of `charset` plus the whole `labels` that prefix the
+    numbers ("Score: "), which keep the font's own kerning. A glow or drop
+    shadow is baked into a second row and goes out under the text in the
+    same call, so one glyph's glow never covers its neighbour. Text with a
+    character that was never baked is rendered with the font instead.
+    """
+    def __init__(self, size: int, color, charset: str = DIGITS, labels: Iterable[str] = (),
+                 glow_color=None, glow_alpha: int = 255, glow_offsets: Sequence[Tuple[int, int]] = ((2, 2),),
+                 cache_dir: Optional[str] = CACHE_DIR):
+        self.labels = sorted(labels, key=len, reverse=True)
+        self.font_size, self.color = size, color
+        self.glow_color, self.glow_alpha, self.glow_offsets = glow_color, glow_alpha, glow_offsets
+        entries = self.labels + list(dict.fromkeys(charset))
+        self.pad = max((max(abs(dx), abs(dy)) for dx, dy in glow_offsets), default=0) if glow_color else 0
+        glow = (tuple(glow_color), glow_alpha, tuple(glow_offsets)) if glow_color else None
+        
+        # A warm start maps the atlas and its layout in without building the font at all
+        cache = asset_cache(cache_dir)
+        key = cache.key('glyphs', size, tuple(color), tuple(entries), glow) if cache else None
+        self.surface = cache.load_surface(key) if cache else None
+        layout = cache.meta(key) if self.surface is not None else None
+        if layout is None:
+            self.surface, layout = self._render(cached_font(size), color, entries, glow)
+            if cache:
+                cache.store_surface(key, self.surface, layout)
+        elif pygame.display.get_surface() is not None:
+            # Mapped pixels are RGBA; match the display once rather than on every blit
+            self.surface = self.surface.convert_alpha()
+        
+        self.height = layout['height']
+        # Entry -> (text area, glow area, width)
+        self.glyphs = {entry: (pygame.Rect(text_area), glow_area and pygame.Rect(glow_area), width)
+                       for entry, (text_area, glow_area, width) in layout['glyphs'].items()}
+        self.advances = {(first, second): advance for first, second, advance in layout['advances']}
+    
+    def _render(self, font: pygame.font.Font, color, entries, glow):
+        pad = self.pad
+        rendered = [font.render(entry, True, color) for entry in entries]
+        height = max(text.get_height() for text in rendered) + pad * 2
+        widths = [text.get_width() + pad * 2 for text in rendered]
+        surface = pygame.Surface((sum(widths), height * 2 if glow else height), pygame.SRCALPHA)
+        
+        glyphs = {}
+        left = 0
+        for entry, text, width in zip(entries, rendered, widths):
+            surface.blit(text, (left + pad, pad))
+            glow_area = None
+            if glow:
+                glow_color, glow_alpha, glow_offsets = glow
+                glow_text = font.render(entry, True, glow_color)
+                glow_text.set_alpha(glow_alpha)
+                for dx, dy in glow_offsets:
+                    surface.blit(glow_text, (left + pad + dx, height + pad + dy))
+                glow_area = (left, height, width, height)
+            glyphs[entry] = ((left, 0, width, height), glow_area, font.size(entry)[0])
+            left += width
+        
+        # Where each entry starts after the one before it, kerning included; composed
+        # strings land where Font.render puts them, give or take its sub-pixel pen
+        advances = [(first, second, font.size(first + second)[0] - font.size(second)[0])
+                    for first in entries for second in entries]
+        return surface, {'height': font.get_height(), 'glyphs': glyphs, 'advances': advances}
+    
+    def _split(self, text: str):
+        for label in self.labels:
+            if text.startswith(label):
+                return [label, *text[len(label):]]
+        return text
+    
+    def _baked(self, entries) -> bool:
+        return all(entry in self.glyphs for entry in entries)
+    
+    def size(self, text: str) -> Tuple[int, int]:
+        entries = self._split(text)
+        if not self._baked(entries):
+            return cached_font(self.font_size).size(text)
+        width, previous = 0, None
+        for entry in entries:
+            if previous is not None:
+                width += self.advances[previous, entry]
+            previous = entry
+        return width + (self.glyphs[previous][2] if previous else 0), self.height
+    
+    def draw(self, surface: pygame.Surface, text: str, position, glow: bool = True):
+        """Draw `text` with its top-left at `position`, like blitting Font.render(text)"""
+        entries = self._split(text)
+        if not self._baked(entries):
+            self._draw_unbaked(surface, text, position, glow)
+            return
+        x, y = position[0] - self.pad, position[1] - self.pad
+        atlas, glyphs, advances = self.surface, self.glyphs, self.advances
+        glows, texts = [], []
+        previous = None
+        for entry in entries:
+            if previous is not None:
+                x += advances[previous, entry]
+            previous = entry
+            text_area, glow_area, width = glyphs[entry]
+            if glow and glow_area:
+                glows.append((atlas, (x, y), glow_area))
+            texts.append((atlas, (x, y), text_area))
+        surface.blits(glows + texts, doreturn=False)
+    
+    def _draw_unbaked(self, surface: pygame.Surface, text: str, position, glow: bool):
+        """Text with an unbaked character, straight from the font with the glow laid out as baked"""
+        font = cached_font(self.font_size)
+        if glow and self.glow_color:
+            glow_text = font.render(text, True, self.glow_color)
+            glow_text.set_alpha(self.glow_alpha)
+            for dx, dy in self.glow_offsets:
+                surface.blit(glow_text, (position[0] + dx, position[1] + dy))
+        surface.blit(font.render(text, True, self.color), position)
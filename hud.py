@@ -0,0 +1,64 @@
+import pygame
+from typing import Any, Callable, List, Optional, Tuple
+
+class Widget:
+    """A HUD element that repaints only when the value it shows changes"""
+    def __init__(self, rect: pygame.Rect, render: Callable[[pygame.Surface, Any], None]):
+        self.rect = rect
+        self.render = render
+        self.value = None
+        self.dirty = True
+
+class HudLayer:
+    """HUD composed once onto its own surface and blitted to the screen in one go
+
+    The static panel is baked when the layer is created. Widgets draw in the
+    layer's coordinates, clipped to their rect; when a value changes only that
+    rect is restored from the panel and repainted, along with any widget
+    overlapping it.
+    """
+    def __init__(self, size: Tuple[int, int], render_panel: Callable[[pygame.Surface], None],
+                 position: Tuple[int, int] = (0, 0)):
+        self.position = position
+        self.panel = pygame.Surface(size, pygame.SRCALPHA)
+        render_panel(self.panel)
+        self.surface = self.panel.copy()
+        self.widgets: List[Widget] = []
+        self.repaints = 0
+    
+    def add(self, rect, render: Callable[[pygame.Surface, Any], None]) -> Widget:
+        """Widgets repaint in the order they were added, so later ones sit on top"""
+        widget = Widget(pygame.Rect(rect), render)
+        self.widgets.append(widget)
+        return widget
+    
+    def set(self, widget: Widget, value: Any):
+        if value != widget.value:
+            widget.value = value
+            widget.dirty = True
+    
+    def compose(self):
+        dirty = [widget for widget in self.widgets if widget.dirty]
+        if not dirty:
+            return
+        # Anything overlapping a repainted widget repaints too, so each pixel is drawn once
+        for widget in dirty:
+            for other in self.widgets:
+                if not other.dirty and other.rect.colliderect(widget.rect):
+                    other.dirty = True
+                    dirty.append(other)
+        for widget in dirty:
+            self.surface.fill((0, 0, 0, 0), widget.rect)
+            self.surface.blit(self.panel, widget.rect, widget.rect)
+        for widget in self.widgets:
+            if widget.dirty:
+                widget.dirty = False
+                if widget.value is not None:
+                    self.surface.set_clip(widget.rect)
+                    widget.render(self.surface, widget.value)
+                    self.repaints += 1
+        self.surface.set_clip(None)
+    
+    def draw(self, screen: pygame.Surface, position: Optional[Tuple[int, int]] = None):
+        self.compose()
+        screen.blit(self.surface, position or self.position)
@@ -0,0 +1,109 @@
+import os
+import sys
+import csv
+import time
+from array import array
+from collections import Counter, deque
+from typing import Deque, Dict, List, Optional
+
+MAX_EVENTS = 1000  # One-off events kept; older ones are dropped
+
+def current_rss_mb() -> float:
+    """Resident memory of this process in megabytes, or NaN where it can't be read"""
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        # Non-Linux fallback: peak rather than current usage
+        import resource
+    except ImportError:
+        # Windows has neither /proc nor resource
+        return float('nan')
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+class FrameProfiler:
+    """Collects per-frame timings bucketed by a workload metric (e.g. snake length)"""
+    def __init__(self, bucket_size: int = 50):
+        self.bucket_size = bucket_size
+        self.buckets: Dict[int, Dict[str, array]] = {}
+        self.events: Deque[dict] = deque(maxlen=MAX_EVENTS)
+        self.counters: Counter = Counter()  # Running totals for things too frequent to log one by one
+        self.start_time = time.perf_counter()
+    
+    def _bucket(self, metric: int) -> Dict[str, array]:
+        # Plain float arrays so a long soak doesn't skew the memory it is measuring
+        bucket = self.buckets.get(metric // self.bucket_size)
+        if bucket is None:
+            bucket = self.buckets[metric // self.bucket_size] = {'frame_ms': array('f'), 'rss_mb': array('f')}
+        return bucket
+    
+    def record(self, metric: int, frame_ms: float, **timings: float):
+        """Add one frame; extra keyword timings are averaged per bucket"""
+        bucket = self._bucket(metric)
+        bucket['frame_ms'].append(frame_ms)
+        for name, value in timings.items():
+            if name not in bucket:
+                bucket[name] = array('f')
+            bucket[name].append(value)
+    
+    def sample_memory(self, metric: int, rss_mb: Optional[float] = None):
+        """Memory is sampled sparingly since reading it is not free"""
+        self._bucket(metric)['rss_mb'].append(current_rss_mb() if rss_mb is None else rss_mb)
+    
+    def event(self, name: str, **fields):
+        """Timestamped one-off event (deaths, resets, tier changes)"""
+        self.events.append({'time': round(time.perf_counter() - self.start_time, 3), 'event': name, **fields})
+    
+    def count(self, name: str, amount: int = 1):
+        """Add to a running total instead of logging an event each time"""
+        self.counters[name] += amount
+    
+    def curve(self, metric_name: str = 'metric') -> List[dict]:
+        """One row per bucket: frame-time statistics and memory versus the metric"""
+        rows = []
+        for index in sorted(self.buckets):
+            bucket = self.buckets[index]
+            frames = sorted(bucket['frame_ms'])
+            if not frames:
+                continue
+            row = {
+                metric_name: index * self.bucket_size,
+                'frames': len(frames),
+                'mean_ms': round(sum(frames) / len(frames), 3),
+                'p95_ms': round(frames[min(len(frames) - 1, int(len(frames) * 0.95))], 3),
+                'max_ms': round(frames[-1], 3),
+                'rss_mb': round(max(bucket['rss_mb']), 1) if bucket['rss_mb'] else '',
+            }
+            for name, values in bucket.items():
+                if name not in ('frame_ms', 'rss_mb') and values:
+                    row[name] = round(sum(values) / len(values), 3)
+            rows.append(row)
+        return rows
+    
+    def write_csv(self, path: str, metric_name: str = 'metric'):
+        rows = self.curve(metric_name)
+        fields = list(dict.fromkeys(key for row in rows for key in row))
+        with open(path, 'w', newline='') as out:
+            writer = csv.DictWriter(out, fieldnames=fields, restval='')
+            writer.writeheader()
+            writer.writerows(rows)
+    
+    def format_table(self, metric_name: str = 'metric') -> str:
+        lines = [f"{metric_name:>8} {'frames':>7} {'mean ms':>8} {'p95 ms':>8} {'max ms':>8} {'rss MB':>8}"]
+        for row in self.curve(metric_name):
+            lines.append(f"{row[metric_name]:>8} {row['frames']:>7} {row['mean_ms']:>8.2f} "
+                         f"{row['p95_ms']:>8.2f} {row['max_ms']:>8.2f} {str(row['rss_mb']):>8}")
+        return '\n'.join(lines)
+
+_session_profiler: Optional[FrameProfiler] = None
+
+def session_profiler() -> FrameProfiler:
+    """Process-wide profiler that games report one-off events to"""
+    global _session_profiler
+    if _session_profiler is None:
+        _session_profiler = FrameProfiler()
+    return _session_profiler
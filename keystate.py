@@ -0,0 +1,13 @@
+from typing import Iterable
+
+class HeldKeys:
+    """Stand-in for pygame's key state with a fixed set of keys held down
+
+    Bots and tests hand this to code that reads pygame.key.get_pressed(),
+    indexing it by key constant just the same.
+    """
+    def __init__(self, keys: Iterable[int] = ()):
+        self.held = frozenset(keys)
+    
+    def __getitem__(self, key: int) -> bool:
+        return key in self.held
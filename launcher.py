@@ -0,0 +1,194 @@
+import gc
+import math
+import os
+import sys
+import time
+import importlib
+import pygame
+from typing import List, Optional
+from assets import asset_cache
+from glyphs import cached_font, init_fonts
+from instrumentation import current_rss_mb, session_profiler
+from presenter import Presenter, open_window
+from startup import REPORT_ENV, preload, timeline
+
+# Constants
+SCREEN_WIDTH = 1200
+SCREEN_HEIGHT = 800
+FPS = 60
+FONT_SIZES = (24, 32, 36, 48, 72)  # Every size the games' menus and HUDs ask for
+
+# Module, title and genre in menu order; F1-F3 switch straight to a game from anywhere
+GAMES = (
+    ('game', "Escape Rush", "Reflex Runner"),
+    ('game2', "Stellar Defender", "Space Shooter"),
+    ('game3', "Quantum Serpent", "Reinvented Snake"),
+)
+SWITCH_KEYS = {pygame.K_F1: 'game', pygame.K_F2: 'game2', pygame.K_F3: 'game3'}
+
+# Colors
+BACKGROUND = (10, 12, 30)
+WHITE = (255, 255, 255)
+CYAN = (0, 255, 255)
+GRAY = (128, 128, 128)
+
+class Picker:
+    """The launcher's own menu: arrows and Enter, or 1-3, pick a game"""
+    def __init__(self, launcher: 'Launcher'):
+        self.launcher = launcher
+        self.screen = pygame.display.get_surface()
+        # The menu is not a game start, so it leaves the startup timeline alone
+        self.presenter = Presenter(timed=False)
+        self.selected = 0
+    
+    def frame(self, poll) -> bool:
+        running = True
+        self.launcher.clock.tick(FPS)
+        for event in poll():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.presenter.invalidate()
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key in (pygame.K_UP, pygame.K_w):
+                    self.selected = (self.selected - 1) % len(GAMES)
+                elif event.key in (pygame.K_DOWN, pygame.K_s):
+                    self.selected = (self.selected + 1) % len(GAMES)
+                elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                    self.launcher.pending = GAMES[self.selected][0]
+                elif event.unicode and event.unicode in "123"[:len(GAMES)]:
+                    self.launcher.pending = GAMES[int(event.unicode) - 1][0]
+        
+        # Nothing animates, so the menu is only drawn when the selection moves
+        if self.presenter.still(self.selected):
+            self.draw()
+        self.presenter.present()
+        return running
+    
+    def draw(self):
+        screen = self.screen
+        width, height = screen.get_size()
+        screen.fill(BACKGROUND)
+        
+        title = cached_font(72).render("Game Studio", True, CYAN)
+        screen.blit(title, title.get_rect(center=(width // 2, height // 5)))
+        
+        for index, (_, name, genre) in enumerate(GAMES):
+            y = height // 2 - 90 + index * 90
+            color = WHITE if index == self.selected else GRAY
+            label = cached_font(48).render(f"{index + 1}. {name}", True, color)
+            screen.blit(label, label.get_rect(center=(width // 2, y)))
+            subtitle = cached_font(24).render(genre, True, color)
+            screen.blit(subtitle, subtitle.get_rect(center=(width // 2, y + 32)))
+        
+        hint = cached_font(24).render("F1-F3 switch games at any time  |  Esc: Quit", True, GRAY)
+        screen.blit(hint, hint.get_rect(center=(width // 2, height - 70)))
+        if self.launcher.status:
+            status = cached_font(24).render(self.launcher.status, True, GRAY)
+            screen.blit(status, status.get_rect(center=(width // 2, height - 40)))
+
+class Launcher:
+    """Every game in one process, sharing one window, the fonts and the asset cache
+    
+    Pygame, the display, the fonts and the asset cache manifest are set up
+    once; the game modules import in the background while the menu is up.
+    Each switch builds the picked game's Game on the open window, so warm
+    sprites come straight out of the asset cache. Leaving a game closes it
+    and drops its module's sprite caches, and the bytes released and the
+    resident memory afterwards are logged with every switch.
+    """
+    def __init__(self):
+        timeline.mark('import')
+        self.screen = open_window((SCREEN_WIDTH, SCREEN_HEIGHT), "Game Studio")
+        timeline.mark('display')
+        self.clock = pygame.time.Clock()
+        asset_cache()
+        init_fonts()
+        for size in FONT_SIZES:
+            cached_font(size)
+        timeline.mark('font')
+        timeline.report()
+        preload(*(module for module, _, _ in GAMES))
+        
+        self.current: Optional[str] = None  # Module of the hosted game; None while the menu shows
+        self.host = Picker(self)
+        self.pending: Optional[str] = None
+        self.closing = False
+        self.status = ''
+        # Pygame, fonts and the cache are here for good: freeze them once so collections skip them
+        gc.collect()
+        gc.freeze()
+    
+    def switch(self, name: Optional[str]):
+        """Close whatever is hosted and start the named game, or the menu for None"""
+        started = time.perf_counter()
+        leaving = self.current
+        if name:
+            # The game marks its milestones from here, and reports at its first frame
+            timeline.restart()
+        released = self._release()
+        if name:
+            timeline.mark('release')
+        self.host = importlib.import_module(name).Game() if name else Picker(self)
+        self.current = name
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        rss_mb = current_rss_mb()
+        session_profiler().event('switch', game=name or 'menu', left=leaving or 'menu', ms=round(elapsed_ms, 1),
+                                 released_kb=released // 1024, rss_mb=round(rss_mb, 1))
+        self.status = f"Switched in {elapsed_ms:.0f} ms, released {released / (1024 * 1024):.1f} MB of sprites"
+        if not math.isnan(rss_mb):
+            self.status += f", {rss_mb:.0f} MB resident"
+        if os.environ.get(REPORT_ENV):
+            print(f"{leaving or 'menu'} -> {name or 'menu'}: {self.status}", file=sys.stderr, flush=True)
+    
+    def _release(self) -> int:
+        """Close the hosted game and drop its module's caches; returns the bytes they held"""
+        # Only games with background work (Escape Rush's chunk streamer) have a close()
+        close = getattr(self.host, 'close', None)
+        if close:
+            close()
+        self.host = None
+        released = sys.modules[self.current].release_caches() if self.current else 0
+        # Scenes and their game point at each other, so only the cycle collector frees them.
+        # Nothing is frozen here, or every switch would ratchet more into the permanent generation
+        gc.collect()
+        return released
+    
+    def _poll(self) -> List[pygame.event.Event]:
+        """This frame's events, less the launcher's own hotkeys"""
+        events = []
+        for event in pygame.event.get():
+            if event.type == pygame.KEYDOWN and event.key in SWITCH_KEYS:
+                self.pending = SWITCH_KEYS[event.key]
+                continue
+            if event.type == pygame.QUIT:
+                self.closing = True
+            events.append(event)
+        return events
+    
+    def run(self):
+        """Host games until the window closes or the menu is left"""
+        while True:
+            running = self.host.frame(self._poll)
+            if self.closing or (not running and self.current is None):
+                break
+            if not running:
+                # Quitting a game goes back to the menu
+                self.switch(None)
+            elif self.pending:
+                name, self.pending = self.pending, None
+                if name != self.current:
+                    self.switch(name)
+        
+        self._release()
+        pygame.quit()
+
+if __name__ == "__main__":
+    # Optional argument: the module of a game to start in, e.g. game2
+    launcher = Launcher()
+    if len(sys.argv) > 1:
+        launcher.switch(sys.argv[1])
+    launcher.run()
@@ -0,0 +1,117 @@
+"""Compiled Escape Rush levels.
+
+A level compiles to one little-endian file: a fixed header, the entity
+tables as packed records and the tile grid as one byte per cell. Loading
+maps the file and views each section in place, so even a 10,000-column
+level is ready in a few milliseconds:
+
+    python levels.py stage.json stage.erl    # JSON with game.py's level_data keys
+    python levels.py --builtin stage.erl     # the level shipped with game.py
+"""
+import sys
+import json
+import struct
+import argparse
+import numpy as np
+from typing import Optional
+
+MAGIC = b'ERLV'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIIiiIII')
+HEADER_SIZE = 64
+
+# Tile id -> tile type; id 0 is empty space
+TILE_TYPES = (None, 'grass', 'stone', 'wood', 'water', 'lava')
+TILE_CHARS = {'#': 'grass', 'S': 'stone', 'W': 'wood', '~': 'water', 'L': 'lava'}
+ITEM_TYPES = ('coin', 'gem')
+
+PLATFORM_DTYPE = np.dtype([('x', '<i4'), ('y', '<i4'), ('width', '<i4'), ('vertical', 'u1'),
+                           ('distance', '<f8'), ('speed', '<f8')])
+ENEMY_DTYPE = np.dtype([('x', '<i4'), ('y', '<i4')])
+COLLECTIBLE_DTYPE = np.dtype([('x', '<i4'), ('y', '<i4'), ('item_type', 'u1')])
+
+# Map character -> tile id, for translating a whole ASCII map in one step
+_CHAR_IDS = np.zeros(256, dtype=np.uint8)
+for _char, _name in TILE_CHARS.items():
+    _CHAR_IDS[ord(_char)] = TILE_TYPES.index(_name)
+
+class LevelPack:
+    """Tile grid plus entity tables; the arrays may be views into a mapped file"""
+    def __init__(self, grid: np.ndarray, platforms: np.ndarray, enemies: np.ndarray,
+                 collectibles: np.ndarray, goal_x: int, goal_y: int):
+        self.grid = grid  # (rows, cols) of tile ids
+        self.platforms = platforms
+        self.enemies = enemies
+        self.collectibles = collectibles
+        self.goal_x = goal_x
+        self.goal_y = goal_y
+    
+    @classmethod
+    def from_source(cls, level_data: dict) -> 'LevelPack':
+        """Compile the dict form: an ASCII 'map' plus entity lists"""
+        rows = level_data['map']
+        cols = max((len(row) for row in rows), default=0)
+        text = ''.join(row.ljust(cols) for row in rows).encode('ascii', 'replace')
+        grid = _CHAR_IDS[np.frombuffer(text, dtype=np.uint8)].reshape(len(rows), cols)
+        
+        platforms = np.array([(p['x'], p['y'], p['width'], p['direction'] == 'vertical', p['distance'], p['speed'])
+                              for p in level_data.get('platforms', [])], dtype=PLATFORM_DTYPE)
+        enemies = np.array([(e['x'], e['y']) for e in level_data.get('enemies', [])], dtype=ENEMY_DTYPE)
+        collectibles = np.array([(c['x'], c['y'], ITEM_TYPES.index(c['item_type']))
+                                 for c in level_data.get('collectibles', [])], dtype=COLLECTIBLE_DTYPE)
+        return cls(grid, platforms, enemies, collectibles,
+                   level_data.get('goal_x', 3000), level_data.get('goal_y', 400))
+    
+    @classmethod
+    def load(cls, path: str) -> 'LevelPack':
+        """Map a compiled level; nothing is copied until it is touched"""
+        data = np.memmap(path, dtype=np.uint8, mode='r')
+        if len(data) < HEADER_SIZE:
+            raise ValueError(f"{path} is not a compiled level")
+        magic, version, _, cols, rows, goal_x, goal_y, n_platforms, n_enemies, n_collectibles = \
+            HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} compiled level")
+        
+        offset = HEADER_SIZE
+        tables = []
+        for dtype, count in ((PLATFORM_DTYPE, n_platforms), (ENEMY_DTYPE, n_enemies),
+                             (COLLECTIBLE_DTYPE, n_collectibles)):
+            tables.append(np.frombuffer(data, dtype=dtype, count=count, offset=offset))
+            offset += dtype.itemsize * count
+        grid = np.frombuffer(data, dtype=np.uint8, count=rows * cols, offset=offset).reshape(rows, cols)
+        return cls(grid, *tables, goal_x, goal_y)
+    
+    def save(self, path: str):
+        rows, cols = self.grid.shape
+        header = HEADER.pack(MAGIC, VERSION, 0, cols, rows, self.goal_x, self.goal_y,
+                             len(self.platforms), len(self.enemies), len(self.collectibles))
+        with open(path, 'wb') as out:
+            out.write(header.ljust(HEADER_SIZE, b'\0'))
+            for table in (self.platforms, self.enemies, self.collectibles, self.grid):
+                out.write(np.ascontiguousarray(table).tobytes())
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="Compile an Escape Rush level to the binary format")
+    parser.add_argument('source', nargs='?', help="JSON file with 'map', 'platforms', 'enemies', 'collectibles'")
+    parser.add_argument('output', help="compiled level to write")
+    parser.add_argument('--builtin', action='store_true', help="compile the level built into game.py")
+    args = parser.parse_args(argv)
+    
+    if args.builtin:
+        import game
+        level_data = game.Game._create_level_data()
+    elif args.source:
+        with open(args.source) as source:
+            level_data = json.load(source)
+    else:
+        parser.error("give a source file or --builtin")
+    
+    pack = LevelPack.from_source(level_data)
+    pack.save(args.output)
+    rows, cols = pack.grid.shape
+    print(f"wrote {args.output}: {cols}x{rows} tiles, {len(pack.platforms)} platforms, "
+          f"{len(pack.enemies)} enemies, {len(pack.collectibles)} collectibles")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,243 @@
+import numpy as np
+import pygame
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from assets import asset_cache
+
+Color = Tuple[int, int, int]
+Spread = Union[float, Tuple[float, float]]
+
+class ParticleAtlas:
+    """Every palette colour pre-rendered at each radius and fade level on one surface
+
+    Row (colour, level) holds circles of radius 1..MAX_RADIUS side by side, so a
+    particle is drawn as one area blit out of the atlas. Empty pixels are
+    transparent rather than colour-keyed, so every palette colour shows.
+    """
+    MAX_RADIUS = 8
+    FADE_LEVELS = 8
+    VERSION = 3  # Bump when _render changes, so cached strips are rebuilt
+    
+    def __init__(self):
+        self.cell = self.MAX_RADIUS * 2 + 1
+        self.palette: List[Color] = []
+        self.ids: Dict[Color, int] = {}
+        self.surface: Optional[pygame.Surface] = None
+        self.rects: List[Tuple[int, int, int, int]] = []
+    
+    def color_id(self, color: Color) -> int:
+        """Palette index for a colour; its atlas rows are added before the next draw"""
+        color_id = self.ids.get(color)
+        if color_id is None:
+            color_id = self.ids[color] = len(self.palette)
+            self.palette.append(color)
+        return color_id
+    
+    def _extend(self):
+        """Append rows for colours added since the last draw, leaving existing rows alone"""
+        cell, levels = self.cell, self.FADE_LEVELS
+        band = cell * levels
+        built = len(self.rects) // (levels * self.MAX_RADIUS)
+        if self.surface is None or self.surface.get_height() < band * len(self.palette):
+            # Grow by doubling, so a stream of new colours reallocates only a few times
+            capacity = max(len(self.palette), 2 * built, 4)
+            surface = pygame.Surface((cell * self.MAX_RADIUS, band * capacity), pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            if self.surface is not None:
+                surface.blit(self.surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.surface = surface
+        
+        for index in range(built, len(self.palette)):
+            # MAX copies the strip's pixels, alpha included, onto the transparent atlas
+            self.surface.blit(self._strip(self.palette[index]), (0, index * band), special_flags=pygame.BLEND_RGBA_MAX)
+            for level in range(1, levels + 1):
+                top = (index * levels + level - 1) * cell
+                for radius in range(1, self.MAX_RADIUS + 1):
+                    left = (radius - 1) * cell
+                    self.rects.append((left + self.MAX_RADIUS - radius, top + self.MAX_RADIUS - radius,
+                                       radius * 2 + 1, radius * 2 + 1))
+    
+    def _strip(self, color: Color) -> pygame.Surface:
+        """One colour's rows, cached on their own so any palette order finds them"""
+        cache = asset_cache()
+        key = cache.key('particles', self.VERSION, color, self.MAX_RADIUS, self.FADE_LEVELS) if cache else None
+        strip = cache.load_surface(key) if cache else None
+        if strip is None:
+            strip = self._render(color)
+            if cache:
+                cache.store_surface(key, strip)
+        return strip
+    
+    def _render(self, color: Color) -> pygame.Surface:
+        cell, levels = self.cell, self.FADE_LEVELS
+        strip = pygame.Surface((cell * self.MAX_RADIUS, cell * levels), pygame.SRCALPHA)
+        for level in range(1, levels + 1):
+            faded = tuple(int(c * level / levels) for c in color)
+            top = (level - 1) * cell
+            for radius in range(1, self.MAX_RADIUS + 1):
+                left = (radius - 1) * cell
+                pygame.draw.circle(strip, faded, (left + self.MAX_RADIUS, top + self.MAX_RADIUS), radius)
+        return strip
+    
+    def sprite_ids(self, color_ids: np.ndarray, levels: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """Flat rect indices for arrays of palette ids, fade levels (1-based) and radii"""
+        if len(self.rects) < len(self.palette) * self.FADE_LEVELS * self.MAX_RADIUS:
+            self._extend()
+        return ((color_ids * self.FADE_LEVELS + levels - 1) * self.MAX_RADIUS + radii - 1).astype(np.intp)
+
+class ParticleEngine:
+    """Struct-of-arrays particle pool shared by all three games
+
+    Live particles are packed at the front of preallocated NumPy arrays, so
+    integration and culling are a handful of vector operations per frame.
+    Games subclass it and keep their own add_* emitters on top of emit_box()
+    and emit_radial().
+    """
+    def __init__(self, capacity: int = 512, fade_color: bool = True):
+        self.fade_color = fade_color
+        self.count = 0
+        self._rng = None
+        self.atlas = ParticleAtlas()
+        self.governor = None  # Optional quality.QualityGovernor
+        self._allocate(capacity)
+    
+    @property
+    def rng(self) -> 'np.random.Generator':
+        # numpy.random is a sizeable import, so it waits for the first emit
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        return self._rng
+    
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.int16)
+    
+    def _reserve(self, extra: int) -> slice:
+        """Slice of `extra` fresh slots at the end of the live block, growing if needed"""
+        needed = self.count + extra
+        if needed > self.capacity:
+            old = (self.pos, self.vel, self.life, self.max_life, self.size, self.gravity, self.color)
+            capacity = self.capacity
+            while capacity < needed:
+                capacity *= 2
+            self._allocate(capacity)
+            for new, array in zip((self.pos, self.vel, self.life, self.max_life, self.size, self.gravity, self.color), old):
+                new[:self.count] = array[:self.count]
+        block = slice(self.count, needed)
+        self.count = needed
+        return block
+    
+    def _admit(self, count: int) -> int:
+        """How many of `count` requested particles the quality tier lets through"""
+        governor = self.governor
+        if governor is None:
+            return count
+        count = governor.scale_count(count, self.rng.random())
+        return max(0, min(count, governor.tier.particle_budget - self.count))
+    
+    def _spread(self, value: Spread, count: int, integer: bool = False) -> np.ndarray:
+        """Scalar, or a (low, high) range sampled uniformly (inclusive for integers)"""
+        if isinstance(value, tuple):
+            low, high = value
+            if integer:
+                return self.rng.integers(low, high + 1, count)
+            return self.rng.uniform(low, high, count)
+        return np.full(count, value)
+    
+    def _fill(self, block: slice, x: float, y: float, colors: Union[Color, Sequence[Color]],
+              life: Spread, size: Spread, gravity: float):
+        count = block.stop - block.start
+        self.pos[block] = (x, y)
+        lives = self._spread(life, count)
+        if self.governor is not None:
+            lives = lives * self.governor.tier.lifetime
+        self.life[block] = lives
+        self.max_life[block] = lives
+        self.size[block] = self._spread(size, count, isinstance(size, tuple) and isinstance(size[0], int))
+        self.gravity[block] = gravity
+        if isinstance(colors[0], int):
+            self.color[block] = self.atlas.color_id(colors)
+        else:
+            ids = np.array([self.atlas.color_id(color) for color in colors], dtype=np.int16)
+            self.color[block] = ids[self.rng.integers(0, len(ids), count)]
+    
+    def emit_box(self, x: float, y: float, count: int, vx: Spread, vy: Spread,
+                 colors: Union[Color, Sequence[Color]], life: Spread, size: Spread, gravity: float = 0.0):
+        """Emit with velocity components drawn independently from the vx/vy ranges"""
+        count = self._admit(count)
+        if count <= 0:
+            return
+        block = self._reserve(count)
+        self.vel[block, 0] = self._spread(vx, count)
+        self.vel[block, 1] = self._spread(vy, count)
+        self._fill(block, x, y, colors, life, size, gravity)
+    
+    def emit_radial(self, x: float, y: float, count: int, speed: Spread,
+                    colors: Union[Color, Sequence[Color]], life: Spread, size: Spread, gravity: float = 0.0):
+        """Emit in random directions with speeds drawn from `speed`"""
+        count = self._admit(count)
+        if count <= 0:
+            return
+        block = self._reserve(count)
+        angle = self.rng.uniform(0, 2 * np.pi, count)
+        speeds = self._spread(speed, count)
+        self.vel[block, 0] = np.cos(angle) * speeds
+        self.vel[block, 1] = np.sin(angle) * speeds
+        self._fill(block, x, y, colors, life, size, gravity)
+    
+    def update(self, dt: float):
+        n = self.count
+        if n == 0:
+            return
+        self.pos[:n] += self.vel[:n] * dt
+        self.vel[:n, 1] += self.gravity[:n] * dt
+        self.life[:n] -= dt
+        
+        # Compact: pack survivors to the front, keeping their order
+        alive = self.life[:n] > 0
+        survivors = int(np.count_nonzero(alive))
+        if survivors < n:
+            for array in (self.pos, self.vel, self.life, self.max_life, self.size, self.gravity, self.color):
+                array[:survivors] = array[:n][alive]
+            self.count = survivors
+    
+    def clear(self):
+        self.count = 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def draw(self, screen: pygame.Surface, offset_x: float = 0, offset_y: float = 0):
+        n = self.count
+        if n == 0:
+            return
+        # Cull against the view in world space before converting anything
+        width, height = screen.get_size()
+        px, py = self.pos[:n, 0], self.pos[:n, 1]
+        visible = (px >= offset_x) & (px < offset_x + width + 1) & (py >= offset_y) & (py < offset_y + height + 1)
+        if not visible.any():
+            return
+        x = (px[visible] - offset_x).astype(np.int32)
+        y = (py[visible] - offset_y).astype(np.int32)
+        
+        # Quantize every visible particle to an atlas entry in one pass
+        fade = self.life[:n][visible] / self.max_life[:n][visible]
+        atlas = self.atlas
+        radii = np.clip((self.size[:n][visible] * fade).astype(np.int32), 1, atlas.MAX_RADIUS)
+        if self.fade_color:
+            levels = np.clip(np.ceil(fade * atlas.FADE_LEVELS).astype(np.int32), 1, atlas.FADE_LEVELS)
+        else:
+            levels = np.full(len(radii), atlas.FADE_LEVELS, dtype=np.int32)
+        sprites = atlas.sprite_ids(self.color[:n][visible], levels, radii)
+        left = (x - radii).tolist()
+        top = (y - radii).tolist()
+        
+        surface, rects = atlas.surface, atlas.rects
+        screen.blits([(surface, (px, py), rects[sprite]) for px, py, sprite in zip(left, top, sprites.tolist())],
+                     doreturn=False)
@@ -0,0 +1,61 @@
+import pygame
+from typing import Hashable, List, Optional, Tuple
+from startup import timeline
+
+def open_window(size: Tuple[int, int], caption: str) -> pygame.Surface:
+    """The display surface at `size`, reusing the open window when the launcher switches games"""
+    pygame.display.init()
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != tuple(size):
+        screen = pygame.display.set_mode(size)
+    pygame.display.set_caption(caption)
+    return screen
+
+class Presenter:
+    """Puts finished frames on the display
+
+    Frames are animated unless the draw code asks for a still screen (pause,
+    game over, instructions): those are drawn once, over the backdrop their
+    scene kept of the frame it covers. After
+    that only the rects marked dirty are pushed with display.update(), so an
+    idle screen costs almost nothing.
+    """
+    def __init__(self, timed: bool = True):
+        self.timed = timed  # Whether its first frame ends the startup timeline
+        self.still_key: Optional[Hashable] = None
+        self.showing_still = False
+        self.full = True
+        self.dirty: List[pygame.Rect] = []
+        self.frames = 0
+    
+    def still(self, key: Hashable) -> bool:
+        """Show a still screen this frame; True when it has to be drawn, once per key"""
+        self.showing_still = True
+        if key == self.still_key:
+            return False
+        self.still_key = key
+        self.full = True
+        return True
+    
+    def mark(self, rect):
+        """Part of a still screen was redrawn and needs presenting"""
+        self.dirty.append(pygame.Rect(rect))
+    
+    def invalidate(self):
+        """Present the whole window next frame, e.g. after it was exposed"""
+        self.full = True
+    
+    def present(self):
+        if not self.showing_still:
+            self.still_key = None
+            pygame.display.flip()
+        elif self.full:
+            pygame.display.flip()
+            self.full = False
+        elif self.dirty:
+            pygame.display.update(self.dirty)
+        self.showing_still = False
+        self.dirty.clear()
+        self.frames += 1
+        if self.frames == 1 and self.timed:
+            timeline.first_frame()
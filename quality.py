@@ -0,0 +1,81 @@
+from collections import deque
+from typing import Optional
+
+from instrumentation import FrameProfiler, session_profiler
+
+class QualityTier:
+    """One rung of the quality ladder"""
+    def __init__(self, name: str, emission: float, lifetime: float, glow: bool,
+                 background_detail: int, particle_budget: int, render_scale: float):
+        self.name = name
+        self.emission = emission                    # Fraction of requested particles actually emitted
+        self.lifetime = lifetime                    # Particle lifetime multiplier
+        self.glow = glow                            # Draw glow layers around sprites and titles
+        self.background_detail = background_detail  # Gradient band index: 2 per-pixel, 1 4-px bands, 0 16-px bands (and fewer stars)
+        self.particle_budget = particle_budget      # Hard cap on live particles
+        self.render_scale = render_scale            # Backdrop resolution relative to the window
+
+TIERS = (
+    QualityTier('high', 1.0, 1.0, True, 2, 3000, 1.0),
+    QualityTier('medium', 0.6, 0.8, True, 1, 1500, 1.0),
+    QualityTier('low', 0.35, 0.6, False, 1, 800, 1.0),
+    QualityTier('minimal', 0.2, 0.4, False, 0, 400, 0.5),
+)
+
+class QualityGovernor:
+    """Steps quality down when frames run over budget and back up once headroom returns
+
+    Feed it the work time of every frame (clock.get_rawtime(), which leaves out
+    the frame limiter's sleep). Tier changes are logged to the profiler.
+    """
+    def __init__(self, target_fps: int = 60, profiler: Optional[FrameProfiler] = None,
+                 window: int = 30, degrade_ratio: float = 1.0, restore_ratio: float = 0.6,
+                 restore_frames: int = 120):
+        self.budget_ms = 1000.0 / target_fps
+        self.profiler = profiler
+        self.window = window
+        self.degrade_ratio = degrade_ratio
+        self.restore_ratio = restore_ratio
+        self.restore_frames = restore_frames
+        self.level = 0
+        self.samples = deque(maxlen=window)
+        self.total = 0.0
+        self.calm_frames = 0
+    
+    @property
+    def tier(self) -> QualityTier:
+        return TIERS[self.level]
+    
+    def frame(self, work_ms: float) -> bool:
+        """Record one frame; returns True when the tier changed"""
+        if len(self.samples) == self.window:
+            self.total -= self.samples[0]
+        self.samples.append(work_ms)
+        self.total += work_ms
+        if len(self.samples) < self.window:
+            return False
+        
+        average = self.total / self.window
+        if average > self.budget_ms * self.degrade_ratio and self.level < len(TIERS) - 1:
+            return self._set_level(self.level + 1, average)
+        
+        # Restoring needs sustained headroom, or the tiers would flicker
+        self.calm_frames = self.calm_frames + 1 if average < self.budget_ms * self.restore_ratio else 0
+        if self.calm_frames >= self.restore_frames and self.level > 0:
+            return self._set_level(self.level - 1, average)
+        return False
+    
+    def _set_level(self, level: int, average_ms: float) -> bool:
+        previous = self.tier.name
+        self.level = level
+        self.samples.clear()
+        self.total = 0.0
+        self.calm_frames = 0
+        profiler = self.profiler or session_profiler()
+        profiler.event('quality_tier', tier=self.tier.name, previous=previous,
+                       frame_ms=round(average_ms, 2), budget_ms=round(self.budget_ms, 2))
+        return True
+    
+    def scale_count(self, count: int, roll: float) -> int:
+        """Emission count for this tier; `roll` in [0, 1) rounds fractions fairly"""
+        return int(count * self.tier.emission + roll)
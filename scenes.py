@@ -0,0 +1,102 @@
+import pygame
+from typing import Dict, Iterable, List, Optional, Type
+
+class Scene:
+    """One screen of a game; only the scene on top of the stack gets input, ticks and draws
+
+    An overlay scene is pushed over the scene below it instead of replacing
+    it. The covered scene is neither ticked nor drawn; its last frame is kept
+    in `backdrop`, and the overlay repaints that under its own widgets
+    whenever it redraws.
+    """
+    name = ''
+    overlay = False
+    
+    def __init__(self, game):
+        self.game = game
+        self.backdrop: Optional[pygame.Surface] = None
+    
+    def draw_backdrop(self, screen: pygame.Surface):
+        """Repaint the covered scene's last frame, before an overlay redraws its widgets"""
+        if self.backdrop is not None:
+            screen.blit(self.backdrop, (0, 0))
+    
+    def preload(self):
+        """Start slow setup early; called while an earlier scene is still showing
+
+        Called on the main thread, so it should only hand work to a worker
+        and return; the scene waits on that work itself once it needs it.
+        """
+    
+    def enter(self):
+        """The scene reached the top of the stack"""
+    
+    def handle_event(self, event) -> bool:
+        """Returns False when the game should quit"""
+        return True
+    
+    def update(self, dt: float):
+        pass
+    
+    def draw(self, screen: pygame.Surface):
+        pass
+
+class SceneStack:
+    """Scenes by name, stacked so overlays can return to the scene they cover"""
+    def __init__(self, game, screen: pygame.Surface, scene_types: Iterable[Type[Scene]]):
+        self.game = game
+        self.screen = screen
+        self.scene_types = {scene_type.name: scene_type for scene_type in scene_types}
+        self.scenes: List[Scene] = []
+        self.preloaded: Dict[str, Scene] = {}
+    
+    @property
+    def top(self) -> Optional[Scene]:
+        return self.scenes[-1] if self.scenes else None
+    
+    @property
+    def name(self) -> Optional[str]:
+        return self.scenes[-1].name if self.scenes else None
+    
+    def preload(self, name: str):
+        """Build the named scene ahead of time and let it start loading
+
+        This only starts the work: show() does not wait for it, so the scene
+        must wait on or poll its own loading before it uses the result.
+        """
+        if name not in self.preloaded:
+            scene = self.preloaded[name] = self.scene_types[name](self.game)
+            scene.preload()
+    
+    def show(self, name: str):
+        """Make the named scene the top one
+
+        A scene already on the stack is returned to, dropping the overlays
+        above it. An overlay is pushed over the current scene, with the
+        screen's last frame as its backdrop; any other scene replaces the
+        whole stack.
+        """
+        if self.name == name:
+            return
+        for index, scene in enumerate(self.scenes):
+            if scene.name == name:
+                del self.scenes[index + 1:]
+                scene.enter()
+                return
+        
+        scene = self.preloaded.pop(name, None) or self.scene_types[name](self.game)
+        if scene.overlay and self.scenes:
+            scene.backdrop = self.screen.copy()
+        else:
+            self.scenes.clear()
+        self.scenes.append(scene)
+        scene.enter()
+    
+    def handle_event(self, event) -> bool:
+        return self.top.handle_event(event)
+    
+    def update(self, dt: float):
+        self.top.update(dt)
+    
+    def draw(self):
+        self.top.draw(self.screen)
@@ -0,0 +1,99 @@
+"""Unattended Quantum Serpent soak run.
+
+Steps game3.py headless with a fixed timestep, lets the autopilot drive, and
+records frame time and memory against snake length:
+
+    python serpent_soak.py --length 1000 --csv soak.csv
+
+The autopilot's body follows the head's path cell for cell, so unshielded
+runs keep growing along the Hamiltonian cycle. --shield keeps the shield up so
+the snake passes through itself; use it to push past what the board holds as a
+stress test of the long-body code paths, not a length real play can reach.
+"""
+import sys
+import time
+import argparse
+from startup import use_headless_drivers
+
+use_headless_drivers()
+
+import game3
+from instrumentation import FrameProfiler, current_rss_mb
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Autopilot soak test for Quantum Serpent")
+    parser.add_argument('--length', type=int, default=1000, help="stop once the snake reaches this many segments")
+    parser.add_argument('--frames', type=int, default=500000, help="hard cap on simulated frames")
+    parser.add_argument('--dt', type=float, default=1 / game3.FPS, help="fixed simulation timestep in seconds")
+    parser.add_argument('--bucket', type=int, default=50, help="snake-length bucket size for the curves")
+    parser.add_argument('--no-render', action='store_true', help="time update() only, skip draw()")
+    parser.add_argument('--ramp-speed', action='store_true', help="let level-ups raise the speed (it soon outruns one cell per frame)")
+    parser.add_argument('--shield', action='store_true', help="keep the shield up so the run can outgrow what the board holds")
+    parser.add_argument('--arena', type=int, default=0, help="run in arena mode with this many rivals")
+    parser.add_argument('--csv', help="write the length curve to this CSV file")
+    parser.add_argument('--seed', type=int, help="random seed for a reproducible run")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+    if args.seed is not None:
+        game3.random.seed(args.seed)
+    
+    game = game3.Game()
+    game.agent = game3.AutopilotAgent()
+    game.arena_mode = args.arena > 0
+    game.arena_rivals = args.arena
+    game.target_score = float('inf')
+    game.state = "playing"
+    game.reset_game()
+    
+    profiler = FrameProfiler(args.bucket)
+    base_speed = game.snake.base_speed
+    best_length = 0
+    last_report = time.perf_counter()
+    
+    for frame in range(args.frames):
+        start = time.perf_counter()
+        game.update(args.dt)
+        updated = time.perf_counter()
+        if not args.no_render:
+            game.draw()
+        finished = time.perf_counter()
+        
+        length = len(game.snake.segments)
+        profiler.record(length, (finished - start) * 1000,
+                        update_ms=(updated - start) * 1000, draw_ms=(finished - updated) * 1000,
+                        orbs=len(game.orbs), draw_calls=game.draw_list.stats.calls)
+        if frame % 300 == 0:
+            profiler.sample_memory(length)
+        best_length = max(best_length, length)
+        
+        if not args.ramp_speed:
+            game.snake.base_speed = base_speed
+        if args.shield:
+            game.snake.shield_time = max(game.snake.shield_time, 1.0)
+        
+        if game.state != "playing":
+            profiler.event('death', frame=frame, length=length, score=game.score)
+            game.state = "playing"
+            game.reset_game()
+            base_speed = game.snake.base_speed
+        
+        if length >= args.length:
+            profiler.event('target_reached', frame=frame, length=length)
+            break
+        
+        now = time.perf_counter()
+        if now - last_report > 5:
+            last_report = now
+            print(f"frame {frame:>7}  length {length:>5}  best {best_length:>5}  rss {current_rss_mb():.0f} MB", flush=True)
+    
+    print(profiler.format_table('length'))
+    for event in profiler.events:
+        print(event)
+    if args.csv:
+        profiler.write_csv(args.csv, 'length')
+        print(f"wrote {args.csv}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import pygame
+from typing import Callable, Optional, Tuple
+from assets import CACHE_DIR, asset_cache
+
+class SpriteSheet:
+    """Animation frames baked side by side onto one surface
+
+    Every frame shares an origin: the pixel that lands on the entity's
+    position, so frames may reach up and left of it (shadows, swinging arms).
+    """
+    def __init__(self, surface: pygame.Surface, frame_size: Tuple[int, int], origin: Tuple[int, int]):
+        self.surface = surface
+        self.frame_size = frame_size
+        self.origin = origin
+        width, height = frame_size
+        self.rects = [pygame.Rect(left, 0, width, height) for left in range(0, surface.get_width(), width)]
+    
+    def __len__(self) -> int:
+        return len(self.rects)
+    
+    def blit(self, screen: pygame.Surface, index: int, x: int, y: int, width: Optional[int] = None):
+        """Draw a frame, or only its leftmost `width` pixels"""
+        area = self.rects[index]
+        if width is not None:
+            area = (area.x, 0, width, area.height)
+        screen.blit(self.surface, (x - self.origin[0], y - self.origin[1]), area)
+
+def _finish(surface: pygame.Surface) -> pygame.Surface:
+    # convert_alpha needs a display mode; headless tools get the plain surface
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+def bake(name: str, count: int, frame_size: Tuple[int, int], origin: Tuple[int, int],
+         render: Callable[[pygame.Surface, int, int, int], None], version: int = 1,
+         cache_dir: Optional[str] = CACHE_DIR) -> SpriteSheet:
+    """Render `count` frames with render(surface, index, x, y), or map them in from the asset cache
+
+    `x, y` is where the entity's position falls inside the frame. Bump
+    `version` whenever the drawing code changes so stale sheets are rebuilt.
+    """
+    width, height = frame_size
+    cache = asset_cache(cache_dir)
+    key = cache.key('sprite', name, version, count, frame_size, origin) if cache else None
+    surface = cache.load_surface(key) if cache else None
+    if surface is not None and surface.get_size() == (width * count, height):
+        return SpriteSheet(_finish(surface), frame_size, origin)
+    
+    surface = pygame.Surface((width * count, height), pygame.SRCALPHA)
+    for index in range(count):
+        frame = surface.subsurface((index * width, 0, width, height))
+        render(frame, index, origin[0], origin[1])
+    if cache:
+        cache.store_surface(key, surface)
+    return SpriteSheet(_finish(surface), frame_size, origin)
@@ -0,0 +1,111 @@
+import os
+import sys
+import time
+import importlib
+import threading
+from typing import List, Optional, Tuple
+
+REPORT_ENV = 'GAMESTUDIO_STARTUP'  # Set to print the startup timeline once the first frame is up
+
+def process_age() -> float:
+    """Seconds since this process started, or 0 where the platform can't tell"""
+    try:
+        with open('/proc/self/stat') as stat:
+            # Field 22, counted after the parenthesised command name, which may hold spaces
+            started = int(stat.read().rsplit(')', 1)[1].split()[19]) / os.sysconf('SC_CLK_TCK')
+        with open('/proc/uptime') as uptime:
+            return max(0.0, float(uptime.read().split()[0]) - started)
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+class StartupTimeline:
+    """Named milestones of a cold start, timed from process launch
+
+    Games mark import, display, font, audio and first frame as they reach
+    them; whatever a game never marks is simply left out of the report.
+    The launcher restarts the timeline at every switch, so each hosted game
+    gets its own timeline measured from the moment the switch began.
+    """
+    def __init__(self):
+        self.origin = time.perf_counter() - process_age()
+        self.marks: List[Tuple[str, float]] = []
+        self.finished = False
+    
+    def restart(self):
+        """Start a fresh timeline from now, for a game started inside a running process"""
+        self.origin = time.perf_counter()
+        self.marks.clear()
+        self.finished = False
+    
+    def mark(self, name: str):
+        self.marks.append((name, time.perf_counter() - self.origin))
+    
+    def first_frame(self):
+        """Mark the first frame and report, once per timeline"""
+        if not self.finished:
+            self.finished = True
+            self.mark('first frame')
+            self.report()
+    
+    def elapsed(self, name: str) -> Optional[float]:
+        """Seconds from launch to the first mark with this name"""
+        return next((when for mark, when in self.marks if mark == name), None)
+    
+    def format(self) -> str:
+        lines = [f"{'milestone':<12} {'at ms':>8} {'step ms':>8}"]
+        previous = 0.0
+        for name, when in self.marks:
+            lines.append(f"{name:<12} {when * 1000:>8.1f} {(when - previous) * 1000:>8.1f}")
+            previous = when
+        return "\n".join(lines)
+    
+    def report(self):
+        if os.environ.get(REPORT_ENV):
+            print(self.format(), file=sys.stderr, flush=True)
+
+# One timeline per process, started as early as the first game module import
+timeline = StartupTimeline()
+
+def use_headless_drivers():
+    """Dummy video and audio for unattended runs; call before pygame opens anything
+
+    Drivers already chosen in the environment are kept, so setting
+    SDL_VIDEODRIVER yourself still lets you watch a run.
+    """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+def preload(*module_names: str) -> Optional[threading.Thread]:
+    """Import modules on a background thread, so the first real use finds them loaded
+
+    Python's import lock makes this safe: code that needs a module before the
+    thread is done just waits for that import to finish.
+    """
+    module_names = [name for name in module_names if name not in sys.modules]
+    if not module_names:
+        return None
+    
+    def load():
+        for name in module_names:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass  # The caller's own import raises it, where it can be handled
+    
+    thread = threading.Thread(target=load, name='preload', daemon=True)
+    thread.start()
+    return thread
+
+def open_game_window(size: Tuple[int, int], caption: str):
+    """A game's window, with the import and display milestones marked around it
+
+    Games bring up only the subsystems they use; numpy.random, which their
+    particle engines need on the first emit, loads while the window comes up.
+    """
+    # Imported here: presenter pulls in pygame, which this module otherwise leaves alone
+    from presenter import open_window
+    timeline.mark('import')
+    preload('numpy.random')
+    screen = open_window(size, caption)
+    timeline.mark('display')
+    return screen
@@ -0,0 +1,11 @@
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from startup import use_headless_drivers
+
+# Headless, and a private asset cache so test runs never touch the user's
+use_headless_drivers()
+os.environ.setdefault('GAMESTUDIO_CACHE', tempfile.mkdtemp(prefix='gamestudio-test-'))
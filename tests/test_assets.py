@@ -0,0 +1,15 @@
+import pygame
+
+from assets import AssetCache
+
+def test_finished_cache_writers_are_dropped(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    surface = pygame.Surface((4, 4), pygame.SRCALPHA)
+    for index in range(20):
+        cache.store_surface(cache.key('test', index), surface)
+        cache.writers[-1].join()
+    assert len(cache.writers) <= 1
+    
+    cache.wait()
+    assert cache.writers == []
+    assert len(AssetCache(str(tmp_path)).entries) == 20
@@ -0,0 +1,27 @@
+import pygame
+import pytest
+
+import game
+from glyphs import GlyphAtlas, cached_font, init_fonts
+
+@pytest.fixture
+def escape_rush():
+    rush = game.Game()
+    rush.start_game()
+    yield rush
+    rush.close()
+
+def test_hud_draws_with_player_left_of_start(escape_rush):
+    escape_rush.player.x = -500
+    escape_rush.draw_playing()
+    
+    escape_rush.hud.draw(escape_rush.screen, 0, 0, 3, 60, -1.5)
+    assert escape_rush.hud.progress.value == (0, 0)
+
+def test_glyph_atlas_renders_unbaked_characters():
+    init_fonts()
+    atlas = GlyphAtlas(24, (255, 255, 255), "0123456789", ("Progress: ",), cache_dir=None)
+    surface = pygame.Surface((200, 40))
+    
+    atlas.draw(surface, "Progress: -5%", (0, 0))
+    assert atlas.size("Progress: -5%") == cached_font(24).size("Progress: -5%")
@@ -0,0 +1,88 @@
+import random
+from collections import deque
+
+import pytest
+
+import game3
+from game3 import GRID_COLS, GRID_ROWS, GRID_SIZE, AutopilotAgent, FlowField, QuantumOrb, neighbor_table
+
+def bfs_distances(cols, rows, sources):
+    """Reference distance map, flooded from scratch"""
+    dist = [FlowField.UNREACHED] * (cols * rows)
+    queue = deque(sources)
+    for cell in sources:
+        dist[cell] = 0
+    neighbors = neighbor_table(cols, rows)
+    while queue:
+        cell = queue.popleft()
+        for n in neighbors[cell]:
+            if dist[n] > dist[cell] + 1:
+                dist[n] = dist[cell] + 1
+                queue.append(n)
+    return dist
+
+def test_flow_field_matches_a_fresh_flood_as_orbs_come_and_go():
+    rng = random.Random(7)
+    cols, rows = 12, 9
+    field = FlowField(cols, rows)
+    live = []
+    for _ in range(300):
+        if live and rng.random() < 0.45:
+            field.remove_source(live.pop(rng.randrange(len(live))))
+        else:
+            cell = rng.randrange(cols * rows)
+            field.add_source(cell)
+            live.append(cell)
+        assert field.dist == bfs_distances(cols, rows, set(live))
+
+def test_flow_field_keeps_a_cell_while_another_orb_sits_on_it():
+    field = FlowField(5, 5)
+    field.add_source(12)
+    field.add_source(12)
+    field.remove_source(12)
+    assert field.dist[12] == 0
+    field.remove_source(12)
+    assert field.dist[12] == FlowField.UNREACHED
+
+def test_autopilot_cycle_visits_every_cell_once_between_neighbours():
+    order = AutopilotAgent._build_cycle(GRID_COLS, GRID_ROWS)
+    path = sorted(range(len(order)), key=order.__getitem__)
+    assert sorted(order) == list(range(GRID_COLS * GRID_ROWS))
+    for cell, following in zip(path, path[1:] + path[:1]):
+        dcol = abs(cell % GRID_COLS - following % GRID_COLS)
+        drow = abs(cell // GRID_COLS - following // GRID_COLS)
+        assert dcol + drow == 1
+
+@pytest.fixture
+def serpent():
+    game3.random.seed(3)
+    game = game3.Game()
+    game.agent = AutopilotAgent()
+    game.target_score = float('inf')
+    game.state = "playing"
+    game.reset_game()
+    yield game
+
+def test_shielded_autopilot_turns_toward_an_orb(serpent):
+    snake = serpent.snake
+    head = snake.segments[0]
+    snake.shield_time = 5
+    serpent.orbs = [QuantumOrb(head.x, head.y - 5 * GRID_SIZE)]
+    cell = int(head.y // GRID_SIZE) * GRID_COLS + int(head.x // GRID_SIZE)
+    assert serpent.agent.plan(serpent, snake, cell) == (0, -1)
+
+def test_autopilot_grows_without_dying_and_keeps_its_body_on_lanes(serpent):
+    base_speed = serpent.snake.base_speed
+    for _ in range(8000):
+        serpent.update(1 / game3.FPS)
+        serpent.snake.base_speed = base_speed
+        assert serpent.state == "playing"
+
+    segments = serpent.snake.segments
+    assert len(segments) >= 40
+    centre = GRID_SIZE / 2
+    for segment in segments:
+        # Laid along the head's path, every segment sits on a row or column centre line
+        on_row = abs(segment.y % GRID_SIZE - centre) < 1e-6
+        on_column = abs(segment.x % GRID_SIZE - centre) < 1e-6
+        assert on_row or on_column